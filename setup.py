@@ -5,4 +5,6 @@ setup(
     version="0.1",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"cribbage": ["data/*.bin"]},
+    install_requires=["numpy"],
 ) 
\ No newline at end of file
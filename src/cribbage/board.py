@@ -1,6 +1,9 @@
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 from .cards import Card
 
+# Points for 2, 3 and 4 cards of the same rank played in a row
+PAIR_POINTS = [0, 0, 2, 6, 12]
+
 class Board:
     WINNING_SCORE = 121
     
@@ -10,28 +13,90 @@ class Board:
         self.starter_card: Optional[Card] = None
         self.crib: List[Card] = []
         self.players_said_go: Set[int] = set()  # Track which players have said "go"
+        # Running pegging state for the current sequence of play
+        self.streak_rank = 0  # Rank of the last card played
+        self.streak_length = 0  # Number of cards of that rank played in a row
+        self.rank_mask = 0  # Bit r is set if a card of rank r has been played
+        self.last_player_index: Optional[int] = None  # Who played the last card
+        self.last_play_points: Dict[str, int] = {}  # Pegging points for the last card
         
-    def add_to_play_area(self, card: Card) -> int:
+    def add_to_play_area(self, card: Card, player_index: Optional[int] = None) -> int:
         """
         Add a card to the play area and return the new count.
         Returns -1 if adding the card would exceed 31.
+        The pegging points the card scores are left in last_play_points.
         """
         if self.play_count + card.value > 31:
             return -1
             
         self.play_area.append(card)
         self.play_count += card.value
+        if card.rank == self.streak_rank:
+            self.streak_length += 1
+        else:
+            self.streak_rank = card.rank
+            self.streak_length = 1
+        self.rank_mask |= 1 << card.rank
+        self.last_player_index = player_index
+        self.last_play_points = self._score_last_play()
         return self.play_count
+
+    def _score_last_play(self) -> Dict[str, int]:
+        """Score the card just played against the current sequence."""
+        points = {}
+        if self.play_count == 15:
+            points["fifteen"] = 2
+        elif self.play_count == 31:
+            points["thirty-one"] = 2
+        if self.streak_length >= 2:
+            points["pair"] = PAIR_POINTS[self.streak_length]
+        else:
+            run = self._run_length()
+            if run:
+                points["run"] = run
+        return points
+
+    def _run_length(self) -> int:
+        """Length of the longest run formed by the most recent cards, or 0."""
+        mask = self.rank_mask
+        # No run is possible without three consecutive ranks in the sequence
+        if not mask & mask >> 1 & mask >> 2:
+            return 0
+        seen = 0
+        run = 0
+        for length, card in enumerate(reversed(self.play_area), 1):
+            bit = 1 << card.rank
+            if seen & bit:
+                break
+            seen |= bit
+            # The cards form a run if their ranks are a contiguous block
+            if length >= 3 and seen // (seen & -seen) == (1 << length) - 1:
+                run = length
+        return run
         
+    def snapshot(self) -> tuple:
+        """Return the board's state as an immutable tuple (see restore)."""
+        return (tuple(self.play_area), self.play_count, self.starter_card, tuple(self.crib),
+                frozenset(self.players_said_go), self.streak_rank, self.streak_length,
+                self.rank_mask, self.last_player_index, tuple(self.last_play_points.items()))
+
+    def restore(self, state: tuple) -> None:
+        """Restore the state captured by snapshot."""
+        (play_area, self.play_count, self.starter_card, crib, players_said_go,
+         self.streak_rank, self.streak_length, self.rank_mask, self.last_player_index,
+         last_play_points) = state
+        self.play_area = list(play_area)
+        self.crib = list(crib)
+        self.players_said_go = set(players_said_go)
+        self.last_play_points = dict(last_play_points)
+
     def player_says_go(self, player_index: int) -> None:
         """Record that a player has said "go"."""
         self.players_said_go.add(player_index)
         
     def reset_play_area(self) -> None:
         """Reset the play area and count for a new round of play."""
-        self.play_area = []
-        self.play_count = 0
-        self.players_said_go = set()
+        self.clear_play_area()
         
     def is_play_round_over(self, num_players: int) -> bool:
         """Check if the current round of play is over (all players have said "go")."""
@@ -58,6 +123,10 @@ class Board:
         self.play_area = []
         self.play_count = 0
         self.players_said_go = set()
+        self.streak_rank = 0
+        self.streak_length = 0
+        self.rank_mask = 0
+        self.last_player_index = None
         
     def clear_crib(self) -> None:
         """Clear the crib."""
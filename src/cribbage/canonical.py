@@ -0,0 +1,160 @@
+"""
+Canonical forms of holdings under relabelling of the suits.
+
+Scores depend on suits only through which cards share a suit, so the 24
+ways of relabelling the suits of a holding all score the same. A holding is
+described by one 13-bit rank mask per suit; its canonical form lists those
+masks in descending order, which is the same for every relabelling. With a
+starter card, the starter's suit matters in its own right (flushes and
+nobs), so its mask comes first and only the other three are sorted.
+
+canonical_key packs the form into an int, and canonical_groups_key does
+the same for a holding split into groups (the cache key of
+discard.enable_cache). canonical_hands enumerates each class of holdings
+once with the number of holdings in it, which cuts full enumerations by
+close to 24 times.
+"""
+from bisect import bisect_right
+from itertools import combinations
+from math import factorial
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from .cards import ALL_CARDS, Card
+
+
+# Holding sizes with canonical forms: kept hands, and 3- and 2-player deals
+SIZES = (4, 5, 6)
+
+
+def _suit_masks(cards: Sequence[Card]) -> List[int]:
+    """Rank mask (bit rank - 1) of the cards in each suit, by suit index."""
+    masks = [0, 0, 0, 0]
+    for card in cards:
+        masks[card.code // 13] |= 1 << (card.rank - 1)
+    return masks
+
+
+def canonical_masks(cards: Sequence[Card], starter: Optional[Card] = None) -> Tuple[int, int, int, int]:
+    """The canonical suit masks of a holding.
+
+    Without a starter these are the four masks in descending order. With
+    one, the first is the mask of the starter's suit (not counting the
+    starter) and the other three follow in descending order.
+    """
+    masks = _suit_masks(cards)
+    if starter is None:
+        masks.sort(reverse=True)
+        return tuple(masks)
+    first = masks.pop(starter.code // 13)
+    masks.sort(reverse=True)
+    return (first, *masks)
+
+
+def canonical_key(cards: Sequence[Card], starter: Optional[Card] = None) -> int:
+    """An int equal for two holdings exactly when a relabelling of the suits maps one to the other.
+
+    The canonical masks take 13 bits each, and the starter's rank (0
+    without a starter) the bits above them.
+    """
+    m0, m1, m2, m3 = canonical_masks(cards, starter)
+    key = ((m0 << 13 | m1) << 13 | m2) << 13 | m3
+    if starter is not None:
+        key |= starter.rank << 52
+    return key
+
+
+# Ranks (0-12) in each rank mask
+_MASK_RANKS = [tuple(rank for rank in range(13) if mask >> rank & 1) for mask in range(1 << 13)]
+
+
+def canonical_groups_key(groups: Sequence[Sequence[Card]]) -> int:
+    """Like canonical_key, for several disjoint groups of cards told apart (e.g. kept and discarded).
+
+    Each suit is described by its rank mask in every group, and the suits
+    are sorted by those descriptions.
+    """
+    suits = [0, 0, 0, 0]
+    for group in groups:
+        masks = _suit_masks(group)
+        for suit in range(4):
+            suits[suit] = suits[suit] << 13 | masks[suit]
+    suits.sort(reverse=True)
+    width = 13 * len(groups)
+    return ((suits[0] << width | suits[1]) << width | suits[2]) << width | suits[3]
+
+
+def _cards_from_masks(masks: Sequence[int]) -> List[Card]:
+    """Cards with the rank masks given per suit index, in code order."""
+    return [ALL_CARDS[suit * 13 + rank] for suit, mask in enumerate(masks) for rank in _MASK_RANKS[mask]]
+
+
+def canonical_cards(cards: Sequence[Card], starter: Optional[Card] = None) -> Tuple[List[Card], Optional[Card]]:
+    """The representative of a holding's class: the same holding relabelled to canonical suits.
+
+    With a starter, the starter's suit becomes the first suit.
+    """
+    masks = canonical_masks(cards, starter)
+    canonical_starter = None if starter is None else Card.from_code(starter.rank - 1)
+    return _cards_from_masks(masks), canonical_starter
+
+
+def _stabilizer_size(masks: Sequence[int]) -> int:
+    """Number of relabellings of the given suits that leave the masks unchanged."""
+    counts: Dict[int, int] = {}
+    for mask in masks:
+        counts[mask] = counts.get(mask, 0) + 1
+    size = 1
+    for count in counts.values():
+        size *= factorial(count)
+    return size
+
+
+def _masks_by_size(max_size: int) -> List[List[int]]:
+    """Every rank mask, grouped by number of cards, each group in ascending order."""
+    return [sorted(sum(1 << rank for rank in ranks) for ranks in combinations(range(13), size))
+            for size in range(max_size + 1)]
+
+
+def _sorted_masks(count: int, size: int, groups: List[List[int]], upper: int) -> Iterator[Tuple[int, ...]]:
+    """Descending tuples of `count` masks, none above `upper`, holding `size` cards in all."""
+    if count == 1:
+        group = groups[size]
+        for mask in group[:bisect_right(group, upper)]:
+            yield (mask,)
+        return
+    for first_size in range(size + 1):
+        group = groups[first_size]
+        for mask in group[:bisect_right(group, upper)]:
+            for rest in _sorted_masks(count - 1, size - first_size, groups, mask):
+                yield (mask, *rest)
+
+
+def canonical_hands(size: int, with_starter: bool = False,
+                    starter_ranks: Sequence[int] = range(1, 14)) -> Iterator[Tuple[List[Card], Optional[Card], int]]:
+    """Yield (cards, starter, weight) once for each class of holdings of `size` cards.
+
+    `cards` (and `starter`, None unless `with_starter`) are the class's
+    canonical representative and `weight` is the number of holdings in the
+    class. The weights sum to C(52, size), times the 52 - size possible
+    starters with a starter. `starter_ranks` limits the starters to those
+    ranks, to split the work.
+    """
+    if size not in SIZES:
+        raise ValueError(f"Holdings must have {', '.join(map(str, SIZES))} cards")
+    groups = _masks_by_size(size)
+    largest = (1 << 13) - 1
+    if not with_starter:
+        for masks in _sorted_masks(4, size, groups, largest):
+            yield _cards_from_masks(masks), None, 24 // _stabilizer_size(masks)
+        return
+
+    for rank in starter_ranks:
+        starter = Card.from_code(rank - 1)
+        starter_bit = 1 << (rank - 1)
+        for first_size in range(size + 1):
+            for first in groups[first_size]:
+                if first & starter_bit:
+                    continue
+                for rest in _sorted_masks(3, size - first_size, groups, largest):
+                    # The starter's suit is fixed, so only the other three can be swapped
+                    yield _cards_from_masks((first, *rest)), starter, 24 // _stabilizer_size(rest)
+
@@ -0,0 +1,157 @@
+"""
+Bayesian tracking of the opponent's hand in a 2-player game.
+
+CardTracker keeps a weight for every four cards the opponent could have
+kept: C(46, 4) = 163,185 holdings once the player has seen their own six
+cards. Evidence multiplies the weights: a card seen elsewhere rules out the
+holdings that contain it, a card the opponent plays rules out those that
+don't, and a go rules out those with a card that would have fitted. A
+discard model can weight holdings by how likely the opponent was to keep
+them.
+
+The probability of each card being in the opponent's hand is kept up to
+date incrementally, by subtracting the contribution of the holdings each
+piece of evidence rules out, so queries cost O(1) and samples for search
+don't need to be redrawn from scratch every move.
+"""
+from functools import lru_cache
+from itertools import combinations
+from typing import Callable, Iterable, Optional
+import numpy as np
+from .cards import Card
+from .moves import GO, PLAY
+from .scorer import _RANK_TABLE
+
+_VALUES = np.minimum(np.arange(52) % 13 + 1, 10)
+
+
+@lru_cache(maxsize=4)
+def _combinations(n: int) -> np.ndarray:
+    """Every 4-element subset of range(n), as an (C(n, 4), 4) array."""
+    return np.array(list(combinations(range(n), 4)), dtype=np.int8)
+
+
+class CardTracker:
+    """Weights over the opponent's possible 4-card holdings.
+
+    `known` are the cards the opponent can't hold: the player's own dealt
+    cards, and the starter once it is cut.
+    """
+
+    def __init__(self, known: Iterable[Card]):
+        known_codes = {card.code for card in known}
+        unseen = np.array([code for code in range(52) if code not in known_codes], dtype=np.int8)
+        self.holdings = unseen[_combinations(len(unseen))]  # (H, 4) card codes
+        self.weights = np.ones(len(self.holdings))
+        self.played = np.zeros(52, dtype=bool)  # Cards the opponent has played
+        self._recompute()
+
+    def _recompute(self) -> None:
+        """Recompute the total weight and per-card weights from scratch."""
+        self.total = self.weights.sum()
+        self._card_weights = np.bincount(self.holdings.ravel().astype(np.int64),
+                                         weights=np.repeat(self.weights, 4), minlength=52)
+        self._cumulative: Optional[np.ndarray] = None
+
+    def _exclude(self, rows: np.ndarray) -> None:
+        """Rule out the holdings selected by the boolean mask `rows`."""
+        removed = self.weights[rows]
+        if removed.sum() >= self.total:
+            raise ValueError("Evidence rules out every holding")
+        self._card_weights -= np.bincount(self.holdings[rows].ravel().astype(np.int64),
+                                          weights=np.repeat(removed, 4), minlength=52)
+        self.total -= removed.sum()
+        self.weights[rows] = 0.0
+        self._cumulative = None
+
+    def reveal(self, card: Card) -> None:
+        """A card has been seen outside the opponent's hand (e.g. the starter)."""
+        self._exclude((self.holdings == card.code).any(axis=1))
+
+    def opponent_played(self, card: Card) -> None:
+        """The opponent has played a card, so it was in their hand."""
+        self._exclude(~(self.holdings == card.code).any(axis=1))
+        self.played[card.code] = True
+
+    def opponent_said_go(self, count: int) -> None:
+        """The opponent said go at `count`, so none of their unplayed cards fitted."""
+        fits = (_VALUES[self.holdings] <= 31 - count) & ~self.played[self.holdings]
+        self._exclude(fits.any(axis=1))
+
+    def apply_likelihood(self, likelihood: np.ndarray) -> None:
+        """Multiply each holding's weight by the likelihood of the evidence given it."""
+        weights = self.weights * likelihood
+        if not weights.sum() > 0:
+            raise ValueError("Evidence rules out every holding")
+        self.weights = weights
+        self._recompute()
+
+    def apply_discard_model(self, model: Callable[[np.ndarray], np.ndarray]) -> None:
+        """Weight holdings by a model of the opponent's discards.
+
+        `model` maps the (H, 4) array of holdings to the relative likelihood
+        that the opponent kept each one.
+        """
+        self.apply_likelihood(model(self.holdings))
+
+    def probability(self, card: Card) -> float:
+        """Probability that the opponent still holds `card`."""
+        if self.played[card.code]:
+            return 0.0
+        return max(self._card_weights[card.code] / self.total, 0.0)
+
+    def marginals(self) -> np.ndarray:
+        """Probability that the opponent still holds each card, by code."""
+        return np.where(self.played, 0.0, np.maximum(self._card_weights / self.total, 0.0))
+
+    def sample(self, rng: np.random.Generator, size: Optional[int] = None) -> np.ndarray:
+        """Draw holdings in proportion to their weights, as card codes.
+
+        Returns one holding (4,) or `size` of them (size, 4).
+        """
+        if self._cumulative is None:
+            self._cumulative = np.cumsum(self.weights)
+        points = rng.random(size) * self._cumulative[-1]
+        return self.holdings[np.searchsorted(self._cumulative, points, side="right")]
+
+    @classmethod
+    def from_request(cls, request) -> "CardTracker":
+        """Track the opponent's hand from what a 2-player play request shows."""
+        player = request.player_index
+        own_played = [Card.from_code(mask.bit_length() - 1)
+                      for kind, index, mask in request.history if kind == PLAY and index == player]
+        tracker = cls(list(request.hand) + own_played + list(request.discarded) + [request.starter])
+        count = 0
+        said_go = set()
+        for kind, index, mask in request.history:
+            if kind == PLAY:
+                card = Card.from_code(mask.bit_length() - 1)
+                if index != player:
+                    tracker.opponent_played(card)
+                count += card.value
+                if count == 31:
+                    count = 0
+                    said_go = set()
+            elif kind == GO:
+                if index != player:
+                    tracker.opponent_said_go(count)
+                said_go.add(index)
+                if len(said_go) == 2:
+                    count = 0
+                    said_go = set()
+        return tracker
+
+
+def kept_points_model(beta: float = 0.5) -> Callable[[np.ndarray], np.ndarray]:
+    """Discard model favouring holdings that score well on their own.
+
+    The likelihood of keeping four cards is exp(beta * points), counting
+    their fifteens, pairs and runs without a starter.
+    """
+    def model(holdings: np.ndarray) -> np.ndarray:
+        ranks = np.sort(holdings.astype(np.int64) % 13 + 1, axis=1)
+        keys = ((ranks[:, 0] << 4 | ranks[:, 1]) << 4 | ranks[:, 2]) << 4 | ranks[:, 3]
+        unique, inverse = np.unique(keys, return_inverse=True)
+        points = np.array([_RANK_TABLE[int(key)] for key in unique])[inverse]
+        return np.exp(beta * points)
+    return model
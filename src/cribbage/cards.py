@@ -11,18 +11,37 @@ class Suit(Enum):
 
 
 class Card:
-    def __init__(self, rank: int, suit: Suit):
+    """A playing card.
+
+    There are exactly 52 Card instances: constructing a card returns the
+    shared, immutable instance for that rank and suit, so cards compare by
+    identity. Each card also has a canonical integer code from 0 to 51
+    (suit-major, rank-minor) for use in compact representations.
+    """
+    __slots__ = ("rank", "suit", "code", "value")
+
+    def __new__(cls, rank: int, suit: Suit):
         if not 1 <= rank <= 13:
             raise ValueError("Rank must be between 1 and 13")
-        self.rank = rank
-        self.suit = suit
-
-    @property
-    def value(self) -> int:
-        """Returns the card's value for counting in cribbage."""
-        if self.rank > 10:
-            return 10
-        return self.rank
+        if not isinstance(suit, Suit):
+            raise ValueError("Suit must be a Suit")
+        return ALL_CARDS[_SUIT_INDEX[suit] * 13 + rank - 1]
+
+    @classmethod
+    def _create(cls, code: int) -> "Card":
+        card = object.__new__(cls)
+        rank = code % 13 + 1
+        object.__setattr__(card, "rank", rank)
+        object.__setattr__(card, "suit", SUITS[code // 13])
+        object.__setattr__(card, "code", code)
+        # The card's value for counting in cribbage
+        object.__setattr__(card, "value", min(rank, 10))
+        return card
+
+    @staticmethod
+    def from_code(code: int) -> "Card":
+        """Return the card with the given 0-51 code."""
+        return ALL_CARDS[code]
 
     @property
     def display_rank(self) -> str:
@@ -30,6 +49,9 @@ class Card:
         special_ranks = {1: 'A', 11: 'J', 12: 'Q', 13: 'K'}
         return special_ranks.get(self.rank, str(self.rank))
 
+    def __setattr__(self, name, value):
+        raise AttributeError("Cards are immutable")
+
     def __str__(self) -> str:
         return f"{self.display_rank}{self.suit.value}"
 
@@ -37,20 +59,32 @@ class Card:
         return f"Card(rank={self.rank}, suit={self.suit})"
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Card):
-            return False
-        return self.rank == other.rank and self.suit == other.suit
+        return self is other
 
     def __hash__(self) -> int:
-        return hash((self.rank, self.suit))
+        return self.code
+
+    def __reduce__(self):
+        return Card, (self.rank, self.suit)
+
+    def __copy__(self) -> "Card":
+        return self
+
+    def __deepcopy__(self, memo) -> "Card":
+        return self
+
+
+SUITS = tuple(Suit)
+_SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+# Every card, in code order
+ALL_CARDS = tuple(Card._create(code) for code in range(52))
 
 
 class Deck:
-    def __init__(self):
-        self.cards = []
-        for suit in Suit:
-            for rank in range(1, 14):
-                self.cards.append(Card(rank, suit))
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.cards = list(ALL_CARDS)
+        # Source of randomness for shuffling; the random module by default
+        self.rng = rng if rng is not None else random
 
     def __iter__(self):
         return iter(self.cards)
@@ -72,14 +106,11 @@ class Deck:
 
     def shuffle(self):
         """Shuffle the deck."""
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
         
     def reset(self) -> None:
         """Reset the deck to a full, unshuffled state."""
-        self.cards = []
-        for suit in Suit:
-            for rank in range(1, 14):
-                self.cards.append(Card(rank, suit))
+        self.cards = list(ALL_CARDS)
 
     def __str__(self) -> str:
         return f"Deck({len(self.cards)} cards)" 
\ No newline at end of file
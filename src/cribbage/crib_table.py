@@ -0,0 +1,182 @@
+"""
+Expected crib scores for every pair of discarded cards.
+
+The crib is valued by enumerating every pair the other player could throw
+and every starter from the 50 cards left after our discard, scoring each
+crib exactly. Only the ranks of the discards and whether they share a suit
+matter, so the table has 169 entries. The opponent's throw is modelled as
+uniform over the remaining cards, so the expected crib is the same from
+either seat; CribTable.crib_value signs it for the dealer or the pone.
+"""
+import argparse
+import os
+import struct
+from itertools import combinations
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .cards import Card, Suit
+from .scorer import Scorer
+
+MAGIC = b"CRIBCRB"
+VERSION = 1
+
+# magic, version, entry count
+_HEADER = struct.Struct("<7sBI")
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "data", "crib_table.bin")
+
+# (low rank, high rank, suited) for every distinct kind of discard
+DISCARD_CLASSES: List[Tuple[int, int, bool]] = [
+    (low, high, suited)
+    for low in range(1, 14)
+    for high in range(low, 14)
+    for suited in (False, True)
+    if not (low == high and suited)
+]
+_CLASS_INDEX = {key: i for i, key in enumerate(DISCARD_CLASSES)}
+
+
+def discard_class(discard: List[Card]) -> Tuple[int, int, bool]:
+    """Return the (low rank, high rank, suited) class of a 2-card discard."""
+    first, second = discard
+    if first == second:
+        raise ValueError("Discarded cards must be distinct")
+    low, high = sorted((first.rank, second.rank))
+    return low, high, first.suit == second.suit
+
+
+def expected_crib(key: Tuple[int, int, bool]) -> float:
+    """Exact expected crib score for a discard class.
+
+    Averages over every 2-card throw by the other player and every starter
+    from the remaining 50 cards.
+    """
+    low, high, suited = key
+    discard = [Card(low, Suit.HEARTS), Card(high, Suit.HEARTS if suited else Suit.DIAMONDS)]
+    remaining = np.array([code for code in range(52) if code not in (discard[0].code, discard[1].code)])
+
+    throws = np.array(list(combinations(range(50), 2)))
+    starters = np.broadcast_to(np.arange(50), (len(throws), 50))
+    valid = (starters != throws[:, :1]) & (starters != throws[:, 1:])
+    rows = np.repeat(np.arange(len(throws)), 48)
+
+    cribs = np.empty((len(rows), 5), dtype=np.int64)
+    cribs[:, 0] = discard[0].code
+    cribs[:, 1] = discard[1].code
+    cribs[:, 2:4] = remaining[throws[rows]]
+    cribs[:, 4] = remaining[starters[valid]]
+    return float(Scorer.score_hands_batch(cribs, is_crib=True).mean())
+
+
+def _expected_crib_task(key: Tuple[int, int, bool]) -> Tuple[Tuple[int, int, bool], float]:
+    return key, expected_crib(key)
+
+
+def _read_checkpoint(path: str) -> Dict[Tuple[int, int, bool], float]:
+    """Read the classes completed by an interrupted build.
+
+    Every record is written with its newline, so a final line without one
+    was cut short by the interruption. It is dropped, and cut from the file
+    so that the next record appended starts on a line of its own.
+    """
+    done = {}
+    if not os.path.exists(path):
+        return done
+    with open(path, "rb") as f:
+        data = f.read()
+    complete = data.rfind(b"\n") + 1
+    if complete < len(data):
+        with open(path, "r+b") as f:
+            f.truncate(complete)
+    for line in data[:complete].decode().splitlines():
+        low, high, suited, value = line.split()
+        done[(int(low), int(high), suited == "1")] = float(value)
+    return done
+
+
+def build_crib_table(path: str = DEFAULT_PATH, processes: Optional[int] = None,
+                     checkpoint: Optional[str] = None) -> None:
+    """Compute the expected crib for every discard class and write the table.
+
+    Classes are spread across a process pool. Each finished class is
+    appended to the checkpoint file (default: `path` + ".partial"), so
+    rerunning after an interruption only computes the missing classes. The
+    checkpoint is removed once the table is written.
+    """
+    if checkpoint is None:
+        checkpoint = path + ".partial"
+    values = _read_checkpoint(checkpoint)
+    pending = [key for key in DISCARD_CLASSES if key not in values]
+
+    if pending:
+        with open(checkpoint, "a") as f, Pool(processes) as pool:
+            for key, value in pool.imap_unordered(_expected_crib_task, pending):
+                low, high, suited = key
+                f.write(f"{low} {high} {int(suited)} {value!r}\n")
+                f.flush()
+                values[key] = value
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(DISCARD_CLASSES)))
+        f.write(struct.pack(f"<{len(DISCARD_CLASSES)}d", *(values[key] for key in DISCARD_CLASSES)))
+    os.remove(checkpoint)
+
+
+class CribTable:
+    """Expected crib scores by discard class, loaded from a table file."""
+
+    def __init__(self, values: List[float]):
+        if len(values) != len(DISCARD_CLASSES):
+            raise ValueError("Crib table has the wrong number of entries")
+        self.values = values
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PATH) -> "CribTable":
+        """Load a table written by build_crib_table."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a crib table")
+        magic, version, count = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a crib table")
+        if version != VERSION:
+            raise ValueError(f"Unsupported crib table version {version}")
+        if len(data) != _HEADER.size + 8 * count:
+            raise ValueError("Crib table is truncated")
+        return cls(list(struct.unpack_from(f"<{count}d", data, _HEADER.size)))
+
+    def expected_crib(self, discard: List[Card]) -> float:
+        """Expected score of a crib containing the two discarded cards."""
+        return self.values[_CLASS_INDEX[discard_class(discard)]]
+
+    def crib_value(self, discard: List[Card], is_dealer: bool) -> float:
+        """Expected crib points for the dealer, or against the pone."""
+        value = self.expected_crib(discard)
+        return value if is_dealer else -value
+
+
+_default_table: Optional[CribTable] = None
+
+
+def default_crib_table() -> CribTable:
+    """Return the crib table shipped with the package, loading it on first use."""
+    global _default_table
+    if _default_table is None:
+        _default_table = CribTable.load(DEFAULT_PATH)
+    return _default_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the expected crib score table.")
+    parser.add_argument("output", nargs="?", default=DEFAULT_PATH, help="path of the table file to write")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file (default: OUTPUT.partial)")
+    args = parser.parse_args()
+
+    build_crib_table(args.output, args.processes, args.checkpoint)
+    print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
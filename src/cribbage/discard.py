@@ -0,0 +1,165 @@
+"""
+Discard optimizer.
+
+Evaluates every way of splitting a dealt hand into the four cards kept and
+the cards thrown to the crib, against every possible starter card.
+
+enable_cache() puts a per-process LRU cache in front of each keep's
+evaluation, keyed by the suit-canonical form of the keep and discard
+(canonical.canonical_groups_key): deals that differ only by relabelling
+the suits share entries. A hit saves scoring the keep against 46 starters;
+a miss costs about 7% more than not caching. It pays off when the same
+deals are evaluated again (analysis tools, repeated searches); random
+deals rarely repeat (about 2% hits over 3000 of them), and no simulated
+strategy calls optimize_discard, so simulations are not cached. Nor is
+score_hand itself, since building a canonical key costs more than
+scoring the hand.
+"""
+from collections import OrderedDict, namedtuple
+from itertools import combinations
+from typing import Dict, Hashable, List, Optional, Tuple
+from .canonical import canonical_groups_key
+from .cards import ALL_CARDS, Card
+from .crib_table import CribTable, default_crib_table
+from .scorer import Scorer, _starter_points
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class EvaluationCache:
+    """Bounded mapping from suit-canonical keys to keep evaluations, evicting the least recently used."""
+    __slots__ = ("maxsize", "hits", "misses", "_entries")
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable):
+        """Return the cached value for `key`, or None, counting a hit or a miss."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value) -> None:
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+# Optional cache of keep evaluations (see enable_cache)
+_cache: Optional[EvaluationCache] = None
+
+
+def enable_cache(maxsize: int = 65536) -> None:
+    """Cache keep evaluations in this process, at most `maxsize` of them.
+
+    Replaces any cache already enabled.
+    """
+    global _cache
+    _cache = EvaluationCache(maxsize)
+
+
+def disable_cache() -> None:
+    """Stop caching keep evaluations and drop the cache."""
+    global _cache
+    _cache = None
+
+
+def cache_info() -> Optional[CacheInfo]:
+    """Hits, misses, size bound and size of the cache, or None if it is disabled."""
+    return _cache.info() if _cache is not None else None
+
+
+class DiscardOption:
+    """The expected outcome of keeping four cards and discarding the rest."""
+    __slots__ = ("keep", "discard", "expected_hand", "expected_crib", "distribution", "is_dealer")
+
+    def __init__(self, keep: List[Card], discard: List[Card], expected_hand: float,
+                 expected_crib: float, distribution: Dict[int, int], is_dealer: bool):
+        self.keep = keep
+        self.discard = discard
+        self.expected_hand = expected_hand
+        self.expected_crib = expected_crib
+        self.distribution = distribution
+        self.is_dealer = is_dealer
+
+    @property
+    def expected_value(self) -> float:
+        """Expected hand points, plus the crib points for the dealer or minus them for the pone."""
+        if self.is_dealer:
+            return self.expected_hand + self.expected_crib
+        return self.expected_hand - self.expected_crib
+
+    def __repr__(self) -> str:
+        keep = " ".join(str(card) for card in self.keep)
+        discard = " ".join(str(card) for card in self.discard)
+        return (f"DiscardOption(keep={keep}, discard={discard}, "
+                f"hand={self.expected_hand:.3f}, crib={self.expected_crib:.3f})")
+
+
+def _evaluate_keep(keep: List[Card], discard: List[Card], starters: List[Tuple[int, int]],
+                   score_discard: bool) -> Tuple[float, Dict[int, int], Optional[float]]:
+    """The expected hand, the hand's score distribution and, if `score_discard`, the
+    expected crib from the discard alone, over the given (rank, suit index) starters."""
+    distribution = Scorer.score_against_all_starters(keep, excluded=discard, histogram=True)
+    expected_hand = sum(score * count for score, count in distribution.items()) / len(starters)
+
+    expected_crib = None
+    if score_discard:
+        # Single-card (3-player) discards have no table; they are
+        # valued by what they score with the starter on their own
+        crib_by_rank, crib_by_suit = _starter_points(discard, is_crib=True)
+        expected_crib = sum(crib_by_rank[rank] + crib_by_suit[suit]
+                            for rank, suit in starters) / len(starters)
+    return expected_hand, distribution, expected_crib
+
+
+def optimize_discard(six_cards: List[Card], is_dealer: bool,
+                     crib_table: Optional[CribTable] = None) -> List[DiscardOption]:
+    """Evaluate every discard from a dealt hand against every possible starter.
+
+    Takes the 6 cards of a 2-player deal (or 5 of a 3-player deal) and
+    returns one option per choice of four cards to keep, best expected
+    value first. Two-card discards are valued from `crib_table` (default:
+    the table shipped with the package). With enable_cache, each keep's
+    evaluation is cached by the suit-canonical form of the deal.
+    """
+    if len(six_cards) not in (5, 6) or len(set(six_cards)) != len(six_cards):
+        raise ValueError("Expected 5 or 6 distinct cards")
+
+    if len(six_cards) == 6 and crib_table is None:
+        crib_table = default_crib_table()
+
+    dealt = set(six_cards)
+    starters = [(card.rank, card.code // 13) for card in ALL_CARDS if card not in dealt]
+    options = []
+    for keep in combinations(six_cards, 4):
+        keep = list(keep)
+        discard = [card for card in six_cards if card not in keep]
+        # The starters exclude every dealt card, so a keep's value depends on the discard too
+        key = canonical_groups_key((keep, discard)) << 1 | (crib_table is None)
+        value = _cache.get(key) if _cache is not None else None
+        if value is None:
+            value = _evaluate_keep(keep, discard, starters, crib_table is None)
+            if _cache is not None:
+                _cache.put(key, value)
+        expected_hand, distribution, expected_crib = value
+        if crib_table is not None:
+            expected_crib = crib_table.expected_crib(discard)
+        options.append(DiscardOption(keep, discard, expected_hand, expected_crib, dict(distribution),
+                                     is_dealer))
+
+    options.sort(key=lambda option: option.expected_value, reverse=True)
+    return options
@@ -0,0 +1,153 @@
+"""
+Fast path that plays whole deals over integer card codes and masks.
+
+play_fast_game plays the same game as Game.play without building Deck,
+Hand, Board or Round objects: each deal (shuffle, deal, discard, pegging,
+show and crib) runs inside one function over card codes, masks and plain
+lists. Strategies are asked the same questions with the same requests, and
+the game's random stream is used in the same order as Game, so a seeded
+game ends with identical scores on either engine (see
+simulation.compare_engines).
+"""
+import random
+from typing import List, Sequence
+from .cards import ALL_CARDS, Card
+from .moves import GO, PLAY, _FITS, _discard_moves, _play_moves, played_card
+from .pegging_solver import _play_points
+from .player import Player
+from .scorer import Scorer
+from .strategy import DiscardRequest, PlayRequest
+
+
+def _cards(hand: List[int], mask: int) -> List[Card]:
+    """Cards of `hand` (codes in dealt order) that are in `mask`."""
+    return [ALL_CARDS[code] for code in hand if mask >> code & 1]
+
+
+def _game_over(players: List[Player]) -> bool:
+    return any(player.score >= 121 for player in players)
+
+
+def play_fast_deal(players: List[Player], dealer_index: int, rng, strategies: Sequence) -> None:
+    """Play one deal of a game on the fast path, adding the points to `players`.
+
+    Pegging stops, and hands are not counted, once a player reaches 121.
+    """
+    num_players = len(players)
+    deck = list(range(52))
+    rng.shuffle(deck)
+
+    # Deal from the top of the deck, one card to each player in turn
+    cards_per_player = 6 if num_players == 2 else 5
+    hands: List[List[int]] = [[] for _ in players]
+    for _ in range(cards_per_player):
+        for hand in hands:
+            hand.append(deck.pop())
+    crib = [deck.pop()] if num_players == 3 else []
+    starter_code = deck.pop()
+    starter = ALL_CARDS[starter_code]
+
+    unplayed = [sum(1 << code for code in hand) for hand in hands]
+    discarded = [0] * num_players
+
+    # Discard phase
+    num_discards = cards_per_player - 4
+    for index, player in enumerate(players):
+        if _game_over(players):
+            return
+        moves = _discard_moves(index, unplayed[index], num_discards)
+        request = DiscardRequest(index, _cards(hands[index], unplayed[index]), num_discards,
+                                 index == dealer_index, [player.score for player in players], rng, moves)
+        choice = strategies[index].choose_discard(request)
+        mask = 0
+        for card in choice:
+            mask |= 1 << card.code
+        if len(choice) != num_discards or bin(mask).count("1") != num_discards or mask & ~unplayed[index]:
+            raise ValueError(f"Invalid discard for {player.name}: {choice}")
+        unplayed[index] ^= mask
+        discarded[index] = mask
+        crib.extend(card.code for card in choice)
+
+    # Play phase
+    history = []
+    play_area: List[Card] = []
+    ranks = ()
+    count = 0
+    said_go = set()
+    last_player = None
+    current = (dealer_index + 1) % num_players
+    while any(unplayed):
+        if _game_over(players):
+            return
+        player = players[current]
+        moves = _play_moves(current, unplayed[current] & _FITS[31 - count])
+        valid_plays = [] if moves[0][0] == GO else [played_card(move) for move in moves]
+        request = PlayRequest(current, _cards(hands[current], unplayed[current]), valid_plays, count,
+                              list(play_area), starter, current == dealer_index,
+                              [player.score for player in players], rng, moves, tuple(history),
+                              tuple(_cards(hands[current], discarded[current])))
+        card = strategies[current].choose_play(request)
+
+        if card is not None:
+            if not unplayed[current] >> card.code & 1 or count + card.value > 31:
+                raise ValueError(f"Invalid play for {player.name}: {card}")
+            unplayed[current] ^= 1 << card.code
+            history.append((PLAY, current, 1 << card.code))
+            play_area.append(card)
+            ranks += (card.rank,)
+            count += card.value
+            points = _play_points(ranks, count)
+            last_player = current
+            # The last card of the play scores 1 unless it made 31
+            if count != 31 and not any(unplayed):
+                points += 1
+            player.add_points(points, "pegging")
+            if count == 31:
+                play_area = []
+                ranks = ()
+                count = 0
+                said_go = set()
+                last_player = None
+        else:
+            if valid_plays:
+                raise ValueError(f"{player.name} said go with a valid play")
+            said_go.add(current)
+            history.append((GO, current, 0))
+            if len(said_go) == num_players:
+                if last_player is not None:
+                    players[last_player].add_points(1, "pegging")
+                play_area = []
+                ranks = ()
+                count = 0
+                said_go = set()
+                last_player = None
+        current = (current + 1) % num_players
+
+    # Count the hands from the dealer's left, then the crib
+    for offset in range(1, num_players + 1):
+        index = (dealer_index + offset) % num_players
+        if _game_over(players):
+            return
+        kept = [ALL_CARDS[code] for code in hands[index] if not discarded[index] >> code & 1]
+        players[index].add_points(Scorer.score_hand(kept, starter), "hand")
+    if _game_over(players):
+        return
+    players[dealer_index].add_points(
+        Scorer.score_hand([ALL_CARDS[code] for code in crib], starter, is_crib=True), "crib")
+
+
+def play_fast_game(game) -> None:
+    """Play a game that hasn't been started to completion on the fast path.
+
+    Uses the game's players, first dealer, random stream and strategies.
+    """
+    players = game.players
+    rng = game.rng if game.rng is not None else random
+    for player in players:
+        player.reset_score()
+        player.clear_hand()
+    while not _game_over(players):
+        for index, player in enumerate(players):
+            player.is_dealer = index == game.dealer_index
+        play_fast_deal(players, game.dealer_index, rng, game.strategies)
+        game.dealer_index = (game.dealer_index + 1) % len(players)
@@ -1,14 +1,30 @@
-from typing import List, Optional
+import random
+from typing import Dict, List, Optional, Sequence, Union
 from .player import Player
 from .round import Round
 from .cards import Card
+from .moves import GO, legal_moves, played_card
 from .scorer import Scorer
+from .strategy import DiscardRequest, PlayRequest, RandomStrategy, Strategy, decide
+
+Request = Union[DiscardRequest, PlayRequest]
+
+def _format_points(points: Dict[str, int]) -> str:
+    """Format pegging points as e.g. " (fifteen 2, pair 2)"."""
+    if not points:
+        return ""
+    return " (" + ", ".join(f"{category} {value}" for category, value in points.items()) + ")"
 
 class Game:
-    def __init__(self, players: List[Player]):
+    def __init__(self, players: List[Player], rng: Optional[random.Random] = None, verbose: bool = False,
+                 strategies: Optional[Sequence[Strategy]] = None):
         self.players = players
         self.current_round: Optional[Round] = None
         self.dealer_index = 0
+        self.rng = rng  # Source of randomness for dealing; the random module if None
+        self.verbose = verbose  # Print every decision and each hand as it is scored
+        # The strategy making each player's decisions, by player index
+        self.strategies = list(strategies) if strategies is not None else [RandomStrategy() for _ in players]
         
     def start(self) -> None:
         """Start a new game of cribbage."""
@@ -21,7 +37,7 @@ class Game:
         
     def start_new_round(self) -> None:
         """Start a new round of cribbage."""
-        self.current_round = Round(self.players, self.dealer_index)
+        self.current_round = Round(self.players, self.dealer_index, self.rng)
         self.current_round.start()
         
     def discard_to_crib(self, player: Player, cards: List[Card]) -> bool:
@@ -29,22 +45,7 @@ class Game:
         if not self.current_round:
             return False
             
-        # Must discard the correct number of cards
-        # 2 cards in 2-player games, 1 card in 3-player games
-        required_discards = 2 if len(self.players) == 2 else 1
-        if len(cards) != required_discards:
-            return False
-            
-        # Verify player has these cards
-        if not all(card in player.get_playable_cards() for card in cards):
-            return False
-            
-        # Add cards to crib
-        for card in cards:
-            player.discard_card(card)
-            self.current_round.board.add_to_crib(card)
-            
-        return True
+        return self.current_round.discard_to_crib(player, cards)
         
     def play_card(self, player: Player, card: Card) -> bool:
         """Play a card during the play phase. Returns True if successful."""
@@ -61,34 +62,135 @@ class Game:
             
         return self.current_round.player_says_go(player)
         
+    def next_request(self) -> Optional[Request]:
+        """
+        Return the next decision of the current round as a request for the
+        deciding player's strategy: each player's discard in turn, then each
+        play. Returns None once the round has been played out or the game is
+        over.
+        """
+        round = self.current_round
+        if round is None or self.is_game_over():
+            return None
+        rng = self.rng if self.rng is not None else random
+        scores = [player.score for player in self.players]
+        board = round.board
+
+        # Every crib ends up with 4 cards
+        if len(board.crib) < 4:
+            for index, player in enumerate(self.players):
+                if not player.hand.discarded_mask:
+                    moves = legal_moves(round, player)
+                    return DiscardRequest(index, list(player.get_playable_cards()),
+                                          bin(moves[0][2]).count("1"), player.is_dealer, scores,
+                                          rng, moves)
+
+        if round.is_round_over():
+            return None
+        index = round.current_player_index
+        player = self.players[index]
+        moves = legal_moves(round, player)
+        valid_plays = [] if moves[0][0] == GO else [played_card(move) for move in moves]
+        return PlayRequest(index, list(player.get_playable_cards()), valid_plays, board.play_count,
+                           board.get_play_area_cards(), board.starter_card, player.is_dealer,
+                           scores, rng, moves, tuple(round.history),
+                           tuple(player.hand.discarded_cards))
+
+    def apply_choice(self, request: Request, choice) -> None:
+        """
+        Carry out a strategy's answer to a request from next_request: the
+        cards to discard, or the card to play (None to say "go").
+        Raises ValueError if the choice is not allowed.
+        """
+        round = self.current_round
+        player = self.players[request.player_index]
+        if isinstance(request, DiscardRequest):
+            if not self.discard_to_crib(player, choice):
+                raise ValueError(f"Invalid discard for {player.name}: {choice}")
+            if self.verbose:
+                print(f"{player.name} discarded {', '.join(str(card) for card in choice)} to the crib")
+        elif choice is not None:
+            if not self.play_card(player, choice):
+                raise ValueError(f"Invalid play for {player.name}: {choice}")
+            if self.verbose:
+                print(f"{player.name} played {choice}{_format_points(round.last_play_points)}")
+        else:
+            if request.valid_plays:
+                raise ValueError(f"{player.name} said go with a valid play")
+            self.player_says_go(player)
+            if self.verbose:
+                print(f"{player.name} says 'go'{_format_points(round.last_play_points)}")
+
+    def play_round(self, strategies: Optional[Sequence[Strategy]] = None) -> None:
+        """
+        Play the discard and play phases of the current round, asking each
+        player's strategy (default: the game's) for their decisions. Play
+        stops early if a player reaches 121 while pegging.
+        """
+        if strategies is None:
+            strategies = self.strategies
+        if self.verbose:
+            print("\nDiscard phase:")
+        request = self.next_request()
+        in_play = False
+        while request is not None:
+            if self.verbose and not in_play and isinstance(request, PlayRequest):
+                print("\nPlay phase:")
+                in_play = True
+            self.apply_choice(request, decide(strategies[request.player_index], request))
+            request = self.next_request()
+
+    def play(self, strategies: Optional[Sequence[Strategy]] = None) -> None:
+        """Play a started game to completion."""
+        while not self.is_game_over():
+            self.play_round(strategies)
+            if self.verbose:
+                print("\nScoring phase:")
+            # Scores the hands, then deals the next round
+            self.advance_round()
+            if self.verbose:
+                print(self)
+
     def score_hands(self) -> None:
-        """Score all hands and the crib at the end of the round."""
+        """Score all hands and the crib at the end of the round.
+        Hands are counted starting left of the dealer, then the crib; counting
+        stops as soon as a player reaches 121."""
         if not self.current_round:
             return
             
         board = self.current_round.board
         starter = board.starter_card
         
-        # Score non-dealer hands first
-        for player in self.players:
-            if not player.is_dealer:
-                scoring_cards = player.get_scoring_cards()
+        # Score non-dealer hands first, in order from the dealer's left
+        num_players = len(self.players)
+        for offset in range(1, num_players):
+            player = self.players[(self.dealer_index + offset) % num_players]
+            if self.is_game_over():
+                return
+            scoring_cards = player.get_scoring_cards()
+            if self.verbose:
                 print(f"Scoring {player.name}'s hand: {scoring_cards}")
-                score = Scorer.score_hand(scoring_cards, starter)
-                player.add_points(score)
+            score = Scorer.score_hand(scoring_cards, starter)
+            player.add_points(score, "hand")
                 
         # Score dealer's hand
+        if self.is_game_over():
+            return
         dealer = self.current_round.get_dealer()
         scoring_cards = dealer.get_scoring_cards()
-        print(f"Scoring dealer's hand: {scoring_cards}")
+        if self.verbose:
+            print(f"Scoring dealer's hand: {scoring_cards}")
         dealer_score = Scorer.score_hand(scoring_cards, starter)
-        dealer.add_points(dealer_score)
+        dealer.add_points(dealer_score, "hand")
         
         # Score crib
+        if self.is_game_over():
+            return
         crib_cards = board.get_crib_cards()
-        print(f"Scoring crib: {crib_cards}")
+        if self.verbose:
+            print(f"Scoring crib: {crib_cards}")
         crib_score = Scorer.score_hand(crib_cards, starter, is_crib=True)
-        dealer.add_points(crib_score)
+        dealer.add_points(crib_score, "crib")
         
     def is_game_over(self) -> bool:
         """Check if the game is over (someone reached 121 points)."""
@@ -102,12 +204,15 @@ class Game:
         return None
         
     def advance_round(self) -> None:
-        """Advance to the next round."""
-        if not self.current_round:
+        """Advance to the next round. Once a player has reached 121 no new
+        round is dealt."""
+        if not self.current_round or self.is_game_over():
             return
             
         # Score the hands
         self.score_hands()
+        if self.is_game_over():
+            return
         
         # Move dealer to next player
         self.dealer_index = (self.dealer_index + 1) % len(self.players)
@@ -1,55 +1,101 @@
-from typing import List, Optional, Set
+from typing import List, Optional, Sequence, Set, Tuple
 from .cards import Card
 
 class Hand:
+    """A player's cards for one deal.
+
+    Membership and card state (held, played, discarded) are tracked as
+    52-bit masks indexed by Card.code, next to the played and discarded
+    cards in the order they left the hand. The unplayed and scoring views
+    are built on first use and cached until the hand changes; the getters
+    for them return new lists.
+    """
+
     def __init__(self):
         self.cards = []
         self.original_hand_cards = []  # Only the 4 cards that make up the original hand
-        self.played_cards = []
-        self.discarded_cards = []
+        self.held_mask = 0
+        self.played_mask = 0
+        self.discarded_mask = 0
+        self._played: Tuple[Card, ...] = ()  # In play order
+        self._discarded: Tuple[Card, ...] = ()  # In discard order
+        self._views = {}
+
+    @property
+    def played_cards(self) -> List[Card]:
+        """Played cards, in the order they were played."""
+        return list(self._played)
+
+    @property
+    def discarded_cards(self) -> List[Card]:
+        """Discarded cards, in the order they were discarded."""
+        return list(self._discarded)
+
+    @property
+    def unplayed_mask(self) -> int:
+        """Mask of cards that haven't been played or discarded yet."""
+        return self.held_mask & ~(self.played_mask | self.discarded_mask)
+
+    def _view(self, name: str, mask: int) -> List[Card]:
+        """Return a copy of the cached tuple of held cards in `mask`, in dealt order."""
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = tuple(card for card in self.cards if mask >> card.code & 1)
+        return list(view)
+
+    def set_cards(self, played: Sequence[Card], discarded: Sequence[Card]) -> None:
+        """Set which held cards are played and discarded, in order (used to restore snapshots)."""
+        self._played = tuple(played)
+        self._discarded = tuple(discarded)
+        self.played_mask = sum(1 << card.code for card in self._played)
+        self.discarded_mask = sum(1 << card.code for card in self._discarded)
+        self._views = {}
         
     def add_card(self, card: Card) -> None:
         """Add a card to the hand."""
         if len(self.cards) >= 6:
             raise ValueError("Hand cannot contain more than 6 cards")
-        if card in self.cards:
+        bit = 1 << card.code
+        if self.held_mask & bit:
             raise ValueError("Card already in hand")
         self.cards.append(card)
+        self.held_mask |= bit
+        self._views = {}
         
     def play_card(self, card: Card) -> Optional[Card]:
         """Play a card from the hand."""
-        if card not in self.cards:
-            return None
-        if card in self.played_cards or card in self.discarded_cards:
+        bit = 1 << card.code
+        if not self.unplayed_mask & bit:
             return None
-        self.played_cards.append(card)
+        self.set_cards(self._played + (card,), self._discarded)
         return card
             
     def discard_card(self, card: Card) -> Optional[Card]:
         """Discard a card to the crib."""
-        if card not in self.cards:
+        bit = 1 << card.code
+        if not self.unplayed_mask & bit:
             return None
-        if card in self.discarded_cards or card in self.played_cards:
-            return None
-        self.discarded_cards.append(card)
+        self.set_cards(self._played, self._discarded + (card,))
         return card
             
     def unplay_card(self, card: Card) -> None:
         """Unplay a card."""
-        if card in self.played_cards:
-            self.played_cards.remove(card)
+        bit = 1 << card.code
+        if self.played_mask & bit:
+            self.set_cards([played for played in self._played if played is not card], self._discarded)
         
     def undiscard_card(self, card: Card) -> None:
         """Undiscard a card."""
-        if card in self.discarded_cards:
-            self.discarded_cards.remove(card)
+        bit = 1 << card.code
+        if self.discarded_mask & bit:
+            self.set_cards(self._played, [discarded for discarded in self._discarded if discarded is not card])
         
     def clear(self) -> None:
         """Clear all cards from the hand."""
         self.cards = []
         self.original_hand_cards = []
-        self.played_cards = []
-        self.discarded_cards = []
+        self.held_mask = 0
+        self.set_cards((), ())
         
     def get_cards(self) -> List[Card]:
         """Get all cards in the hand."""
@@ -57,7 +103,11 @@ class Hand:
         
     def get_unplayed_cards(self) -> List[Card]:
         """Get all unplayed cards."""
-        return [card for card in self.cards if card not in self.played_cards and card not in self.discarded_cards]
+        return self._view("unplayed", self.unplayed_mask)
+
+    def has_unplayed_cards(self) -> bool:
+        """Check if any cards haven't been played or discarded yet."""
+        return self.unplayed_mask != 0
         
     def get_played_cards(self) -> List[Card]:
         """Get all played cards."""
@@ -70,7 +120,7 @@ class Hand:
     def get_scoring_cards(self) -> List[Card]:
         """Get all cards that should be scored at the end of the round.
         Returns the 4 cards that weren't discarded to the crib."""
-        return [card for card in self.cards if card not in self.discarded_cards]
+        return self._view("scoring", self.held_mask & ~self.discarded_mask)
         
     def count_points(self) -> int:
         """Count points in the hand. To be implemented with cribbage scoring rules."""
@@ -85,9 +135,9 @@ class Hand:
         """Display the hand, marking played cards with an asterisk (*) and discarded cards with a caret (^)."""
         card_strings = []
         for card in self.cards:
-            if card in self.played_cards:
+            if self.played_mask >> card.code & 1:
                 card_strings.append(f"{card}*")
-            elif card in self.discarded_cards:
+            elif self.discarded_mask >> card.code & 1:
                 card_strings.append(f"{card}^")
             else:
                 card_strings.append(str(card))
@@ -0,0 +1,348 @@
+"""
+Information-set Monte Carlo tree search strategy for 2-player games.
+
+Each iteration deals the cards the player can't see at random, consistent
+with what has been seen (a determinization), and plays the rest of the
+round out on PeggingState. Pegging decisions grow a single-observer tree
+over the moves of both players, keyed by rank since suits don't matter when
+pegging. Discards are chosen by a bandit over every discard, each sample
+dealing the opponent's hand, their discards and the starter, then scoring
+the hands and crib and playing out the pegging at random.
+
+Searches run until a wall-clock budget per decision is spent. The pegging
+tree is kept between the player's consecutive plays in a round and reused
+from the position reached. With processes > 1 independent searches run in
+a process pool (root parallelisation) and their root statistics are
+summed; trees are not reused then. The pool is shut down by close(), on
+leaving a `with` block, or when the strategy is garbage collected. Root
+parallelism is not available inside a pool worker (e.g. a strategy passed
+to simulate_games with processes > 1), since workers can't start their own
+pools; use processes=1 there.
+"""
+import math
+import random
+import time
+import weakref
+from itertools import combinations
+from multiprocessing import Pool, current_process
+from typing import Dict, List, Optional, Tuple
+from .cards import ALL_CARDS, Card
+from .moves import GO as GO_MOVE
+from .pegging_solver import GO, PeggingState
+from .scorer import Scorer
+from .strategy import DiscardRequest, PlayRequest
+
+
+def _mask(cards) -> int:
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.code
+    return mask
+
+
+def _move_key(code: int) -> int:
+    """Tree edge for a move: the rank played, or GO."""
+    return GO if code == GO else code % 13 + 1
+
+
+def _rollout(state: PeggingState, rng: random.Random, points: List[int]) -> None:
+    """Play the pegging out at random, adding each player's points."""
+    while not state.is_over():
+        state, scorer, scored = state.step(rng.choice(state.moves()))
+        if scorer >= 0:
+            points[scorer] += scored
+
+
+class _Node:
+    """Statistics for a move in the search tree, from the view of the player who made it."""
+    __slots__ = ("player", "children", "visits", "total", "available")
+
+    def __init__(self, player: int):
+        self.player = player
+        self.children: Dict[int, "_Node"] = {}
+        self.visits = 0
+        self.total = 0.0  # Sum of the mover's point differentials
+        self.available = 1  # Times the move was legal when its parent was visited
+
+
+class _PlayInfo:
+    """What the player to move knows while pegging."""
+    __slots__ = ("player", "hand", "opponent_cards", "candidates", "ranks", "count",
+                 "said_go", "to_move", "last_player")
+
+    def __init__(self, request: PlayRequest):
+        player = request.player_index
+        opponent = 1 - player
+        played = [0, 0]
+        for kind, index, mask in request.history:
+            played[index] |= mask
+
+        # Replay the public moves of the round to recover the state of play
+        hands = [played[0], played[1]]
+        hands[player] |= _mask(request.hand)
+        state = PeggingState(tuple(hands), to_move=request.history[0][1] if request.history else player)
+        lowest_go_count = None
+        for kind, index, mask in request.history:
+            if kind == GO_MOVE:
+                if index == opponent and (lowest_go_count is None or state.count < lowest_go_count):
+                    lowest_go_count = state.count
+                state = state.step(GO)[0]
+            else:
+                state = state.step(mask.bit_length() - 1)[0]
+
+        seen = _mask(request.hand) | played[0] | played[1] | _mask(request.discarded) \
+            | 1 << request.starter.code
+        unseen = [code for code in range(52) if not seen >> code & 1]
+        # Since saying go at a count, the opponent has held only cards too big to play
+        candidates = unseen
+        if lowest_go_count is not None:
+            candidates = [code for code in unseen if min(code % 13 + 1, 10) > 31 - lowest_go_count]
+
+        self.player = player
+        self.hand = _mask(request.hand)
+        self.opponent_cards = 4 - bin(played[opponent]).count("1")
+        if len(candidates) < self.opponent_cards:
+            candidates = unseen
+        self.candidates = candidates
+        self.ranks = state.ranks
+        self.count = state.count
+        self.said_go = state.said_go
+        self.to_move = player
+        self.last_player = state.last_player
+
+    def determinize(self, rng: random.Random) -> PeggingState:
+        """A state with the opponent's cards dealt at random."""
+        hands = [0, 0]
+        hands[self.player] = self.hand
+        hands[1 - self.player] = sum(1 << code for code in rng.sample(self.candidates, self.opponent_cards))
+        return PeggingState(tuple(hands), self.ranks, self.count, self.said_go, self.to_move,
+                            self.last_player)
+
+
+def _search_play(root: _Node, info: _PlayInfo, deadline: float, iterations: Optional[int],
+                 exploration: float, rng: random.Random) -> None:
+    """Run single-observer ISMCTS iterations from `root` until the budget is spent."""
+    done = 0
+    while (iterations is None or done < iterations) and time.perf_counter() < deadline:
+        done += 1
+        state = info.determinize(rng)
+        points = [0, 0]
+        node = root
+        path = [root]
+
+        # Select while every legal move has been tried, then expand one
+        while not state.is_over():
+            moves = {_move_key(code): code for code in state.moves()}
+            untried = [key for key in moves if key not in node.children]
+            if untried:
+                key = rng.choice(untried)
+                child = node.children[key] = _Node(state.to_move)
+            else:
+                best_score = None
+                for key_option in moves:
+                    option = node.children[key_option]
+                    option.available += 1
+                    score = option.total / option.visits + exploration * math.sqrt(
+                        math.log(option.available) / option.visits)
+                    if best_score is None or score > best_score:
+                        best_score = score
+                        key = key_option
+                child = node.children[key]
+            state, scorer, scored = state.step(moves[key])
+            if scorer >= 0:
+                points[scorer] += scored
+            node = child
+            path.append(node)
+            if untried:
+                break
+
+        _rollout(state, rng, points)
+        for node in path:
+            node.visits += 1
+            node.total += points[node.player] - points[1 - node.player]
+
+
+def _play_task(args) -> Dict[int, Tuple[int, float]]:
+    """Search a fresh tree in a worker and return its root statistics."""
+    info, time_limit, iterations, exploration, seed = args
+    root = _Node(1 - info.player)
+    _search_play(root, info, time.perf_counter() + time_limit, iterations, exploration,
+                 random.Random(seed))
+    return {key: (child.visits, child.total) for key, child in root.children.items()}
+
+
+def _discard_value(keep: List[Card], discard: List[Card], player: int, dealer: int,
+                   rng: random.Random, unseen: List[Card]) -> int:
+    """One sampled outcome of a discard: the player's points minus the opponent's."""
+    # The opponent's six cards in random order, then the starter; they
+    # discard their last two at random
+    dealt = rng.sample(unseen, 7)
+    opponent_keep = dealt[:4]
+    crib = discard + dealt[4:6]
+    starter = dealt[6]
+
+    points = [0, 0]
+    points[player] += Scorer.score_hand(keep, starter)
+    points[1 - player] += Scorer.score_hand(opponent_keep, starter)
+    points[dealer] += Scorer.score_hand(crib, starter, is_crib=True)
+    hands = [0, 0]
+    hands[player] = _mask(keep)
+    hands[1 - player] = _mask(opponent_keep)
+    _rollout(PeggingState(tuple(hands), to_move=1 - dealer), rng, points)
+    return points[player] - points[1 - player]
+
+
+def _search_discard(hand: List[Card], num_discards: int, player: int, dealer: int,
+                    deadline: float, iterations: Optional[int], exploration: float,
+                    rng: random.Random) -> List[Tuple[int, float]]:
+    """UCB1 over every discard; returns (visits, total) per discard index."""
+    options = _discard_options(hand, num_discards)
+    held = set(hand)
+    unseen = [card for card in ALL_CARDS if card not in held]
+    stats = [[0, 0.0] for _ in options]
+    done = 0
+    while (iterations is None or done < iterations) and time.perf_counter() < deadline:
+        done += 1
+        if done <= len(options):
+            index = done - 1
+        else:
+            log_total = math.log(done)
+            index = max(range(len(options)), key=lambda i: stats[i][1] / stats[i][0]
+                        + exploration * math.sqrt(log_total / stats[i][0]))
+        keep, discard = options[index]
+        stats[index][0] += 1
+        stats[index][1] += _discard_value(keep, discard, player, dealer, rng, unseen)
+    return [(visits, total) for visits, total in stats]
+
+
+def _discard_options(hand: List[Card], num_discards: int) -> List[Tuple[List[Card], List[Card]]]:
+    """Every (keep, discard) split of a hand, in a fixed order."""
+    return [([card for card in hand if card not in discard], list(discard))
+            for discard in combinations(hand, num_discards)]
+
+
+def _discard_task(args) -> List[Tuple[int, float]]:
+    hand, num_discards, player, dealer, time_limit, iterations, exploration, seed = args
+    return _search_discard(hand, num_discards, player, dealer, time.perf_counter() + time_limit,
+                           iterations, exploration, random.Random(seed))
+
+
+def _close_pool(pool: Pool) -> None:
+    pool.close()
+    pool.join()
+
+
+class ISMCTSStrategy:
+    """Chooses discards and plays by determinized information-set MCTS.
+
+    Each decision searches for `time_limit` seconds, or for `iterations`
+    iterations per process if that comes first. `exploration` is the UCB
+    constant in points. Only 2-player games are supported.
+    """
+
+    def __init__(self, time_limit: float = 0.1, iterations: Optional[int] = None,
+                 exploration: float = 4.0, processes: int = 1):
+        self.time_limit = time_limit
+        self.iterations = iterations
+        self.exploration = exploration
+        self.processes = processes
+        self._pool: Optional[Pool] = None
+        self._pool_finalizer: Optional[weakref.finalize] = None
+        # Pegging tree from the last decision, and what it was searched from
+        self._root: Optional[_Node] = None
+        self._root_deal: Optional[Tuple[int, int]] = None
+        self._root_history = 0
+
+    def __getstate__(self):
+        # Pools and trees stay with the process that made them
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_finalizer"] = None
+        state["_root"] = None
+        state["_root_deal"] = None
+        return state
+
+    def __enter__(self) -> "ISMCTSStrategy":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the process pool, if one was started."""
+        if self._pool_finalizer is not None:
+            self._pool_finalizer()
+        self._pool = None
+        self._pool_finalizer = None
+
+    def _map(self, task, args):
+        if self._pool is None:
+            if current_process().daemon:
+                raise ValueError("Root parallelism isn't available inside a pool worker; use processes=1")
+            self._pool = Pool(self.processes)
+            # Shut the workers down if the strategy is dropped without close()
+            self._pool_finalizer = weakref.finalize(self, _close_pool, self._pool)
+        return self._pool.map(task, args)
+
+    def choose_discard(self, request: DiscardRequest) -> List[Card]:
+        if len(request.scores) != 2:
+            raise ValueError("ISMCTS strategy supports 2-player games only")
+        player = request.player_index
+        dealer = player if request.is_dealer else 1 - player
+        options = _discard_options(request.hand, request.num_discards)
+        seeds = [request.rng.getrandbits(64) for _ in range(self.processes)]
+        args = [(request.hand, request.num_discards, player, dealer, self.time_limit,
+                 self.iterations, self.exploration, seed) for seed in seeds]
+        if self.processes == 1:
+            results = [_discard_task(args[0])]
+        else:
+            results = self._map(_discard_task, args)
+        visits = [sum(result[i][0] for result in results) for i in range(len(options))]
+        best = max(range(len(options)), key=lambda i: visits[i])
+        return options[best][1]
+
+    def choose_play(self, request: PlayRequest) -> Optional[Card]:
+        """Return a card to play, or None to say "go"."""
+        if len(request.scores) != 2:
+            raise ValueError("ISMCTS strategy supports 2-player games only")
+        if not request.valid_plays:
+            return None
+        if len(request.valid_plays) == 1:
+            return request.valid_plays[0]
+
+        info = _PlayInfo(request)
+        seeds = [request.rng.getrandbits(64) for _ in range(self.processes)]
+        if self.processes == 1:
+            root = self._reused_root(request)
+            _search_play(root, info, time.perf_counter() + self.time_limit, self.iterations,
+                         self.exploration, random.Random(seeds[0]))
+            stats = {key: child.visits for key, child in root.children.items()}
+            self._root = root
+        else:
+            args = [(info, self.time_limit, self.iterations, self.exploration, seed) for seed in seeds]
+            stats = {}
+            for result in self._map(_play_task, args):
+                for key, (visits, _) in result.items():
+                    stats[key] = stats.get(key, 0) + visits
+
+        ranks = {card.rank: card for card in request.valid_plays}
+        best = max(ranks, key=lambda rank: stats.get(rank, 0))
+        return ranks[best]
+
+    def _reused_root(self, request: PlayRequest) -> _Node:
+        """The subtree for the current position if the last tree reached it, else a new root."""
+        deal = (request.starter.code, _mask(request.discarded))
+        history = request.history
+        node = self._root
+        if node is not None and (self._root_deal != deal or len(history) < self._root_history):
+            node = None
+        if node is not None:
+            for kind, _, mask in history[self._root_history:]:
+                node = node.children.get(_move_key(GO if kind == GO_MOVE else mask.bit_length() - 1))
+                if node is None:
+                    break
+        if node is None:
+            node = _Node(1 - request.player_index)
+        self._root_deal = deal
+        self._root_history = len(history)
+        return node
@@ -0,0 +1,107 @@
+"""
+Compact move representation for search.
+
+A move is a tuple (kind, player_index, card_mask): the cards discarded or
+played as a mask over Card.code, or 0 for a go. legal_moves generates them
+for any state of a round.
+"""
+from functools import lru_cache
+from itertools import combinations
+from typing import List, Tuple
+from .cards import Card
+
+DISCARD = 0
+PLAY = 1
+GO = 2
+
+Move = Tuple[int, int, int]
+
+_CARD_BY_BIT = {1 << code: Card.from_code(code) for code in range(52)}
+
+
+def discard_move(player_index: int, cards: List[Card]) -> Move:
+    """Move discarding `cards` to the crib."""
+    mask = 0
+    for card in cards:
+        mask |= 1 << card.code
+    return DISCARD, player_index, mask
+
+
+def play_move(player_index: int, card: Card) -> Move:
+    """Move playing `card`."""
+    return PLAY, player_index, 1 << card.code
+
+
+def go_move(player_index: int) -> Move:
+    """Move saying "go"."""
+    return GO, player_index, 0
+
+
+def move_cards(move: Move) -> List[Card]:
+    """Cards in a move's mask, lowest code first."""
+    mask = move[2]
+    cards = []
+    while mask:
+        low = mask & -mask
+        cards.append(Card.from_code(low.bit_length() - 1))
+        mask ^= low
+    return cards
+
+
+def played_card(move: Move) -> Card:
+    """The card played by a play move."""
+    return _CARD_BY_BIT[move[2]]
+
+
+# Cards that can be played with `limit` left before 31, by limit
+_FITS = [sum(1 << code for code in range(52) if min(code % 13 + 1, 10) <= limit)
+         for limit in range(32)]
+
+
+@lru_cache(maxsize=4096)
+def _discard_moves(player_index: int, unplayed_mask: int, num_discards: int) -> Tuple[Move, ...]:
+    bits = []
+    while unplayed_mask:
+        low = unplayed_mask & -unplayed_mask
+        bits.append(low)
+        unplayed_mask ^= low
+    # Players discard 1 or 2 cards
+    if num_discards == 1:
+        return tuple([(DISCARD, player_index, bit) for bit in bits])
+    return tuple([(DISCARD, player_index, a | b) for a, b in combinations(bits, 2)])
+
+
+@lru_cache(maxsize=4096)
+def _play_moves(player_index: int, playable_mask: int) -> Tuple[Move, ...]:
+    if not playable_mask:
+        return ((GO, player_index, 0),)
+    moves = []
+    while playable_mask:
+        low = playable_mask & -playable_mask
+        moves.append((PLAY, player_index, low))
+        playable_mask ^= low
+    return tuple(moves)
+
+
+def legal_moves(round, player) -> Tuple[Move, ...]:
+    """Return the moves `player` can make in `round`.
+
+    Until the player has discarded these are every choice of cards to throw
+    to the crib (2 cards in 2-player games, 1 in 3-player games). After that
+    they are the plays that keep the count at 31 or less, or a single go if
+    there are none; a player whose turn it isn't, or who is waiting for
+    another player to discard, has no moves. Results are cached by player
+    and cards.
+    """
+    player_index = round.players.index(player)
+    hand = player.hand
+    # Players are dealt 6 cards (2 players) or 5 (3 players) and keep 4
+    num_discards = len(hand.cards) - 4
+    if num_discards > 0 and not hand.discarded_mask:
+        return _discard_moves(player_index, hand.unplayed_mask, num_discards)
+    if player_index != round.current_player_index:
+        return ()
+    # The play starts once every player has thrown to the crib
+    if any(len(other.hand.cards) > 4 and not other.hand.discarded_mask for other in round.players):
+        return ()
+    return _play_moves(player_index, hand.unplayed_mask & _FITS[31 - round.board.play_count])
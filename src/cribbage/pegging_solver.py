@@ -0,0 +1,249 @@
+"""
+Exact pegging solver for when every hand is known.
+
+With the hands face up, pegging is a small deterministic game. solve()
+searches it with negamax and alpha-beta pruning over the difference between
+the two players' pegging points, memoising positions in a transposition
+table keyed by Zobrist hashes. The rules are those of Round: a player must
+play if they can, the last player to play scores the go once everyone has
+said go, the last card scores 1 unless it makes 31, and after a reset the
+count is led by the player after the one who said the last go (or made 31).
+Reaching 121 part way through is not taken into account.
+"""
+import random
+from typing import Dict, List, Optional, Tuple
+from .board import PAIR_POINTS
+from .cards import Card
+from .moves import _FITS
+
+GO = -1  # Move code for saying go
+
+# Longest possible sequence between resets: all twelve cards of a 3-player
+# play (four aces, twos and threes count only 24)
+_MAX_SEQUENCE = 12
+
+_zobrist = random.Random(0x5EED)
+_CARD_KEYS = [[_zobrist.getrandbits(64) for _ in range(52)] for _ in range(3)]
+_SEQUENCE_KEYS = [[_zobrist.getrandbits(64) for _ in range(14)] for _ in range(_MAX_SEQUENCE)]
+_GO_KEYS = [_zobrist.getrandbits(64) for _ in range(3)]
+_TO_MOVE_KEYS = [_zobrist.getrandbits(64) for _ in range(3)]
+_LAST_PLAYER_KEYS = [_zobrist.getrandbits(64) for _ in range(3)]
+
+# Transposition table entry bounds
+_EXACT = 0
+_LOWER = 1
+_UPPER = 2
+
+
+def _play_points(ranks: Tuple[int, ...], count: int) -> int:
+    """Pegging points for the last of `ranks`, played to make `count`."""
+    points = 2 if count == 15 or count == 31 else 0
+    last = ranks[-1]
+    streak = 1
+    for rank in reversed(ranks[:-1]):
+        if rank != last:
+            break
+        streak += 1
+    if streak >= 2:
+        return points + PAIR_POINTS[streak]
+
+    # Longest run among the most recent cards, which must all differ in rank
+    seen = 0
+    run = 0
+    for length, rank in enumerate(reversed(ranks), 1):
+        bit = 1 << rank
+        if seen & bit:
+            break
+        seen |= bit
+        if length >= 3 and seen // (seen & -seen) == (1 << length) - 1:
+            run = length
+    return points + run
+
+
+class PeggingState:
+    """The part of a round that matters for pegging, with every hand known.
+
+    Hands are masks of unplayed card codes by player index; `ranks` are the
+    ranks played since the count was last reset. States are immutable; step
+    returns the state after a move.
+    """
+    __slots__ = ("hands", "ranks", "count", "said_go", "to_move", "last_player", "key")
+
+    def __init__(self, hands: Tuple[int, ...], ranks: Tuple[int, ...] = (), count: int = 0,
+                 said_go: int = 0, to_move: int = 0, last_player: int = -1,
+                 key: Optional[int] = None):
+        if len(hands) > 3:
+            raise ValueError("Pegging is for 2 or 3 players")
+        self.hands = hands
+        self.ranks = ranks
+        self.count = count
+        self.said_go = said_go  # Bit i is set if player i has said go
+        self.to_move = to_move
+        self.last_player = last_player  # Who played the last card, or -1
+        self.key = self._hash() if key is None else key
+
+    @classmethod
+    def from_round(cls, round) -> "PeggingState":
+        """Capture the pegging state of a round after the discards."""
+        board = round.board
+        said_go = 0
+        for index in board.players_said_go:
+            said_go |= 1 << index
+        last_player = board.last_player_index
+        return cls(tuple(player.hand.unplayed_mask for player in round.players),
+                   tuple(card.rank for card in board.play_area), board.play_count, said_go,
+                   round.current_player_index, -1 if last_player is None else last_player)
+
+    def _hash(self) -> int:
+        key = _TO_MOVE_KEYS[self.to_move]
+        for player, hand in enumerate(self.hands):
+            keys = _CARD_KEYS[player]
+            while hand:
+                low = hand & -hand
+                key ^= keys[low.bit_length() - 1]
+                hand ^= low
+            if self.said_go >> player & 1:
+                key ^= _GO_KEYS[player]
+        for position, rank in enumerate(self.ranks):
+            key ^= _SEQUENCE_KEYS[position][rank]
+        if self.last_player >= 0:
+            key ^= _LAST_PLAYER_KEYS[self.last_player]
+        return key
+
+    def is_over(self) -> bool:
+        """Whether every card has been played."""
+        return not any(self.hands)
+
+    def moves(self) -> List[int]:
+        """Codes of the cards the player to move can play, or [GO].
+
+        Cards of the same rank peg the same, so only one of each rank is
+        listed.
+        """
+        playable = self.hands[self.to_move] & _FITS[31 - self.count]
+        moves = []
+        ranks = 0
+        while playable:
+            low = playable & -playable
+            code = low.bit_length() - 1
+            bit = 2 << code % 13
+            if not ranks & bit:
+                ranks |= bit
+                moves.append(code)
+            playable ^= low
+        return moves or [GO]
+
+    def step(self, move: int) -> Tuple["PeggingState", int, int]:
+        """Make a move and return (next state, player who scored or -1, points)."""
+        mover = self.to_move
+        num_players = len(self.hands)
+        to_move = (mover + 1) % num_players
+        key = self.key ^ _TO_MOVE_KEYS[mover] ^ _TO_MOVE_KEYS[to_move]
+
+        if move == GO:
+            said_go = self.said_go | 1 << mover
+            if said_go != (1 << num_players) - 1:
+                if not self.said_go >> mover & 1:
+                    key ^= _GO_KEYS[mover]
+                return (PeggingState(self.hands, self.ranks, self.count, said_go, to_move,
+                                     self.last_player, key),
+                        -1, 0)
+            # Everyone has said go: the last player scores and the count restarts
+            scorer = self.last_player
+            state = PeggingState(self.hands, (), 0, 0, to_move, -1, None)
+            return state, scorer, 1 if scorer >= 0 else 0
+
+        hands = list(self.hands)
+        hands[mover] ^= 1 << move
+        hands = tuple(hands)
+        rank = move % 13 + 1
+        ranks = self.ranks + (rank,)
+        count = self.count + min(rank, 10)
+        points = _play_points(ranks, count)
+        if count == 31:
+            return PeggingState(hands, (), 0, 0, to_move, -1, None), mover, points
+        if not any(hands):
+            # The last card of the play
+            points += 1
+        key ^= _CARD_KEYS[mover][move] ^ _SEQUENCE_KEYS[len(self.ranks)][rank]
+        if self.last_player != mover:
+            if self.last_player >= 0:
+                key ^= _LAST_PLAYER_KEYS[self.last_player]
+            key ^= _LAST_PLAYER_KEYS[mover]
+        return PeggingState(hands, ranks, count, self.said_go, to_move, mover, key), mover, points
+
+
+def _search(state: PeggingState, alpha: int, beta: int, table: Dict[int, tuple]) -> int:
+    """Points the player to move pegs from here on minus their opponent's."""
+    if state.is_over():
+        return 0
+
+    entry = table.get(state.key)
+    best_move = None
+    if entry is not None:
+        value, bound, best_move = entry
+        if bound == _EXACT:
+            return value
+        if bound == _LOWER:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value
+
+    mover = state.to_move
+    children = []
+    for move in state.moves():
+        child, scorer, points = state.step(move)
+        children.append((points if scorer == mover else -points, move, child))
+    # Try the remembered best move first, then the biggest immediate scores
+    children.sort(key=lambda item: (item[1] == best_move, item[0]), reverse=True)
+
+    original_alpha = alpha
+    best_value = None
+    for reward, move, child in children:
+        value = reward - _search(child, reward - beta, reward - alpha, table)
+        if best_value is None or value > best_value:
+            best_value = value
+            best_move = move
+            if value > alpha:
+                alpha = value
+                if alpha >= beta:
+                    break
+
+    if best_value <= original_alpha:
+        bound = _UPPER
+    elif best_value >= beta:
+        bound = _LOWER
+    else:
+        bound = _EXACT
+    table[state.key] = (best_value, bound, best_move)
+    return best_value
+
+
+def solve(state: PeggingState, table: Optional[Dict[int, tuple]] = None) -> Tuple[int, int]:
+    """Return (best move, point differential) for the player to move.
+
+    The differential is the pegging points the player to move scores from
+    here to the end of the round minus their opponent's, with both playing
+    perfectly. Pass the same `table` when solving successive positions of
+    one deal to reuse earlier work.
+    """
+    if len(state.hands) != 2:
+        raise ValueError("The solver is for 2-player pegging")
+    if state.is_over():
+        raise ValueError("Every card has been played")
+    if table is None:
+        table = {}
+    bound = 64  # More than either player can peg in a round
+    value = _search(state, -bound, bound, table)
+    return table[state.key][2], value
+
+
+def solve_pegging(round, table: Optional[Dict[int, tuple]] = None) -> Tuple[Optional[Card], int]:
+    """Return the best play for the current player of a 2-player round and its differential.
+
+    The play is None if the player must say go.
+    """
+    move, value = solve(PeggingState.from_round(round), table)
+    return (None if move == GO else Card.from_code(move)), value
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from .cards import Card
 from .hand import Hand
 
@@ -7,6 +7,7 @@ class Player:
         self.name = name
         self.hand = Hand()
         self.score = 0
+        self.points_by_category: Dict[str, int] = {}  # e.g. "pegging", "hand", "crib"
         self.is_dealer = False
         
     def receive_card(self, card: Card) -> None:
@@ -33,13 +34,27 @@ class Player:
         """Get list of cards that have been discarded to the crib."""
         return self.hand.get_discarded_cards()
         
-    def add_points(self, points: int) -> None:
-        """Add points to the player's score."""
+    def add_points(self, points: int, category: Optional[str] = None) -> None:
+        """Add points to the player's score, optionally recording where they came from."""
         self.score += points
+        if category is not None:
+            self.points_by_category[category] = self.points_by_category.get(category, 0) + points
+        
+    def snapshot(self) -> tuple:
+        """Return the player's score and hand state as an immutable tuple (see restore)."""
+        return (self.score, tuple(self.points_by_category.items()),
+                tuple(self.hand.played_cards), tuple(self.hand.discarded_cards))
+
+    def restore(self, state: tuple) -> None:
+        """Restore the state captured by snapshot. The dealt cards must be unchanged."""
+        self.score, points_by_category, played, discarded = state
+        self.points_by_category = dict(points_by_category)
+        self.hand.set_cards(played, discarded)
         
     def reset_score(self) -> None:
         """Reset the player's score to 0."""
         self.score = 0
+        self.points_by_category = {}
         
     def get_score(self) -> int:
         """Get the player's current score."""
@@ -1,15 +1,20 @@
-from typing import List, Optional, Tuple
+import random
+from typing import Dict, List, Optional, Tuple
 from .cards import Card, Deck
 from .player import Player
 from .board import Board
+from .moves import DISCARD, GO, PLAY, Move, legal_moves, move_cards
 
 class Round:
-    def __init__(self, players: List[Player], dealer_index: int):
+    def __init__(self, players: List[Player], dealer_index: int, rng: Optional[random.Random] = None):
         self.players = players
         self.dealer_index = dealer_index
         self.board = Board()
-        self.deck = Deck()
+        self.deck = Deck(rng)
         self.current_player_index = (dealer_index + 1) % len(players)
+        self.last_play_points: Dict[str, int] = {}  # Pegging points for the last play or go
+        self._undo_log: List[tuple] = []  # Snapshots taken before each applied move
+        self.history: List[Move] = []  # Plays and go's so far, in order
         
         # Set dealer
         for i, player in enumerate(players):
@@ -20,6 +25,7 @@ class Round:
         # Reset the board
         self.board.clear_play_area()
         self.board.clear_crib()
+        self.history = []
         
         # Reset and shuffle the deck
         self.deck.reset()
@@ -68,60 +74,128 @@ class Round:
         """Move to the next player."""
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
         
+    def discard_to_crib(self, player: Player, cards: List[Card]) -> bool:
+        """Discard cards to the crib. Returns True if successful."""
+        # Must discard the correct number of cards
+        # 2 cards in 2-player games, 1 card in 3-player games
+        required_discards = 2 if len(self.players) == 2 else 1
+        if len(cards) != required_discards or len(set(cards)) != len(cards):
+            return False
+            
+        # Verify player has these cards
+        unplayed_mask = player.hand.unplayed_mask
+        if not all(unplayed_mask >> card.code & 1 for card in cards):
+            return False
+            
+        # Add cards to crib
+        for card in cards:
+            player.discard_card(card)
+            self.board.add_to_crib(card)
+            
+        return True
+        
     def play_card(self, player: Player, card: Card) -> Tuple[int, bool]:
         """
         Attempt to play a card. Returns a tuple of:
         - The new count (or -1 if the play is invalid)
-        - Whether the play area should be reset (reached 31 or all players said "go")
+        - Whether the play area should be reset (reached 31)
+        The pegging points scored by the card are awarded to the player and
+        left in last_play_points.
         """
-        if player != self.get_current_player():
+        if player != self.get_current_player() or not player.hand.unplayed_mask >> card.code & 1:
             return -1, False
             
-        new_count = self.board.add_to_play_area(card)
+        new_count = self.board.add_to_play_area(card, self.current_player_index)
         if new_count == -1:
             return -1, False
             
         # Remove the card from the player's hand
         player.play_card(card)
+        self.history.append((PLAY, self.current_player_index, 1 << card.code))
         
-        # Check if we need to reset the play area
-        should_reset = False
-        if new_count == 31:
-            # Player gets 2 points for reaching 31 exactly
-            player.add_points(2)
-            should_reset = True
-        elif self.board.is_play_round_over(len(self.players)):
-            # Last player to play gets 1 point when all players say "go"
-            player.add_points(1)
-            should_reset = True
+        self.last_play_points = dict(self.board.last_play_points)
+        if new_count != 31 and self.is_round_over():
+            # The last card of the play scores 1 unless it made 31
+            self.last_play_points["last card"] = 1
+        player.add_points(sum(self.last_play_points.values()), "pegging")
             
+        # The count starts over after 31, led by the next player
+        should_reset = new_count == 31
         if should_reset:
             self.board.reset_play_area()
-        else:
-            # Only move to next player if we're not resetting
-            self.next_player()
+        self.next_player()
             
         return new_count, should_reset
         
     def player_says_go(self, player: Player) -> bool:
         """
         Record that a player has said "go".
-        Returns True if the play area should be reset (all players have said "go").
+        Returns True if the play area should be reset (all players have said "go"),
+        in which case the player who played the last card scores 1 for the go.
         """
         if player != self.get_current_player():
             return False
             
         self.board.player_says_go(self.current_player_index)
+        self.history.append((GO, self.current_player_index, 0))
         self.next_player()
+        self.last_play_points = {}
         
         if self.board.is_play_round_over(len(self.players)):
+            last_player_index = self.board.last_player_index
+            if last_player_index is not None:
+                self.last_play_points = {"go": 1}
+                self.players[last_player_index].add_points(1, "pegging")
             self.board.reset_play_area()
             return True
         return False
         
+    def apply(self, move: Move) -> None:
+        """
+        Apply a move (see moves) so that it can be reverted with undo.
+        Raises ValueError if the move is not legal.
+        """
+        kind, player_index, _ = move
+        if not 0 <= player_index < len(self.players) or move not in legal_moves(self, self.players[player_index]):
+            raise ValueError(f"Illegal move {move}")
+        player = self.players[player_index]
+        snapshot = self.snapshot()
+        if kind == DISCARD:
+            self.discard_to_crib(player, move_cards(move))
+        elif kind == PLAY:
+            self.play_card(player, move_cards(move)[0])
+        else:
+            self.player_says_go(player)
+        self._undo_log.append(snapshot)
+        
+    def undo(self) -> None:
+        """Revert the most recent move made with apply."""
+        if not self._undo_log:
+            raise ValueError("No moves to undo")
+        self.restore(self._undo_log.pop())
+        
+    def snapshot(self) -> tuple:
+        """
+        Return the state of the round in play as an immutable tuple: the board,
+        the current player, the last play's points, the history, and each
+        player's score and played/discarded cards. Dealt cards are not included.
+        """
+        return (self.board.snapshot(), self.current_player_index,
+                tuple(self.last_play_points.items()), tuple(self.history),
+                tuple(player.snapshot() for player in self.players))
+        
+    def restore(self, snapshot: tuple) -> None:
+        """Restore a state captured by snapshot in this round."""
+        board, self.current_player_index, last_play_points, history, players = snapshot
+        self.board.restore(board)
+        self.history = list(history)
+        self.last_play_points = dict(last_play_points)
+        for player, state in zip(self.players, players):
+            player.restore(state)
+        
     def is_round_over(self) -> bool:
         """Check if the round is over (all cards played)."""
-        return all(len(player.get_playable_cards()) == 0 for player in self.players)
+        return not any(player.hand.has_unplayed_cards() for player in self.players)
         
     def __str__(self) -> str:
         round_state = [f"Round State:"]
@@ -0,0 +1,138 @@
+"""
+Precomputed score database for every 4-card hand and starter.
+
+The database stores one byte per (hand, starter) pair for both hand and crib
+scoring. Hands are addressed by the combinatorial number (colex rank) of their
+sorted card codes and starters by their position among the 48 remaining cards,
+so a lookup is a single index computation and a byte read from the mapped file.
+"""
+import argparse
+import mmap
+import struct
+from math import comb
+from multiprocessing import Pool
+from typing import List, Optional, Sequence, Tuple
+from .cards import ALL_CARDS, Card
+from .scorer import Scorer
+
+MAGIC = b"CRIBSDB"
+VERSION = 1
+HAND_COUNT = comb(52, 4)
+STARTERS_PER_HAND = 48
+ENTRY_COUNT = HAND_COUNT * STARTERS_PER_HAND
+
+# magic, version, entry count
+_HEADER = struct.Struct("<7sBQ")
+
+def hand_index(codes: Sequence[int]) -> int:
+    """Return the colex rank of a set of 4 distinct card codes."""
+    c0, c1, c2, c3 = sorted(codes)
+    return comb(c0, 1) + comb(c1, 2) + comb(c2, 3) + comb(c3, 4)
+
+
+def entry_index(codes: Sequence[int], starter_code: int) -> int:
+    """Return the database offset of a (hand, starter) pair."""
+    below = sum(1 for code in codes if code < starter_code)
+    return hand_index(codes) * STARTERS_PER_HAND + starter_code - below
+
+
+def _score_block(high: int) -> Tuple[int, bytes, bytes]:
+    """Score every hand whose highest card code is `high`.
+
+    Hands sharing a highest card are contiguous in colex order, so the block
+    can be written to the database at a single offset. Returns that offset
+    with the hand and crib score bytes.
+    """
+    cards = ALL_CARDS
+    hand_scores = bytearray()
+    crib_scores = bytearray()
+    for c2 in range(high):
+        for c1 in range(c2):
+            for c0 in range(c1):
+                hand_codes = (c0, c1, c2, high)
+                hand = [cards[code] for code in hand_codes]
+                # Only a 4-card flush scores differently in the crib
+                is_flush = len({code // 13 for code in hand_codes}) == 1
+                for starter_code in range(52):
+                    if starter_code in hand_codes:
+                        continue
+                    starter = cards[starter_code]
+                    hand_scores.append(Scorer.score_hand(hand, starter))
+                    if is_flush:
+                        crib_scores.append(Scorer.score_hand(hand, starter, is_crib=True))
+                    else:
+                        crib_scores.append(hand_scores[-1])
+    return comb(high, 4) * STARTERS_PER_HAND, bytes(hand_scores), bytes(crib_scores)
+
+
+def build_score_database(path: str, processes: Optional[int] = None) -> None:
+    """Score every (hand, starter) pair and write the database to `path`.
+
+    The work is split by highest card across a process pool.
+    """
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, ENTRY_COUNT))
+        f.truncate(_HEADER.size + 2 * ENTRY_COUNT)
+
+    with open(path, "r+b") as f, Pool(processes) as pool:
+        for offset, hand_scores, crib_scores in pool.imap_unordered(_score_block, range(3, 52)):
+            f.seek(_HEADER.size + offset)
+            f.write(hand_scores)
+            f.seek(_HEADER.size + ENTRY_COUNT + offset)
+            f.write(crib_scores)
+
+
+class ScoreDatabase:
+    """Read-only, memory-mapped view of a score database.
+
+    The file is mapped rather than read, so every process that opens the same
+    database shares its pages through the OS page cache.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._check_header()
+        except ValueError:
+            self._mmap.close()
+            raise
+        self.path = path
+
+    def _check_header(self) -> None:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("Not a score database")
+        magic, version, entries = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError("Not a score database")
+        if version != VERSION:
+            raise ValueError(f"Unsupported score database version {version}")
+        if entries != ENTRY_COUNT or len(self._mmap) != _HEADER.size + 2 * entries:
+            raise ValueError("Score database is truncated")
+
+    def lookup(self, cards: List[Card], starter: Card, is_crib: bool = False) -> int:
+        """Return the stored score of a hand with the given starter card."""
+        if starter in cards:
+            raise ValueError("Starter card cannot be part of the hand")
+        offset = entry_index([card.code for card in cards], starter.code)
+        if is_crib:
+            offset += ENTRY_COUNT
+        return self._mmap[_HEADER.size + offset]
+
+    def close(self) -> None:
+        """Unmap the database file."""
+        self._mmap.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed cribbage score database.")
+    parser.add_argument("output", help="path of the database file to write")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    print(f"Scoring {ENTRY_COUNT:,} hand/starter pairs...")
+    build_score_database(args.output, args.processes)
+    print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,229 @@
-from typing import List, Set, Tuple
-from .cards import Card
-from itertools import combinations
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from .cards import ALL_CARDS, Card
+from itertools import combinations, combinations_with_replacement
+import numpy as np
+
+# Optional precomputed score database used by score_hand (see score_db)
+_database = None
+
+
+def _pack_ranks(ranks: Sequence[int]) -> int:
+    """Pack sorted ranks into an integer key, 4 bits per rank."""
+    key = 0
+    for rank in ranks:
+        key = key << 4 | rank
+    return key
+
+
+def _count_fifteens(values: Sequence[int]) -> int:
+    """Count subsets of card values summing to 15 via a subset-sum table."""
+    ways = [1] + [0] * 15
+    for value in values:
+        for total in range(15, value - 1, -1):
+            ways[total] += ways[total - value]
+    # No single card is worth 15, so every subset counted has 2+ cards
+    return ways[15]
+
+
+def _count_pairs(counts: Sequence[int]) -> int:
+    """Count pairs from a rank histogram."""
+    return sum(count * (count - 1) // 2 for count in counts)
+
+
+def _count_runs(counts: Sequence[int]) -> Tuple[int, int]:
+    """Return (run length, number of runs) from a rank histogram.
+
+    The histogram is indexed by rank and must end with a zero sentinel
+    (index 14). A run's multiplicity is the product of the counts of its
+    ranks; five cards hold at most one run of 3 or more.
+    """
+    rank = 1
+    while rank <= 13:
+        length = 0
+        ways = 1
+        while counts[rank + length]:
+            ways *= counts[rank + length]
+            length += 1
+        if length >= 3:
+            return length, ways
+        rank += length + 1
+    return 0, 0
+
+
+def _rank_histogram(ranks: Sequence[int]) -> List[int]:
+    """Count cards per rank, padded with zeros at index 0 and 14."""
+    counts = [0] * 15
+    for rank in ranks:
+        counts[rank] += 1
+    return counts
+
+
+def _rank_points(ranks: Sequence[int]) -> int:
+    """Points from fifteens, pairs and runs for a sorted tuple of up to five ranks.
+
+    These categories ignore suits, so they are a function of the rank
+    multiset alone.
+    """
+    counts = _rank_histogram(ranks)
+    run_length, runs = _count_runs(counts)
+    return (_count_fifteens([min(rank, 10) for rank in ranks]) * 2
+            + _count_pairs(counts) * 2
+            + run_length * runs)
+
+
+def _build_rank_table() -> Dict[int, int]:
+    """Map every possible multiset of up to five ranks to its rank-only points.
+
+    Ranks are never 0, so packed keys of different lengths cannot collide.
+    """
+    table = {}
+    for size in range(1, 6):
+        for ranks in combinations_with_replacement(range(1, 14), size):
+            # No rank appears more than four times in a deck
+            if size == 5 and ranks[0] == ranks[4]:
+                continue
+            table[_pack_ranks(ranks)] = _rank_points(ranks)
+    return table
+
+
+# Subsets of five cards with two or more members as 0/1 columns, so that
+# card values @ _SUBSETS gives every subset sum
+_SUBSETS = np.array([[(mask >> i) & 1 for mask in range(32) if bin(mask).count("1") >= 2]
+                     for i in range(5)], dtype=np.float32)
+
+# Fifteens, pairs and runs points keyed by packed sorted ranks (~8.5k entries)
+_RANK_TABLE = _build_rank_table()
+
+
+def _flush_points(cards: Sequence[Card], starter: Card, is_crib: bool) -> int:
+    """Points for a flush in a 4-card hand: 5 with the starter, 4 without it except in the crib."""
+    suit = cards[0].suit
+    if cards[1].suit == suit and cards[2].suit == suit and cards[3].suit == suit:
+        if starter.suit == suit:
+            return 5
+        if not is_crib:
+            return 4
+    return 0
+
+
+def _nobs_points(cards: Sequence[Card], starter: Card) -> int:
+    """1 for holding the jack of the starter's suit."""
+    suit = starter.suit
+    for card in cards:
+        if card.rank == 11 and card.suit == suit:
+            return 1
+    return 0
+
+
+class ScoreBreakdown:
+    """A hand's score by category, from a single evaluation.
+
+    The counts and points are worked out when the breakdown is made; the
+    combinations behind them (the cards making each fifteen, pair and run)
+    are only listed when first asked for.
+    """
+    __slots__ = ("cards", "starter", "is_crib", "fifteens", "pairs", "run_length", "runs",
+                 "flush", "nobs", "_fifteen_combos", "_pair_combos", "_run_combos")
+
+    def __init__(self, cards: List[Card], starter: Card, is_crib: bool = False):
+        self.cards = list(cards)
+        self.starter = starter
+        self.is_crib = is_crib
+        all_cards = self.cards + [starter]
+        counts = _rank_histogram(card.rank for card in all_cards)
+        self.fifteens = _count_fifteens([card.value for card in all_cards])
+        self.pairs = _count_pairs(counts)
+        self.run_length, self.runs = _count_runs(counts)
+        self.flush = _flush_points(self.cards, starter, is_crib)
+        self.nobs = _nobs_points(self.cards, starter)
+        self._fifteen_combos: Optional[List[Tuple[Card, ...]]] = None
+        self._pair_combos: Optional[List[Tuple[Card, Card]]] = None
+        self._run_combos: Optional[List[List[Card]]] = None
+
+    @property
+    def points(self) -> Dict[str, int]:
+        """Points per category."""
+        return {"fifteens": self.fifteens * 2, "pairs": self.pairs * 2,
+                "runs": self.run_length * self.runs, "flush": self.flush, "nobs": self.nobs}
+
+    @property
+    def total(self) -> int:
+        return self.fifteens * 2 + self.pairs * 2 + self.run_length * self.runs + self.flush + self.nobs
+
+    @property
+    def fifteen_combos(self) -> List[Tuple[Card, ...]]:
+        if self._fifteen_combos is None:
+            self._fifteen_combos = Scorer.find_fifteens(self.cards + [self.starter])
+        return self._fifteen_combos
+
+    @property
+    def pair_combos(self) -> List[Tuple[Card, Card]]:
+        if self._pair_combos is None:
+            self._pair_combos = Scorer.find_pairs(self.cards + [self.starter])
+        return self._pair_combos
+
+    @property
+    def run_combos(self) -> List[List[Card]]:
+        if self._run_combos is None:
+            self._run_combos = Scorer.find_runs(self.cards + [self.starter]) if self.runs else []
+        return self._run_combos
+
+    @property
+    def nobs_card(self) -> Optional[Card]:
+        """The jack scoring nobs, if any."""
+        for card in self.cards:
+            if card.rank == 11 and card.suit == self.starter.suit:
+                return card
+        return None
+
+
+def _starter_points(cards: List[Card], is_crib: bool = False) -> Tuple[List[int], List[int]]:
+    """Split the score of `cards` plus any starter into rank and suit parts.
+
+    Returns (by_rank, by_suit) such that the score with a given starter is
+    by_rank[starter.rank] + by_suit[starter suit index]. With four cards
+    this is exactly score_hand; with fewer it scores those cards alone.
+    """
+    ranks = sorted(card.rank for card in cards)
+    counts = _rank_histogram(ranks)
+    by_rank = [0] * 14
+    for rank in range(1, 14):
+        if counts[rank] < 4:
+            # Fifteens, pairs and runs with the starter in one table lookup
+            by_rank[rank] = _RANK_TABLE[_pack_ranks(sorted(ranks + [rank]))]
+
+    by_suit = [0] * 4
+    suits = {card.code // 13 for card in cards}
+    if len(cards) == 4 and len(suits) == 1:
+        for suit in range(4):
+            if suit in suits:
+                by_suit[suit] += 5
+            elif not is_crib:
+                by_suit[suit] += 4
+    for card in cards:
+        if card.rank == 11:
+            by_suit[card.code // 13] += 1
+    return by_rank, by_suit
 
 class Scorer:
+    @staticmethod
+    def load_database(path: str) -> None:
+        """Answer score_hand from the memory-mapped score database at `path`."""
+        global _database
+        from .score_db import ScoreDatabase
+        database = ScoreDatabase(path)
+        if _database is not None:
+            _database.close()
+        _database = database
+
+    @staticmethod
+    def unload_database() -> None:
+        """Stop using the score database and unmap it."""
+        global _database
+        if _database is not None:
+            _database.close()
+            _database = None
+
     @staticmethod
     def find_fifteens(cards: List[Card]) -> List[Tuple[Card, ...]]:
         """Find all combinations of cards that sum to 15."""
@@ -72,6 +293,28 @@ class Scorer:
                 
         return runs
 
+    @staticmethod
+    def count_fifteens(cards: List[Card]) -> int:
+        """Count the combinations of cards that sum to 15 without listing them."""
+        return _count_fifteens([card.value for card in cards])
+
+    @staticmethod
+    def count_pairs(cards: List[Card]) -> int:
+        """Count the pairs of cards with the same rank without listing them."""
+        return _count_pairs(_rank_histogram(card.rank for card in cards))
+
+    @staticmethod
+    def count_runs(cards: List[Card]) -> Tuple[int, int]:
+        """Return the run length and number of runs without listing them.
+
+        For example, [3♥,4♥,5♥,4♦,5♦] gives (3, 4). Returns (0, 0) if
+        there is no run of 3 or more. At most five cards are allowed, since
+        more can hold two separate runs.
+        """
+        if len(cards) > 5:
+            raise ValueError("count_runs takes at most five cards")
+        return _count_runs(_rank_histogram(card.rank for card in cards))
+
     @staticmethod
     def find_flush(cards: List[Card], starter: Card, is_crib: bool = False) -> int:
         """Find if there is a flush and return the points.
@@ -118,30 +361,106 @@ class Scorer:
         # validate the hand
         if not Scorer.is_valid_hand(cards):
             raise ValueError("Invalid hand")
+
+        if _database is not None:
+            return _database.lookup(cards, starter, is_crib)
         
-        all_cards = cards + [starter]
-        points = 0
+        c0, c1, c2, c3 = cards
+
+        # Score fifteens, pairs and runs from the rank table (the sum of
+        # ScoreBreakdown's rank categories)
+        r0, r1, r2, r3, r4 = sorted((c0.rank, c1.rank, c2.rank, c3.rank, starter.rank))
+        points = _RANK_TABLE[(((r0 << 4 | r1) << 4 | r2) << 4 | r3) << 4 | r4]
+
+        return points + _flush_points(cards, starter, is_crib) + _nobs_points(cards, starter)
+
+    @staticmethod
+    def breakdown(cards: List[Card], starter: Card, is_crib: bool = False) -> "ScoreBreakdown":
+        """Score a hand once, by category (see ScoreBreakdown)."""
+        if not Scorer.is_valid_hand(cards):
+            raise ValueError("Invalid hand")
+        return ScoreBreakdown(cards, starter, is_crib)
+
+    @staticmethod
+    def score_against_all_starters(cards: List[Card], is_crib: bool = False, excluded: Sequence[Card] = (),
+                                   histogram: bool = False):
+        """Score four cards with every possible starter.
+
+        The starters are the cards not in the hand or `excluded` (e.g. the
+        discards, leaving 46), in code order; `excluded` must hold distinct
+        cards that are not in the hand. Returns their scores, equal to
+        score_hand with each starter, or with `histogram` a dict from score
+        to the number of starters giving it. The four cards' part of the
+        score is worked out once and each starter only adds its rank's and
+        suit's share, so this is far cheaper than a score_hand per starter.
+        """
+        if not Scorer.is_valid_hand(cards):
+            raise ValueError("Invalid hand")
+        seen = set(cards)
+        seen.update(excluded)
+        if len(seen) != len(cards) + len(excluded):
+            raise ValueError("Excluded cards must be distinct and not in the hand")
+        by_rank, by_suit = _starter_points(cards, is_crib)
+        scores = [by_rank[card.rank] + by_suit[card.code // 13] for card in ALL_CARDS if card not in seen]
+        if not histogram:
+            return scores
+        counts = {}
+        for score in scores:
+            counts[score] = counts.get(score, 0) + 1
+        return dict(sorted(counts.items()))
+
+    @staticmethod
+    def score_hands_batch(cards: np.ndarray, is_crib: bool = False) -> np.ndarray:
+        """Score many hands at once.
+
+        `cards` is an (N, 5) array of card codes (see Card.code); the first
+        four columns are the hand and the last is the starter. Returns an
+        array of N scores equal to score_hand on each row.
+        """
+        cards = np.asarray(cards)
+        if cards.ndim != 2 or cards.shape[1] != 5:
+            raise ValueError("Expected an (N, 5) array of card codes")
+        if cards.size and (cards.min() < 0 or cards.max() > 51):
+            raise ValueError("Card codes must be between 0 and 51")
+        # Card codes, counts and run multiplicities all fit in a byte
+        cards = cards.astype(np.int8)
+        if (np.diff(np.sort(cards, axis=1), axis=1) == 0).any():
+            raise ValueError("Invalid hand")
+
+        n = len(cards)
+        ranks = cards % 13
+        suits = cards // 13
 
-        # Score fifteens
-        fifteens = Scorer.find_fifteens(all_cards)
-        points += len(fifteens) * 2
+        # Score fifteens: sum of every subset of card values
+        values = np.minimum(ranks + 1, 10).astype(np.float32)
+        points = ((values @ _SUBSETS) == 15).sum(axis=1) * 2
 
-        # Score pairs
-        pairs = Scorer.find_pairs(all_cards)
-        points += len(pairs) * 2
+        # Score pairs from the rank histogram
+        rows = np.arange(0, n * 13, 13)[:, None]
+        counts = np.bincount((rows + ranks).ravel(), minlength=n * 13).astype(np.int8).reshape(n, 13)
+        points += (counts * (counts - 1)).sum(axis=1)
 
-        # Score runs
-        runs = Scorer.find_runs(all_cards)
-        if runs:
-            # Count all valid runs
-            points += len(runs) * len(runs[0])
+        # Score runs: the product of the counts over a window of consecutive
+        # ranks is the number of runs through it. Five cards hold at most one
+        # run, so the longest window with any runs wins.
+        runs3 = counts[:, :-2] * counts[:, 1:-1] * counts[:, 2:]
+        runs4 = runs3[:, :-1] * counts[:, 3:]
+        runs5 = runs4[:, :-1] * counts[:, 4:]
+        run_points = runs3.sum(axis=1) * 3
+        for length, runs in ((4, runs4), (5, runs5)):
+            total = runs.sum(axis=1)
+            run_points = np.where(total > 0, total * length, run_points)
+        points += run_points
 
         # Score flush
-        points += Scorer.find_flush(cards, starter, is_crib)
+        flush = (suits[:, 1:4] == suits[:, :1]).all(axis=1)
+        five_card = flush & (suits[:, 4] == suits[:, 0])
+        points += five_card * 5
+        if not is_crib:
+            points += (flush & ~five_card) * 4
 
         # Score nobs
-        if Scorer.find_nobs(cards, starter):
-            points += 1
+        points += ((ranks[:, :4] == 10) & (suits[:, :4] == suits[:, 4:])).any(axis=1)
 
         return points
 
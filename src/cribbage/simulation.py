@@ -1,69 +1,286 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from .cards import Card, Suit
 from .player import Player
 from .game import Game
+from .fast_round import play_fast_game
+from .strategy import BatchedStrategy, BatchStrategy, RandomStrategy, decide_batch
+from multiprocessing import Pool
+import argparse
 import random
+import time
 
-def simulate_game(player_names: List[str]) -> None:
-    """Simulate a complete game of cribbage between the given players."""
-    # Create players
-    players = [Player(name) for name in player_names]
-    game = Game(players)
+class SimulationResults:
+    """Aggregated results of many simulated games between the same players."""
+
+    def __init__(self, player_names: Sequence[str]):
+        self.player_names = list(player_names)
+        self.games = 0
+        self.wins = [0] * len(player_names)  # Games won, by player index
+        self.margins: Dict[int, int] = {}  # Winning margin -> number of games
+        # Points scored in each category, by player index
+        self.points_by_category: List[Dict[str, int]] = [{} for _ in player_names]
+        self.elapsed = 0.0  # Wall-clock seconds spent simulating
+        self.seed: Optional[int] = None  # Root seed of the run, for replaying games
+
+    def record(self, game: Game) -> None:
+        """Add a finished game to the results."""
+        winner = game.get_winner()
+        self.games += 1
+        if winner is not None:
+            self.wins[game.players.index(winner)] += 1
+            runner_up = max(player.score for player in game.players if player is not winner)
+            margin = winner.score - runner_up
+            self.margins[margin] = self.margins.get(margin, 0) + 1
+        for totals, player in zip(self.points_by_category, game.players):
+            for category, points in player.points_by_category.items():
+                totals[category] = totals.get(category, 0) + points
+
+    def merge(self, other: "SimulationResults") -> None:
+        """Add the games of another set of results to these."""
+        self.games += other.games
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        for margin, count in other.margins.items():
+            self.margins[margin] = self.margins.get(margin, 0) + count
+        for totals, other_totals in zip(self.points_by_category, other.points_by_category):
+            for category, points in other_totals.items():
+                totals[category] = totals.get(category, 0) + points
+        self.elapsed += other.elapsed
+
+    @property
+    def mean_margin(self) -> float:
+        """Average number of points the winner won by."""
+        decided = sum(self.margins.values())
+        if not decided:
+            return 0.0
+        return sum(margin * count for margin, count in self.margins.items()) / decided
+
+    @property
+    def games_per_second(self) -> float:
+        if not self.elapsed:
+            return 0.0
+        return self.games / self.elapsed
+
+    def __str__(self) -> str:
+        lines = [f"{self.games} games in {self.elapsed:.2f}s ({self.games_per_second:.0f} games/s)"]
+        if self.seed is not None:
+            lines.append(f"Seed: {self.seed}")
+        for name, wins, totals in zip(self.player_names, self.wins, self.points_by_category):
+            rate = wins / self.games if self.games else 0.0
+            per_game = ", ".join(f"{category} {points / max(self.games, 1):.2f}"
+                                 for category, points in sorted(totals.items()))
+            lines.append(f"{name}: {wins} wins ({rate:.1%}); points per game: {per_game}")
+        lines.append(f"Mean winning margin: {self.mean_margin:.2f}")
+        return "\n".join(lines)
+
+def play_round(game: Game, strategies: Sequence) -> None:
+    """Play the discard and play phases of the game's current round.
+
+    Each player's decisions are made by the strategy at the same index.
+    Play stops early if a player reaches 121 while pegging.
+    """
+    game.play_round(strategies)
+
+def play_game(game: Game, strategies: Sequence) -> None:
+    """Play a started game to completion."""
+    game.play(strategies)
+
+def game_rng(seed: int, game_index: int) -> random.Random:
+    """Return the independent random stream for one game of a seeded run.
+
+    Every game's shuffles and random choices come from its own stream, so any
+    game can be replayed from the run's seed and its index alone.
+    """
+    return random.Random(f"{seed}:{game_index}")
+
+def _seeded_game(players: List[Player], seed: int, game_index: int,
+                 strategies: Optional[Sequence] = None, trace: bool = False) -> Game:
+    """Create game `game_index` of a seeded run, with its first dealer chosen but not dealt."""
+    rng = game_rng(seed, game_index)
+    game = Game(players, rng, verbose=trace, strategies=strategies)
+    game.dealer_index = rng.randrange(len(players))
+    return game
+
+def start_seeded_game(players: List[Player], seed: int, game_index: int,
+                      strategies: Optional[Sequence] = None, trace: bool = False) -> Game:
+    """Deal the first round of game `game_index` of the run with the given seed.
+
+    The first dealer is chosen at random from the game's stream.
+    """
+    game = _seeded_game(players, seed, game_index, strategies, trace)
     game.start()
-    
-    print("Starting new game of cribbage!")
-    print(game)
-    
-    while not game.is_game_over():
-        # Discard phase
-        print("\nDiscard phase:")
-        for player in game.players:
-            # In 3-player games, each player discards 1 card
-            # In 2-player games, each player discards 2 cards
-            num_discards = 1 if len(players) == 3 else 2
-            cards = random.sample(player.get_playable_cards(), num_discards)
-            game.discard_to_crib(player, cards)
-            print(f"{player.name} discarded {', '.join(str(card) for card in cards)} to the crib")
-            
-        # Play phase
-        print("\nPlay phase:")
-        while not game.current_round.is_round_over():
-            current_player = game.current_round.get_current_player()
-            playable_cards = current_player.get_playable_cards()
-            
-            # Find valid plays
-            valid_plays = []
-            for card in playable_cards:
-                if game.current_round.board.play_count + card.value <= 31:
-                    valid_plays.append(card)
-                    
-            if valid_plays:
-                # Play a random valid card
-                card = random.choice(valid_plays)
-                game.play_card(current_player, card)
-                print(f"{current_player.name} played {card}")
-            else:
-                # Say "go" if no valid plays
-                game.player_says_go(current_player)
-                print(f"{current_player.name} says 'go'")
-                
-        # Score phase
-        print("\nScoring phase:")
-        game.score_hands()
+    if trace:
+        print("Starting new game of cribbage!")
         print(game)
-        
-        # Advance to next round
-        game.advance_round()
-        
+    return game
+
+def play_seeded_game(players: List[Player], seed: int, game_index: int,
+                     strategies: Sequence, trace: bool = False, fast: bool = False) -> Game:
+    """Play game `game_index` of the run with the given seed and return it.
+
+    With `fast` the game is played on the integer fast path (see
+    fast_round), which can't trace the game.
+    """
+    if fast:
+        if trace:
+            raise ValueError("The fast path can't trace a game")
+        game = _seeded_game(players, seed, game_index, strategies)
+        play_fast_game(game)
+        return game
+    game = start_seeded_game(players, seed, game_index, strategies, trace)
+    game.play()
+    return game
+
+def simulate_game(player_names: List[str], strategies: Optional[Sequence] = None,
+                  seed: Optional[int] = None, game_index: int = 0) -> None:
+    """Simulate a complete game of cribbage between the given players, printing every event.
+
+    With a seed this replays game `game_index` of a simulate_games run with
+    the same seed.
+    """
+    # Create players
+    players = [Player(name) for name in player_names]
+    if strategies is None:
+        strategies = [RandomStrategy() for _ in players]
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    game = play_seeded_game(players, seed, game_index, strategies, trace=True)
+
     # Game over
     winner = game.get_winner()
     print(f"\nGame over! {winner.name} wins with {winner.score} points!")
 
+def _simulate_range(player_names: Sequence[str], seed: int, strategies: Optional[Sequence],
+                    start: int, stop: int, fast: bool = False) -> SimulationResults:
+    """Play games start..stop-1 of a seeded run quietly."""
+    players = [Player(name) for name in player_names]
+    if strategies is None:
+        strategies = [RandomStrategy() for _ in players]
+    results = SimulationResults(player_names)
+    for game_index in range(start, stop):
+        results.record(play_seeded_game(players, seed, game_index, strategies, fast=fast))
+    return results
+
+def _simulate_chunk(args) -> SimulationResults:
+    return _simulate_range(*args)
+
+def simulate_games(n: int, player_names: Sequence[str], seed: Optional[int] = None,
+                   strategies: Optional[Sequence] = None, processes: int = 1,
+                   chunk_size: int = 1000, fast: bool = False) -> SimulationResults:
+    """Simulate `n` games without any output and return the aggregated results.
+
+    Each game draws from its own random stream derived from `seed` (random
+    if not given; see SimulationResults.seed), so the results are the same
+    for any number of processes or chunk size. With processes > 1 the games
+    are split into chunks of `chunk_size` and spread across a process pool;
+    strategies must then be picklable. With `fast` games are played on the
+    integer fast path, with the same results.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+
+    start = time.perf_counter()
+    if processes == 1:
+        results = _simulate_range(player_names, seed, strategies, 0, n, fast)
+    else:
+        chunks = [(player_names, seed, strategies, first, min(first + chunk_size, n), fast)
+                  for first in range(0, n, chunk_size)]
+        results = SimulationResults(player_names)
+        with Pool(processes) as pool:
+            for chunk_results in pool.imap_unordered(_simulate_chunk, chunks):
+                results.merge(chunk_results)
+    results.seed = seed
+    results.elapsed = time.perf_counter() - start
+    return results
+
+def compare_engines(n: int, player_names: Sequence[str], seed: Optional[int] = None,
+                    strategies: Optional[Sequence] = None) -> int:
+    """Play games 0..n-1 of a seeded run on both engines and check they agree.
+
+    Raises AssertionError naming the first game whose scores differ between
+    Game and the fast path. Returns the seed.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    players = [Player(name) for name in player_names]
+    if strategies is None:
+        strategies = [RandomStrategy() for _ in players]
+    for game_index in range(n):
+        expected = [(player.score, dict(player.points_by_category))
+                    for player in play_seeded_game(players, seed, game_index, strategies).players]
+        actual = [(player.score, dict(player.points_by_category))
+                  for player in play_seeded_game(players, seed, game_index, strategies, fast=True).players]
+        if actual != expected:
+            raise AssertionError(f"Game {game_index} of seed {seed}: Game scored {expected}, "
+                                 f"the fast path scored {actual}")
+    return seed
+
+def simulate_games_batched(n: int, player_names: Sequence[str], seed: Optional[int] = None,
+                           strategies: Optional[Sequence[BatchStrategy]] = None,
+                           batch_size: int = 256) -> SimulationResults:
+    """Simulate `n` games, `batch_size` at a time in lockstep, and return the results.
+
+    Each step gathers the pending decision of every unfinished game in the
+    batch and hands those of each seat to that seat's batch strategy in a
+    single call. Games draw from the same random streams as simulate_games,
+    so with equivalent strategies the results are identical.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    if strategies is None:
+        strategies = [BatchedStrategy(RandomStrategy()) for _ in player_names]
+
+    start = time.perf_counter()
+    results = SimulationResults(player_names)
+    for first in range(0, n, batch_size):
+        games = [start_seeded_game([Player(name) for name in player_names], seed, game_index)
+                 for game_index in range(first, min(first + batch_size, n))]
+        while games:
+            pending = []
+            for game in games:
+                request = game.next_request()
+                # Deal again until there is a decision to make or the game is over
+                while request is None and not game.is_game_over():
+                    game.advance_round()
+                    request = game.next_request()
+                if request is None:
+                    results.record(game)
+                else:
+                    pending.append((game, request))
+            for seat, strategy in enumerate(strategies):
+                seat_pending = [(game, request) for game, request in pending if request.player_index == seat]
+                if seat_pending:
+                    answers = decide_batch(strategy, [request for _, request in seat_pending])
+                    for (game, request), answer in zip(seat_pending, answers):
+                        game.apply_choice(request, answer)
+            games = [game for game, _ in pending]
+    results.seed = seed
+    results.elapsed = time.perf_counter() - start
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate games of cribbage between random players.")
+    parser.add_argument("--games", type=int, default=None,
+                        help="simulate this many games quietly and report the results")
+    parser.add_argument("--players", nargs="+", default=["Alice", "Bob"], help="player names")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes for --games")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="games per worker task")
+    parser.add_argument("--replay", type=int, default=None, metavar="INDEX",
+                        help="trace game INDEX of the run with the given --seed")
+    parser.add_argument("--fast", action="store_true", help="play --games on the integer fast path")
+    parser.add_argument("--check-engines", type=int, default=None, metavar="N",
+                        help="play N seeded games on both engines and check the scores agree")
+    args = parser.parse_args()
+
+    if args.check_engines is not None:
+        seed = compare_engines(args.check_engines, args.players, args.seed)
+        print(f"{args.check_engines} games agree on both engines (seed {seed})")
+    elif args.games is None:
+        # Trace a single game
+        simulate_game(args.players, seed=args.seed, game_index=args.replay or 0)
+    else:
+        print(simulate_games(args.games, args.players, args.seed, processes=args.processes,
+                             chunk_size=args.chunk_size, fast=args.fast))
+
 if __name__ == "__main__":
-    # Example usage with 2 players
-    print("=== 2 Player Game ===")
-    simulate_game(["Alice", "Bob"])
-    
-    # Example usage with 3 players
-    print("\n=== 3 Player Game ===")
-    simulate_game(["Alice", "Bob", "Charlie"]) 
\ No newline at end of file
+    main()
@@ -0,0 +1,124 @@
+"""
+Decision-making for simulated players.
+
+A strategy is any object with `choose_discard(request)` and
+`choose_play(request)` methods (see Strategy). The requests carry everything
+a player can see when making the decision, so strategies don't depend on the
+engine that is running the game.
+
+A batch strategy (see BatchStrategy) answers the pending decisions of many
+games in one call, so that strategies with a large fixed cost per call, such
+as NumPy or model-based ones, can spread it over a whole batch of games.
+BatchedStrategy adapts any strategy to the batched interface.
+"""
+import random
+from typing import List, Optional, Protocol, Sequence, Tuple, Union
+from .cards import Card
+from .moves import Move
+
+
+class DiscardRequest:
+    """A player's view of the game when discarding to the crib."""
+    __slots__ = ("player_index", "hand", "num_discards", "is_dealer", "scores", "rng", "legal_moves")
+
+    def __init__(self, player_index: int, hand: List[Card], num_discards: int,
+                 is_dealer: bool, scores: List[int], rng: random.Random,
+                 legal_moves: Tuple[Move, ...] = ()):
+        self.player_index = player_index
+        self.hand = hand  # The cards dealt to the player
+        self.num_discards = num_discards
+        self.is_dealer = is_dealer
+        self.scores = scores  # Every player's score, by player index
+        self.rng = rng  # Random source for the game, for reproducible choices
+        self.legal_moves = legal_moves  # Every possible discard (see moves.legal_moves)
+
+
+class PlayRequest:
+    """A player's view of the game when it is their turn to play."""
+    __slots__ = ("player_index", "hand", "valid_plays", "play_count", "play_area",
+                 "starter", "is_dealer", "scores", "rng", "legal_moves", "history", "discarded")
+
+    def __init__(self, player_index: int, hand: List[Card], valid_plays: List[Card],
+                 play_count: int, play_area: List[Card], starter: Card,
+                 is_dealer: bool, scores: List[int], rng: random.Random,
+                 legal_moves: Tuple[Move, ...] = (), history: Tuple[Move, ...] = (),
+                 discarded: Tuple[Card, ...] = ()):
+        self.player_index = player_index
+        self.hand = hand  # The player's unplayed cards
+        self.valid_plays = valid_plays  # Unplayed cards that fit under 31
+        self.play_count = play_count
+        self.play_area = play_area  # Cards played since the count was last reset
+        self.starter = starter
+        self.is_dealer = is_dealer
+        self.scores = scores
+        self.rng = rng
+        self.legal_moves = legal_moves  # The valid plays as moves, or a go
+        self.history = history  # Every play and go of the round so far (see Round.history)
+        self.discarded = discarded  # The cards the player threw to the crib
+
+
+class RandomStrategy:
+    """Discards and plays uniformly at random."""
+
+    def choose_discard(self, request: DiscardRequest) -> List[Card]:
+        return request.rng.sample(request.hand, request.num_discards)
+
+    def choose_play(self, request: PlayRequest) -> Optional[Card]:
+        """Return a card to play, or None to say "go"."""
+        if not request.valid_plays:
+            return None
+        return request.rng.choice(request.valid_plays)
+
+
+class Strategy(Protocol):
+    """Makes one player's decisions."""
+
+    def choose_discard(self, request: DiscardRequest) -> List[Card]:
+        """Return the cards to throw to the crib."""
+
+    def choose_play(self, request: PlayRequest) -> Optional[Card]:
+        """Return a card to play, or None to say "go"."""
+
+
+class BatchStrategy(Protocol):
+    """Makes one player's decisions in many games at once."""
+
+    def choose_discards(self, requests: Sequence[DiscardRequest]) -> List[List[Card]]:
+        """Return the cards to throw to the crib for each request."""
+
+    def choose_plays(self, requests: Sequence[PlayRequest]) -> List[Optional[Card]]:
+        """Return the card to play, or None to say "go", for each request."""
+
+
+class BatchedStrategy:
+    """Answers a batch of requests by asking a strategy about each in turn."""
+
+    def __init__(self, strategy: Strategy):
+        self.strategy = strategy
+
+    def choose_discards(self, requests: Sequence[DiscardRequest]) -> List[List[Card]]:
+        return [self.strategy.choose_discard(request) for request in requests]
+
+    def choose_plays(self, requests: Sequence[PlayRequest]) -> List[Optional[Card]]:
+        return [self.strategy.choose_play(request) for request in requests]
+
+
+def decide(strategy: Strategy, request: Union[DiscardRequest, PlayRequest]):
+    """Return a strategy's answer to a discard or play request."""
+    if isinstance(request, DiscardRequest):
+        return strategy.choose_discard(request)
+    return strategy.choose_play(request)
+
+
+def decide_batch(strategy: BatchStrategy, requests: Sequence[Union[DiscardRequest, PlayRequest]]) -> list:
+    """Return a batch strategy's answers to a mix of discard and play requests, in order."""
+    discards = [i for i, request in enumerate(requests) if isinstance(request, DiscardRequest)]
+    plays = [i for i, request in enumerate(requests) if not isinstance(request, DiscardRequest)]
+    answers = [None] * len(requests)
+    if discards:
+        for i, answer in zip(discards, strategy.choose_discards([requests[i] for i in discards])):
+            answers[i] = answer
+    if plays:
+        for i, answer in zip(plays, strategy.choose_plays([requests[i] for i in plays])):
+            answers[i] = answer
+    return answers
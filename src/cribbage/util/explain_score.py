@@ -14,66 +14,58 @@ def explain_score(hand: List[Card], starter: Card, is_crib: bool = False) -> str
     Returns:
         A string explaining the scoring breakdown
     """
-    all_cards = hand + [starter]
+    breakdown = Scorer.breakdown(hand, starter, is_crib)
     explanation = []
 
     # Print the hand in a pretty format and starter card and whether or not its a crib
     explanation.append(f"Hand: {' '.join([str(card) for card in hand])} | Starter: {starter} | Crib: {is_crib}\n")
     
     # Score 15s
-    fifteens = Scorer.find_fifteens(all_cards)
-    if fifteens:
-        explanation.append(f"Fifteens ({len(fifteens)} for 2 points each):")
-        for combo in fifteens:
+    if breakdown.fifteens:
+        explanation.append(f"Fifteens ({breakdown.fifteens} for 2 points each):")
+        for combo in breakdown.fifteen_combos:
             cards_str = " + ".join(str(card) for card in combo)
             explanation.append(f"  {cards_str} = 15")
-        explanation.append(f"  Total: {len(fifteens) * 2} points")
+        explanation.append(f"  Total: {breakdown.fifteens * 2} points")
     else:
         explanation.append("No fifteens")
     
     # Score pairs
-    pairs = Scorer.find_pairs(all_cards)
-    if pairs:
-        explanation.append(f"\nPairs ({len(pairs)} for 2 points each):")
-        for card1, card2 in pairs:
+    if breakdown.pairs:
+        explanation.append(f"\nPairs ({breakdown.pairs} for 2 points each):")
+        for card1, card2 in breakdown.pair_combos:
             explanation.append(f"  {card1} and {card2}")
-        explanation.append(f"  Total: {len(pairs) * 2} points")
+        explanation.append(f"  Total: {breakdown.pairs * 2} points")
     else:
         explanation.append("\nNo pairs")
     
     # Score runs
-    run_length, run_cards, total_runs = Scorer.find_runs(all_cards)
-    if run_length > 0:
-        explanation.append(f"\nRun of {run_length} ({total_runs} for {run_length} points each):")
-        for card in run_cards:
-            explanation.append(f"  {card}")
-        explanation.append(f"  Total: {run_length * total_runs} points")
+    run_length = breakdown.run_length
+    if run_length:
+        explanation.append(f"\nRun of {run_length} ({breakdown.runs} for {run_length} points each):")
+        for run in breakdown.run_combos:
+            explanation.append(f"  {' '.join(str(card) for card in run)}")
+        explanation.append(f"  Total: {run_length * breakdown.runs} points")
     else:
         explanation.append("\nNo runs")
     
     # Score flush
-    has_flush, flush_points = Scorer.find_flush(hand, starter, is_crib)
-    if has_flush:
+    if breakdown.flush:
         if is_crib:
             explanation.append(f"\n5-card flush in crib: 5 points")
         else:
-            if flush_points == 5:
-                explanation.append(f"\n5-card flush: 5 points")
-            else:
-                explanation.append(f"\n4-card flush: 4 points")
+            explanation.append(f"\n{breakdown.flush}-card flush: {breakdown.flush} points")
     else:
         explanation.append("\nNo flush")
     
     # Score nobs
-    has_nobs, nobs_card = Scorer.find_nobs(hand, starter)
-    if has_nobs:
-        explanation.append(f"\nNobs (Jack of {starter.suit.value}): 1 point")
+    if breakdown.nobs:
+        explanation.append(f"\nNobs ({breakdown.nobs_card}, the Jack of {starter.suit.value}): 1 point")
     else:
         explanation.append("\nNo nobs")
     
     # Calculate total
-    total = Scorer.score_hand(hand, starter, is_crib)
-    explanation.append(f"\nTotal score: {total} points")
+    explanation.append(f"\nTotal score: {breakdown.total} points")
     
     return "\n".join(explanation)
 
@@ -0,0 +1,82 @@
+"""
+Exact distribution of hand and crib scores over every 4-card hand and starter.
+
+There are C(52, 4) * 48 = 12,994,800 (hand, starter) pairs. They are scored
+one suit-canonical class at a time (see canonical.canonical_hands), about
+650 thousand classes, with the classes split by the starter's rank across a
+process pool. The histograms are exact, so they double as a regression
+check for any other scorer.
+"""
+import argparse
+from multiprocessing import Pool
+from typing import Optional, Tuple
+import numpy as np
+from ..canonical import canonical_hands
+from ..scorer import Scorer
+
+MAX_SCORE = 29
+
+# Scores no hand can make
+IMPOSSIBLE_SCORES = (19, 25, 26, 27)
+
+
+def _score_rank(starter_rank: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Hand and crib score histograms of every hand whose starter has the given rank."""
+    rows = []
+    weights = []
+    for cards, starter, weight in canonical_hands(4, with_starter=True, starter_ranks=[starter_rank]):
+        rows.append([card.code for card in cards] + [starter.code])
+        weights.append(weight)
+    rows = np.array(rows)
+    weights = np.array(weights)
+    return tuple(np.bincount(Scorer.score_hands_batch(rows, is_crib=is_crib), weights=weights,
+                             minlength=MAX_SCORE + 1).astype(np.int64)
+                 for is_crib in (False, True))
+
+
+def score_distribution(processes: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (hand, crib) histograms: how many (hand, starter) pairs score each total."""
+    hand = np.zeros(MAX_SCORE + 1, dtype=np.int64)
+    crib = np.zeros(MAX_SCORE + 1, dtype=np.int64)
+    with Pool(processes) as pool:
+        for hand_counts, crib_counts in pool.imap_unordered(_score_rank, range(1, 14)):
+            hand += hand_counts
+            crib += crib_counts
+    return hand, crib
+
+
+def mean_and_variance(histogram: np.ndarray) -> Tuple[float, float]:
+    """Mean and variance of the scores in a histogram."""
+    scores = np.arange(len(histogram))
+    total = histogram.sum()
+    mean = (scores * histogram).sum() / total
+    return mean, ((scores - mean) ** 2 * histogram).sum() / total
+
+
+def format_report(name: str, histogram: np.ndarray) -> str:
+    """A histogram of scores with their counts and shares, then the summary statistics."""
+    total = histogram.sum()
+    largest = histogram.max()
+    lines = [f"{name} scores over {total:,} hands:", "Score      Count        %"]
+    for score, count in enumerate(histogram):
+        bar = "#" * round(40 * count / largest)
+        lines.append(f"{score:5d} {count:10,d} {100 * count / total:8.4f} {bar}")
+    mean, variance = mean_and_variance(histogram)
+    lines.append(f"Mean {mean:.4f}, variance {variance:.4f}, standard deviation {variance ** 0.5:.4f}")
+    impossible = ", ".join(f"{score}: {histogram[score]}" for score in IMPOSSIBLE_SCORES)
+    lines.append(f"Impossible scores ({impossible})")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the exact distribution of hand and crib scores.")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    hand, crib = score_distribution(args.processes)
+    print(format_report("Hand", hand))
+    print()
+    print(format_report("Crib", crib))
+
+if __name__ == "__main__":
+    main()
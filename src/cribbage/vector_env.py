@@ -0,0 +1,262 @@
+"""
+Vectorized environment that plays many 2-player games in lockstep.
+
+Every game's state lives in NumPy arrays indexed by game: cards as 52-wide
+boolean masks, counts, scores, the dealer and the phase. step() advances
+every unfinished game by one action with array operations, so thousands
+of games cost little more per step than one. The rules are those of Game:
+players discard one card per step (player 0's two cards first, then player
+1's), pegging follows Round, and hands are shown from the dealer's left,
+then the crib, stopping as soon as a player reaches 121.
+
+Actions are card codes 0-51 (see Card.code), or GO to say "go".
+"""
+from typing import Dict, Optional
+import numpy as np
+from .board import PAIR_POINTS
+from .scorer import Scorer
+
+GO = 52
+NUM_ACTIONS = 53
+
+# Phases
+DISCARD = 0
+PLAY = 1
+DONE = 2
+
+WINNING_SCORE = 121
+
+_RANKS = np.arange(52) % 13 + 1
+_VALUES = np.minimum(_RANKS, 10)
+_PAIR_POINTS = np.array(PAIR_POINTS)
+# Longest possible sequence between resets: four aces and four twos
+_MAX_SEQUENCE = 8
+
+
+def _play_points(sequence: np.ndarray, length: np.ndarray, count: np.ndarray) -> np.ndarray:
+    """Pegging points for the last card of each sequence of ranks.
+
+    `sequence` holds the ranks played since the last reset, `length` how
+    many there are (at least one) and `count` the count they make.
+    """
+    n = len(sequence)
+    offsets = length[:, None] - 1 - np.arange(_MAX_SEQUENCE)
+    valid = offsets >= 0
+    # Most recent rank first, 0 past the start of the sequence
+    recent = np.where(valid, sequence[np.arange(n)[:, None], np.maximum(offsets, 0)], 0)
+
+    points = np.where((count == 15) | (count == 31), 2, 0)
+
+    streak = np.cumprod(recent == recent[:, :1], axis=1).sum(axis=1)
+    points += _PAIR_POINTS[np.minimum(streak, 4)]
+
+    # The most recent L cards form a run if their ranks are distinct and span L
+    bits = np.where(valid, 1 << recent, 0)
+    seen = np.bitwise_or.accumulate(bits, axis=1)
+    distinct = np.cumsum(bits, axis=1) == seen
+    span = (np.maximum.accumulate(np.where(valid, recent, 0), axis=1)
+            - np.minimum.accumulate(np.where(valid, recent, 99), axis=1) + 1)
+    lengths = np.arange(1, _MAX_SEQUENCE + 1)
+    is_run = valid & distinct & (span == lengths) & (lengths >= 3)
+    points += np.where(streak >= 2, 0, (is_run * lengths).max(axis=1))
+    return points
+
+
+class VectorEnv:
+    """N independent 2-player games stored as arrays.
+
+    State arrays (N = number of games):
+        held: (N, 2, 52) cards each player still holds
+        kept: (N, 2, 52) cards each player keeps for the show
+        crib: (N, 52) cards in the crib
+        starter: (N,) starter card code
+        dealer, to_move: (N,) player indexes
+        phase: (N,) DISCARD, PLAY or DONE
+        count: (N,) the pegging count
+        sequence, sequence_length: (N, 8), (N,) ranks played since the count was reset
+        said_go: (N, 2) which players have said go
+        last_player: (N,) who played the last card, or -1
+        scores: (N, 2)
+    """
+
+    def __init__(self, num_games: int, seed: Optional[int] = None):
+        self.num_games = num_games
+        self.rng = np.random.default_rng(seed)
+        n = num_games
+        self.held = np.zeros((n, 2, 52), dtype=bool)
+        self.kept = np.zeros((n, 2, 52), dtype=bool)
+        self.crib = np.zeros((n, 52), dtype=bool)
+        self.starter = np.zeros(n, dtype=np.int64)
+        self.dealer = np.zeros(n, dtype=np.int64)
+        self.to_move = np.zeros(n, dtype=np.int64)
+        self.phase = np.full(n, DONE, dtype=np.int64)
+        self.count = np.zeros(n, dtype=np.int64)
+        self.sequence = np.zeros((n, _MAX_SEQUENCE), dtype=np.int64)
+        self.sequence_length = np.zeros(n, dtype=np.int64)
+        self.said_go = np.zeros((n, 2), dtype=bool)
+        self.last_player = np.full(n, -1, dtype=np.int64)
+        self.scores = np.zeros((n, 2), dtype=np.int64)
+
+    def reset(self, games: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Start new games (default: all of them) with a random first dealer."""
+        games = np.arange(self.num_games) if games is None else np.asarray(games)
+        self.scores[games] = 0
+        self.dealer[games] = self.rng.integers(0, 2, len(games))
+        self._deal(games)
+        return self.observe()
+
+    def _deal(self, games: np.ndarray) -> None:
+        """Shuffle and deal a new round in each of `games`."""
+        m = len(games)
+        decks = self.rng.permuted(np.broadcast_to(np.arange(52), (m, 52)), axis=1)
+        rows = np.arange(m)[:, None]
+        held = np.zeros((m, 2, 52), dtype=bool)
+        # Dealt alternately, as Round deals
+        held[rows, 0, decks[:, 0:12:2]] = True
+        held[rows, 1, decks[:, 1:12:2]] = True
+        self.held[games] = held
+        self.kept[games] = held
+        self.crib[games] = False
+        self.starter[games] = decks[:, 12]
+        self.phase[games] = DISCARD
+        self.to_move[games] = 0
+        self._clear_sequence(games)
+
+    def _clear_sequence(self, games: np.ndarray) -> None:
+        self.count[games] = 0
+        self.sequence_length[games] = 0
+        self.said_go[games] = False
+        self.last_player[games] = -1
+
+    @property
+    def done(self) -> np.ndarray:
+        """Which games are over."""
+        return self.phase == DONE
+
+    def legal_actions(self) -> np.ndarray:
+        """(N, 53) mask of the actions the player to move may take in each game."""
+        n = self.num_games
+        legal = np.zeros((n, NUM_ACTIONS), dtype=bool)
+        hand = self.held[np.arange(n), self.to_move]
+        discarding = self.phase == DISCARD
+        legal[discarding, :52] = hand[discarding]
+        playing = self.phase == PLAY
+        fits = hand & (_VALUES <= (31 - self.count)[:, None])
+        legal[playing, :52] = fits[playing]
+        legal[playing, GO] = ~fits[playing].any(axis=1)
+        return legal
+
+    def observe(self) -> Dict[str, np.ndarray]:
+        """What the player to move in each game can see."""
+        n = self.num_games
+        me = self.to_move
+        rows = np.arange(n)
+        played = self.kept.any(axis=1) & ~self.held.any(axis=1)
+        return {
+            "hand": self.held[rows, me],
+            "played": played,
+            "count": self.count.copy(),
+            "starter": np.where(self.phase == PLAY, self.starter, -1),
+            "scores": np.stack([self.scores[rows, me], self.scores[rows, 1 - me]], axis=1),
+            "is_dealer": self.dealer == me,
+            "phase": self.phase.copy(),
+            "legal": self.legal_actions(),
+        }
+
+    def step(self, actions: np.ndarray):
+        """Take one action in every unfinished game.
+
+        Returns (observation, points, done), where points is the (N, 2)
+        array of points each player scored in the step. Actions for finished
+        games are ignored. Raises ValueError if any action is illegal.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        active = ~self.done
+        games = np.nonzero(active)[0]
+        if ((actions[games] < 0) | (actions[games] >= NUM_ACTIONS)).any():
+            raise ValueError(f"Actions must be between 0 and {NUM_ACTIONS - 1}")
+        if not self.legal_actions()[games, actions[games]].all():
+            raise ValueError("Illegal action")
+        before = self.scores.copy()
+
+        discarding = games[self.phase[games] == DISCARD]
+        playing = games[self.phase[games] == PLAY]
+        if len(discarding):
+            self._discard(discarding, actions[discarding])
+        if len(playing):
+            going = actions[playing] == GO
+            if going.any():
+                self._go(playing[going])
+            if (~going).any():
+                self._play(playing[~going], actions[playing[~going]])
+            self._finish_rounds(playing)
+
+        return self.observe(), self.scores - before, self.done.copy()
+
+    def _discard(self, games: np.ndarray, cards: np.ndarray) -> None:
+        player = self.to_move[games]
+        self.held[games, player, cards] = False
+        self.kept[games, player, cards] = False
+        self.crib[games, cards] = True
+        # Each player keeps four of their six cards
+        remaining = self.held[games].sum(axis=2)
+        next_player = np.where(remaining[:, 0] > 4, 0, 1)
+        finished = remaining[:, 1] == 4
+        self.to_move[games] = np.where(finished, 1 - self.dealer[games], next_player)
+        self.phase[games[finished]] = PLAY
+
+    def _play(self, games: np.ndarray, cards: np.ndarray) -> None:
+        player = self.to_move[games]
+        self.held[games, player, cards] = False
+        count = self.count[games] + _VALUES[cards]
+        self.count[games] = count
+        length = self.sequence_length[games]
+        self.sequence[games, length] = _RANKS[cards]
+        self.sequence_length[games] = length + 1
+        points = _play_points(self.sequence[games], length + 1, count)
+        round_over = ~self.held[games].any(axis=(1, 2))
+        # The last card of the play scores 1 unless it made 31
+        points += round_over & (count != 31)
+        self.scores[games, player] += points
+        self.last_player[games] = player
+        self.to_move[games] = 1 - player
+        # The count starts over after 31
+        self._clear_sequence(games[count == 31])
+
+    def _go(self, games: np.ndarray) -> None:
+        player = self.to_move[games]
+        self.said_go[games, player] = True
+        self.to_move[games] = 1 - player
+        # Once both have said go, the last player to play scores and the count restarts
+        both = self.said_go[games].all(axis=1)
+        last = self.last_player[games]
+        scored = games[both & (last >= 0)]
+        self.scores[scored, self.last_player[scored]] += 1
+        self._clear_sequence(games[both])
+
+    def _finish_rounds(self, games: np.ndarray) -> None:
+        """End games won while pegging, and show and redeal those played out."""
+        won = (self.scores[games] >= WINNING_SCORE).any(axis=1)
+        self.phase[games[won]] = DONE
+        games = games[~won & ~self.held[games].any(axis=(1, 2))]
+        if not len(games):
+            return
+
+        m = len(games)
+        dealer = self.dealer[games]
+        pone = 1 - dealer
+        starter = self.starter[games][:, None]
+        hands = [np.nonzero(self.kept[games, player])[1].reshape(m, 4) for player in (pone, dealer)]
+        crib = np.nonzero(self.crib[games])[1].reshape(m, 4)
+        # Count from the dealer's left, then the crib, until someone wins
+        for owner, cards, is_crib in ((pone, hands[0], False), (dealer, hands[1], False),
+                                      (dealer, crib, True)):
+            points = Scorer.score_hands_batch(np.hstack([cards, starter]), is_crib=is_crib)
+            playing_on = (self.scores[games] < WINNING_SCORE).all(axis=1)
+            self.scores[games[playing_on], owner[playing_on]] += points[playing_on]
+
+        won = (self.scores[games] >= WINNING_SCORE).any(axis=1)
+        self.phase[games[won]] = DONE
+        redeal = games[~won]
+        self.dealer[redeal] = 1 - self.dealer[redeal]
+        self._deal(redeal)
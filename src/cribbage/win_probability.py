@@ -0,0 +1,212 @@
+"""
+Probability of winning a 2-player game from any score.
+
+The table holds P(win) for every (score, opponent's score, who deals)
+state below 121, computed by dynamic programming over whole deals. A deal
+is modelled from distributions measured by simulating deals: the joint
+pegging points of the dealer and the pone, the pone's hand, and the
+dealer's hand plus crib. These are taken as independent of each other and
+of the score. Within a deal the pegging comes first (a player passing 121
+there wins; if both would, it counts as a coin flip), then the pone's hand,
+then the dealer's hand and crib.
+
+Every deal scores at least one pegging point, so a state only depends on
+states with a higher total score; the DP fills the table one diagonal of
+equal total at a time, from the highest total down, with the convolutions
+done in NumPy.
+
+The table is cached on disk (default: ~/.cache/cribbage/win_probability.npy)
+and loaded on first use by win_probability().
+"""
+import argparse
+import os
+import random
+from typing import Optional, Sequence, Tuple
+import numpy as np
+from .fast_round import play_fast_deal
+from .player import Player
+from .strategy import RandomStrategy
+
+WINNING_SCORE = 121
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "cribbage", "win_probability.npy")
+# Simulated deals behind a table built on first use
+DEFAULT_DEALS = 20000
+
+
+class DealDistributions:
+    """Point distributions for one deal, as probability arrays indexed by points."""
+
+    def __init__(self, pegging: np.ndarray, pone_hand: np.ndarray, dealer_show: np.ndarray):
+        self.pegging = pegging  # (dealer points, pone points) -> probability
+        self.pone_hand = pone_hand
+        self.dealer_show = dealer_show  # Dealer's hand plus crib
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[Tuple[int, int, int, int]]) -> "DealDistributions":
+        """Build the distributions from (dealer pegging, pone pegging, pone hand, dealer show) samples."""
+        samples = np.asarray(samples)
+        if not len(samples):
+            raise ValueError("No deals to measure")
+        dealer_pegging, pone_pegging, pone_hand, dealer_show = samples.T
+        pegging = np.zeros((dealer_pegging.max() + 1, pone_pegging.max() + 1))
+        np.add.at(pegging, (dealer_pegging, pone_pegging), 1)
+        return cls(pegging / len(samples), np.bincount(pone_hand) / len(samples),
+                   np.bincount(dealer_show) / len(samples))
+
+
+def measure_deals(deals: int, seed: Optional[int] = None,
+                  strategies: Optional[Sequence] = None) -> DealDistributions:
+    """Simulate `deals` deals and measure their point distributions.
+
+    Scores are reset before every deal so no deal is cut short by 121.
+    """
+    rng = random.Random(seed)
+    players = [Player("Dealer"), Player("Pone")]
+    if strategies is None:
+        strategies = [RandomStrategy(), RandomStrategy()]
+    samples = []
+    for deal in range(deals):
+        dealer = deal % 2
+        pone = 1 - dealer
+        for player in players:
+            player.reset_score()
+        play_fast_deal(players, dealer, rng, strategies)
+        points = [player.points_by_category for player in players]
+        samples.append((points[dealer].get("pegging", 0), points[pone].get("pegging", 0),
+                        points[pone]["hand"], points[dealer]["hand"] + points[dealer]["crib"]))
+    return DealDistributions.from_samples(samples)
+
+
+def build_table(distributions: DealDistributions) -> np.ndarray:
+    """Compute P(win) for every state.
+
+    Returns an array indexed [score, opponent's score, is_dealer].
+    """
+    n = WINNING_SCORE
+    # D[a, b]: P(win) for the dealer at a against the pone at b
+    dealer_wins = np.zeros((n, n))
+    # G[a, b]: P(win) for the dealer at a once the pone has counted their hand to b
+    after_pone = np.zeros((n, n))
+    # F[a, b]: P(win) for the dealer at a against b once the pegging is over
+    after_pegging = np.zeros((n, n))
+
+    peg_dealer, peg_pone = np.nonzero(distributions.pegging)
+    peg_probability = distributions.pegging[peg_dealer, peg_pone]
+    if ((peg_dealer + peg_pone) == 0).any():
+        raise ValueError("Every deal must score at least one pegging point")
+    pone_points = np.nonzero(distributions.pone_hand)[0]
+    pone_probability = distributions.pone_hand[pone_points]
+    show_points = np.nonzero(distributions.dealer_show)[0]
+    show_probability = distributions.dealer_show[show_points]
+
+    for total in range(2 * (n - 1), -1, -1):
+        a = np.arange(max(0, total - (n - 1)), min(total, n - 1) + 1)
+        b = total - a
+
+        # The pegging, from states with a higher total
+        a1 = a[:, None] + peg_dealer
+        b1 = b[:, None] + peg_pone
+        dealer_out = a1 >= n
+        pone_out = b1 >= n
+        playing_on = after_pegging[np.minimum(a1, n - 1), np.minimum(b1, n - 1)]
+        value = np.where(dealer_out, np.where(pone_out, 0.5, 1.0), np.where(pone_out, 0.0, playing_on))
+        dealer_wins[a, b] = value @ peg_probability
+
+        # The dealer's show: over 121 wins, otherwise the pone deals next
+        a2 = a[:, None] + show_points
+        pone_deals = 1 - dealer_wins[b[:, None], np.minimum(a2, n - 1)]
+        value = np.where(a2 >= n, 1.0, pone_deals)
+        after_pone[a, b] = value @ show_probability
+
+        # The pone's hand, counted first
+        b2 = b[:, None] + pone_points
+        value = np.where(b2 >= n, 0.0, after_pone[a[:, None], np.minimum(b2, n - 1)])
+        after_pegging[a, b] = value @ pone_probability
+
+    return np.stack([1 - dealer_wins.T, dealer_wins], axis=2)
+
+
+def save_table(table: np.ndarray, path: str = DEFAULT_PATH) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.save(path, table)
+
+
+def load_table(path: str = DEFAULT_PATH) -> np.ndarray:
+    """Load a table written by save_table."""
+    table = np.load(path)
+    if table.shape != (WINNING_SCORE, WINNING_SCORE, 2):
+        raise ValueError("Not a win probability table")
+    return table
+
+
+_default_table: Optional[np.ndarray] = None
+
+
+def default_table() -> np.ndarray:
+    """Return the table cached on disk, loading it on first use.
+
+    If there is no cached table one is built from DEFAULT_DEALS simulated
+    deals and saved. To build it from more deals, run this module with
+    --build --deals N.
+    """
+    global _default_table
+    if _default_table is None:
+        if os.path.exists(DEFAULT_PATH):
+            _default_table = load_table(DEFAULT_PATH)
+        else:
+            _default_table = build_table(measure_deals(DEFAULT_DEALS, seed=0))
+            save_table(_default_table, DEFAULT_PATH)
+    return _default_table
+
+
+def win_probability(score: int, opponent_score: int, is_dealer: bool,
+                    table: Optional[np.ndarray] = None) -> float:
+    """Probability of winning from the given scores, about to deal or not."""
+    if score >= WINNING_SCORE or opponent_score >= WINNING_SCORE:
+        return 1.0 if score >= WINNING_SCORE else 0.0
+    if table is None:
+        table = default_table()
+    return float(table[score, opponent_score, int(is_dealer)])
+
+
+def request_win_probability(request, table: Optional[np.ndarray] = None) -> float:
+    """Probability that the player deciding a 2-player request wins from the current scores.
+
+    The table is for the start of a deal, so mid-deal (with points already
+    pegged) this is an estimate.
+    """
+    if len(request.scores) != 2:
+        raise ValueError("Win probabilities are for 2-player games only")
+    player = request.player_index
+    return win_probability(request.scores[player], request.scores[1 - player], request.is_dealer, table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the win probability table.")
+    parser.add_argument("scores", nargs="*", type=int, metavar="SCORE",
+                        help="your score and your opponent's score to look up")
+    parser.add_argument("--dealer", action="store_true", help="you are about to deal")
+    parser.add_argument("--build", action="store_true", help="rebuild the table even if it is cached")
+    parser.add_argument("--deals", type=int, default=DEFAULT_DEALS, help="deals to simulate when building")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the simulated deals")
+    parser.add_argument("--output", default=DEFAULT_PATH, help="table file")
+    args = parser.parse_args()
+
+    if args.build or not os.path.exists(args.output):
+        table = build_table(measure_deals(args.deals, args.seed))
+        save_table(table, args.output)
+        print(f"Wrote {args.output}")
+    else:
+        table = load_table(args.output)
+    if args.scores:
+        if len(args.scores) != 2:
+            parser.error("give your score and your opponent's score")
+        score, opponent_score = args.scores
+        probability = win_probability(score, opponent_score, args.dealer, table)
+        print(f"P(win) at {score}-{opponent_score}{' as dealer' if args.dealer else ''}: {probability:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from src.cribbage.board import Board
+from src.cribbage.cards import Card, Suit
+
+def play(board, *ranks):
+    """Play cards of the given ranks, cycling suits, and return the last play's points."""
+    suits = list(Suit)
+    for i, rank in enumerate(ranks):
+        assert board.add_to_play_area(Card(rank, suits[i % 4])) != -1
+    return board.last_play_points
+
+def test_fifteen_and_thirty_one():
+    """Test points for reaching a count of 15 or 31."""
+    assert play(Board(), 10, 5) == {"fifteen": 2}
+    assert play(Board(), 10, 10, 10, 1) == {"thirty-one": 2}
+    assert play(Board(), 10, 4) == {}
+
+def test_pairs():
+    """Test points for pairs, pairs royal and double pairs royal."""
+    board = Board()
+    assert play(board, 3, 3) == {"pair": 2}
+    assert play(board, 3) == {"pair": 6}
+    assert play(board, 3) == {"pair": 12}
+    # A pair must be consecutive
+    assert play(Board(), 3, 4, 3) == {}
+
+def test_runs_in_any_order():
+    """Test that the most recent cards score as a run in any order."""
+    assert play(Board(), 4, 6, 5) == {"run": 3, "fifteen": 2}
+    assert play(Board(), 1, 3, 2, 4) == {"run": 4}
+    assert play(Board(), 7, 3, 2, 1) == {"run": 3}
+    # Cards before a repeated rank don't extend the run
+    assert play(Board(), 4, 5, 4, 6) == {"run": 3}
+    assert play(Board(), 4, 5, 5, 6) == {}
+    assert play(Board(), 2, 2, 3, 4) == {"run": 3}
+    # Non-consecutive ranks
+    assert play(Board(), 2, 4, 6) == {}
+
+def test_fifteen_and_pair_together():
+    """Test that a card can score several categories."""
+    assert play(Board(), 5, 5, 5) == {"fifteen": 2, "pair": 6}
+
+def test_reset_clears_pegging_state():
+    """Test that a new sequence starts without pairs or runs."""
+    board = Board()
+    play(board, 10, 10, 10, 1)
+    board.reset_play_area()
+    assert board.play_count == 0
+    assert board.last_player_index is None
+    assert play(board, 1) == {}
+    board.reset_play_area()
+    assert play(board, 2, 3) == {}
+
+def test_over_thirty_one_rejected():
+    """Test that a card that would exceed 31 is not added."""
+    board = Board()
+    play(board, 10, 10, 10)
+    assert board.add_to_play_area(Card(2, Suit.HEARTS)) == -1
+    assert board.play_count == 30
+    assert len(board.play_area) == 3
@@ -0,0 +1,74 @@
+import pytest
+import random
+from itertools import combinations, permutations
+from math import comb
+from src.cribbage.canonical import canonical_cards, canonical_hands, canonical_key
+from src.cribbage.cards import Card, Deck
+from src.cribbage.scorer import Scorer
+
+def relabel(cards, order):
+    """The cards with suit index i moved to suit index order[i]."""
+    return [Card.from_code(order[card.code // 13] * 13 + card.rank - 1) for card in cards]
+
+def test_key_is_invariant_under_relabelling():
+    """Test that every relabelling of the suits gives the same key, and other holdings don't."""
+    rng = random.Random(4)
+    for size in (4, 5, 6):
+        cards = rng.sample(Deck().cards, size + 1)
+        hand, starter = cards[:size], cards[size]
+        keys = {canonical_key(relabel(hand, order), relabel([starter], order)[0])
+                for order in permutations(range(4))}
+        assert keys == {canonical_key(hand, starter)}
+        assert len({canonical_key(relabel(hand, order)) for order in permutations(range(4))}) == 1
+
+    hand = [Card.from_code(code) for code in (0, 1, 2, 13)]
+    # Moving the starter to another suit changes the class
+    assert canonical_key(hand, Card.from_code(26 + 5)) != canonical_key(hand, Card.from_code(5 + 13 * 1))
+    assert canonical_key(hand, Card.from_code(26 + 5)) == canonical_key(hand, Card.from_code(39 + 5))
+
+def test_canonical_cards_score_the_same():
+    """Test that a holding's representative has the same key and score."""
+    rng = random.Random(5)
+    for _ in range(200):
+        cards = rng.sample(Deck().cards, 5)
+        hand, starter = canonical_cards(cards[:4], cards[4])
+        assert canonical_key(hand, starter) == canonical_key(cards[:4], cards[4])
+        for is_crib in (False, True):
+            assert Scorer.score_hand(hand, starter, is_crib) == Scorer.score_hand(cards[:4], cards[4], is_crib)
+
+def test_four_card_classes_match_brute_force():
+    """Test the enumerator against the keys of every 4-card hand."""
+    counts = {}
+    for hand in combinations(Deck().cards, 4):
+        key = canonical_key(hand)
+        counts[key] = counts.get(key, 0) + 1
+    classes = {canonical_key(cards): weight for cards, starter, weight in canonical_hands(4)}
+    assert classes == counts
+
+def test_weights_sum_to_all_holdings():
+    """Test that each 5-card class appears once and the weights cover every holding."""
+    keys = set()
+    classes = 0
+    total = 0
+    for cards, starter, weight in canonical_hands(5):
+        assert len(cards) == 5 and starter is None
+        keys.add(canonical_key(cards))
+        classes += 1
+        total += weight
+    assert total == comb(52, 5)
+    assert len(keys) == classes
+
+def test_starter_classes():
+    """Test the classes of 4-card hands with a starter."""
+    total = 0
+    classes = 0
+    for cards, starter, weight in canonical_hands(4, with_starter=True):
+        assert starter not in cards and starter.code < 13
+        total += weight
+        classes += 1
+    assert total == comb(52, 4) * 48
+    assert classes < total // 19
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        list(canonical_hands(3))
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+import random
+from src.cribbage.card_tracker import CardTracker, kept_points_model
+from src.cribbage.cards import Card, Deck, Suit
+from src.cribbage.moves import GO, PLAY
+from src.cribbage.strategy import PlayRequest
+
+def brute_marginals(tracker):
+    """Marginals recomputed from the weights directly."""
+    totals = np.zeros(52)
+    for holding, weight in zip(tracker.holdings, tracker.weights):
+        totals[holding] += weight
+    return np.where(tracker.played, 0.0, totals / tracker.weights.sum())
+
+def test_initial_marginals():
+    """Test that every unseen card starts equally likely."""
+    dealt = random.Random(1).sample(Deck().cards, 6)
+    tracker = CardTracker(dealt)
+    assert len(tracker.holdings) == 163185
+    for card in Deck():
+        expected = 0.0 if card in dealt else 4 / 46
+        assert tracker.probability(card) == pytest.approx(expected)
+
+def test_incremental_updates_match_recomputation():
+    """Test the incrementally maintained marginals after each kind of evidence."""
+    deck = Deck()
+    random.Random(2).shuffle(deck.cards)
+    cards = deck.cards
+    tracker = CardTracker(cards[:6])
+    tracker.reveal(cards[6])
+    assert np.allclose(tracker.marginals(), brute_marginals(tracker))
+    played = next(card for card in cards[7:] if card.value <= 5)
+    tracker.opponent_played(played)
+    assert tracker.probability(played) == 0.0
+    assert np.allclose(tracker.marginals(), brute_marginals(tracker))
+    tracker.opponent_said_go(25)
+    marginals = tracker.marginals()
+    assert np.allclose(marginals, brute_marginals(tracker))
+    # Nothing worth 6 or less can still be held
+    assert all(marginals[card.code] == 0 for card in Deck() if card.value <= 6)
+    # Three unplayed cards remain in the hand
+    assert marginals.sum() == pytest.approx(3)
+
+def test_discard_model_and_sampling():
+    """Test weighting by a discard model and sampling holdings by weight."""
+    dealt = [Card(rank, Suit.HEARTS) for rank in range(1, 7)]
+    tracker = CardTracker(dealt)
+    tracker.apply_discard_model(kept_points_model(beta=1.0))
+    assert np.allclose(tracker.marginals(), brute_marginals(tracker))
+    # Fives make fifteens with the many ten-cards, so they are likelier kept
+    assert tracker.probability(Card(5, Suit.CLUBS)) > tracker.probability(Card(7, Suit.CLUBS))
+    samples = tracker.sample(np.random.default_rng(0), 5000)
+    assert samples.shape == (5000, 4)
+    assert not np.isin(samples, [card.code for card in dealt]).any()
+    frequency = np.bincount(samples.ravel(), minlength=52) / 5000
+    assert np.abs(frequency - tracker.marginals()).max() < 0.03
+
+def test_contradictory_evidence():
+    """Test that evidence ruling out every holding raises ValueError."""
+    tracker = CardTracker([Card(rank, Suit.HEARTS) for rank in range(1, 7)])
+    with pytest.raises(ValueError):
+        tracker.opponent_said_go(0)
+
+def test_from_request():
+    """Test tracking from the history of a play request."""
+    starter = Card(2, Suit.DIAMONDS)
+    hand = [Card(3, Suit.HEARTS), Card(4, Suit.HEARTS)]
+    history = (
+        (PLAY, 1, 1 << Card(13, Suit.CLUBS).code),
+        (PLAY, 0, 1 << Card(10, Suit.HEARTS).code),
+        (PLAY, 1, 1 << Card(5, Suit.CLUBS).code),
+        (PLAY, 0, 1 << Card(1, Suit.HEARTS).code),
+        (GO, 1, 0),
+    )
+    discarded = (Card(8, Suit.SPADES), Card(9, Suit.SPADES))
+    request = PlayRequest(0, hand, hand, 26, [], starter, False, [0, 0], random.Random(0),
+                          (), history, discarded)
+    tracker = CardTracker.from_request(request)
+    marginals = tracker.marginals()
+    assert marginals.sum() == pytest.approx(2)
+    for card in Deck():
+        if card.value <= 5 or card in hand or card in discarded or card == starter:
+            assert marginals[card.code] == 0
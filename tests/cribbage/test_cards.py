@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 from src.cribbage.cards import Card, Suit, Deck
 import pytest
@@ -63,6 +65,29 @@ class TestCard(unittest.TestCase):
         with pytest.raises(ValueError):
             Card(14, Suit.HEARTS)  # Rank too high
 
+    def test_cards_are_interned(self):
+        """Test that equal cards are the same shared instance."""
+        assert Card(1, Suit.HEARTS) is Card(1, Suit.HEARTS)
+        assert copy.copy(Card(5, Suit.CLUBS)) is Card(5, Suit.CLUBS)
+        assert copy.deepcopy([Card(5, Suit.CLUBS)])[0] is Card(5, Suit.CLUBS)
+        assert pickle.loads(pickle.dumps(Card(12, Suit.SPADES))) is Card(12, Suit.SPADES)
+        with pytest.raises(AttributeError):
+            Card(1, Suit.HEARTS).rank = 2
+
+    def test_card_codes(self):
+        """Test that every card has a distinct code from 0 to 51."""
+        codes = [Card(rank, suit).code for suit in Suit for rank in range(1, 14)]
+        assert codes == list(range(52))
+        for code in range(52):
+            assert Card.from_code(code).code == code
+        assert Card.from_code(0) is Card(1, Suit.HEARTS)
+        assert hash(Card(2, Suit.DIAMONDS)) == Card(2, Suit.DIAMONDS).code
+
+    def test_invalid_suit(self):
+        """Test that cards require a Suit."""
+        with pytest.raises(ValueError):
+            Card(1, "hearts")
+
     def test_special_rank_display(self):
         """Test display of special ranks (A, J, Q, K)."""
         assert str(Card(1, Suit.HEARTS)) == "A♥"   # Ace
@@ -80,6 +105,14 @@ class TestDeck(unittest.TestCase):
         self.assertEqual(len(self.deck), 52)
         self.assertEqual(len(set(self.deck)), 52)  # All cards are unique
 
+    def test_reset_reuses_cards(self):
+        """Test that resetting the deck reuses the shared card instances."""
+        cards = list(self.deck)
+        self.deck.draw_multiple(10)
+        self.deck.reset()
+        self.assertEqual(len(self.deck), 52)
+        assert all(a is b for a, b in zip(cards, self.deck))
+
     def test_draw_card(self):
         """Test drawing a card from the deck."""
         initial_size = len(self.deck)
@@ -0,0 +1,82 @@
+from itertools import combinations
+import pytest
+from src.cribbage.cards import Card, Suit
+from src.cribbage.scorer import Scorer
+from src.cribbage.crib_table import (
+    CribTable, DISCARD_CLASSES, build_crib_table, default_crib_table,
+    discard_class, expected_crib,
+)
+
+def test_discard_classes():
+    """Test that discards reduce to 169 rank/suitedness classes."""
+    assert len(DISCARD_CLASSES) == 169
+    assert discard_class([Card(9, Suit.CLUBS), Card(2, Suit.CLUBS)]) == (2, 9, True)
+    assert discard_class([Card(5, Suit.CLUBS), Card(5, Suit.HEARTS)]) == (5, 5, False)
+    with pytest.raises(ValueError):
+        discard_class([Card(5, Suit.CLUBS), Card(5, Suit.CLUBS)])
+
+def test_expected_crib_matches_score_hand():
+    """Test one class against a direct enumeration with score_hand."""
+    discard = [Card(5, Suit.HEARTS), Card(10, Suit.HEARTS)]
+    remaining = [Card.from_code(code) for code in range(52) if Card.from_code(code) not in discard]
+    total = 0
+    count = 0
+    for throw in combinations(remaining, 2):
+        for starter in remaining:
+            if starter in throw:
+                continue
+            total += Scorer.score_hand(discard + list(throw), starter, is_crib=True)
+            count += 1
+    assert count == 1225 * 48
+    assert expected_crib((5, 10, True)) == pytest.approx(total / count)
+
+def test_default_table():
+    """Test the shipped table's values and perspective signs."""
+    table = default_crib_table()
+    five_five = [Card(5, Suit.HEARTS), Card(5, Suit.SPADES)]
+    assert table.expected_crib(five_five) == pytest.approx(expected_crib((5, 5, False)))
+    assert table.crib_value(five_five, is_dealer=True) == table.expected_crib(five_five)
+    assert table.crib_value(five_five, is_dealer=False) == -table.expected_crib(five_five)
+    # A pair of fives is the best throw to your own crib
+    assert max(table.values) == table.expected_crib(five_five)
+
+def test_build_resumes_from_checkpoint(tmp_path):
+    """Test that a build only computes classes missing from the checkpoint."""
+    default = default_crib_table()
+    path = tmp_path / "crib.bin"
+    checkpoint = tmp_path / "crib.partial"
+    missing = {(1, 2, True), (13, 13, False)}
+    with open(checkpoint, "w") as f:
+        for key, value in zip(DISCARD_CLASSES, default.values):
+            if key not in missing:
+                # Mark these values so we can tell they were reused
+                f.write(f"{key[0]} {key[1]} {int(key[2])} {value + 100!r}\n")
+        # A line cut short by an interrupted write
+        f.write("1 2 1")
+
+    build_crib_table(str(path), processes=1, checkpoint=str(checkpoint))
+    assert not checkpoint.exists()
+
+    table = CribTable.load(str(path))
+    for key, value, expected in zip(DISCARD_CLASSES, table.values, default.values):
+        if key in missing:
+            assert value == pytest.approx(expected)
+        else:
+            assert value == pytest.approx(expected + 100)
+
+def test_checkpoint_drops_line_cut_inside_value(tmp_path):
+    """Test that a record cut inside its value is not read, and later records aren't joined to it."""
+    from src.cribbage.crib_table import _read_checkpoint
+    checkpoint = tmp_path / "crib.partial"
+    checkpoint.write_text("1 2 1 4.25\n5 5 0 8.")
+    assert _read_checkpoint(str(checkpoint)) == {(1, 2, True): 4.25}
+    with open(checkpoint, "a") as f:
+        f.write("5 5 0 8.4321\n")
+    assert _read_checkpoint(str(checkpoint)) == {(1, 2, True): 4.25, (5, 5, False): 8.4321}
+
+def test_load_rejects_invalid_files(tmp_path):
+    """Test that files with a bad header or size are rejected."""
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not a table")
+    with pytest.raises(ValueError):
+        CribTable.load(str(path))
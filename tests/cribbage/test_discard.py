@@ -0,0 +1,116 @@
+import pytest
+from src.cribbage.cards import Card, Suit
+from src.cribbage.scorer import Scorer
+from src.cribbage.discard import (EvaluationCache, cache_info, disable_cache, enable_cache,
+                                  optimize_discard)
+
+SIX = [Card(5, Suit.HEARTS), Card(5, Suit.CLUBS), Card(6, Suit.DIAMONDS),
+       Card(7, Suit.SPADES), Card(13, Suit.HEARTS), Card(1, Suit.CLUBS)]
+
+def test_all_discards_evaluated():
+    """Test that all 15 keep/discard splits are returned, best first."""
+    options = optimize_discard(SIX, is_dealer=True)
+    assert len(options) == 15
+    assert len({frozenset(option.discard) for option in options}) == 15
+    for option in options:
+        assert sorted(option.keep + option.discard, key=lambda c: c.code) == \
+            sorted(SIX, key=lambda c: c.code)
+        assert sum(option.distribution.values()) == 46
+    values = [option.expected_value for option in options]
+    assert values == sorted(values, reverse=True)
+    assert set(options[0].keep) == {SIX[0], SIX[1], SIX[2], SIX[3]}
+
+def test_expected_hand_matches_score_hand():
+    """Test that hand expectations and distributions are exact."""
+    starters = [Card(rank, suit) for suit in Suit for rank in range(1, 14) if Card(rank, suit) not in SIX]
+    for option in optimize_discard(SIX, is_dealer=False):
+        scores = [Scorer.score_hand(option.keep, starter) for starter in starters]
+        assert option.expected_hand == pytest.approx(sum(scores) / 46)
+        assert option.distribution == {score: scores.count(score) for score in sorted(set(scores))}
+
+def test_crib_sign_depends_on_dealer():
+    """Test that crib points count for the dealer and against the pone."""
+    dealer = {frozenset(o.discard): o for o in optimize_discard(SIX, is_dealer=True)}
+    pone = {frozenset(o.discard): o for o in optimize_discard(SIX, is_dealer=False)}
+    for discard, option in dealer.items():
+        assert option.expected_crib == pone[discard].expected_crib
+        assert option.expected_value == pytest.approx(option.expected_hand + option.expected_crib)
+        assert pone[discard].expected_value == pytest.approx(option.expected_hand - option.expected_crib)
+    # Throwing the 5-5 pair is worth at least the pair to the crib
+    assert dealer[frozenset(SIX[:2])].expected_crib >= 2
+
+def test_three_player_hand():
+    """Test that a 5-card hand yields 5 single-card discards."""
+    options = optimize_discard(SIX[:5], is_dealer=True)
+    assert len(options) == 5
+    assert all(len(option.discard) == 1 for option in options)
+    assert all(sum(option.distribution.values()) == 47 for option in options)
+
+def test_invalid_hands():
+    """Test that hands of the wrong size or with duplicates are rejected."""
+    with pytest.raises(ValueError):
+        optimize_discard(SIX[:4], is_dealer=True)
+    with pytest.raises(ValueError):
+        optimize_discard(SIX[:5] + [SIX[0]], is_dealer=True)
+
+def test_two_card_discards_use_crib_table():
+    """Test that 2-card discards are valued from the crib table."""
+    from src.cribbage.crib_table import default_crib_table
+    table = default_crib_table()
+    for option in optimize_discard(SIX, is_dealer=True):
+        assert option.expected_crib == table.expected_crib(option.discard)
+
+def test_cached_evaluations_match():
+    """Test that cached keep evaluations give the same options, shared across suit relabellings."""
+    expected = [(o.keep, o.expected_hand, o.expected_crib, o.distribution)
+                for o in optimize_discard(SIX, is_dealer=False)]
+    # The same deal with hearts and clubs swapped
+    swapped = [Card(card.rank, {Suit.HEARTS: Suit.CLUBS, Suit.CLUBS: Suit.HEARTS}.get(card.suit, card.suit))
+               for card in SIX]
+    enable_cache()
+    try:
+        assert cache_info() == (0, 0, 65536, 0)
+        options = optimize_discard(SIX, is_dealer=False)
+        assert [(o.keep, o.expected_hand, o.expected_crib, o.distribution) for o in options] == expected
+        misses = cache_info().misses
+        optimize_discard(swapped, is_dealer=False)
+        assert cache_info().misses == misses
+        assert cache_info().hits == 15
+    finally:
+        disable_cache()
+    assert cache_info() is None
+
+def test_evaluation_cache_evicts_least_recently_used():
+    """Test the cache's size bound and eviction order."""
+    cache = EvaluationCache(2)
+    cache.put(1, 10)
+    cache.put(2, 20)
+    assert cache.get(1) == 10
+    cache.put(3, 30)
+    assert cache.get(2) is None
+    assert cache.get(1) == 10 and cache.get(3) == 30
+    assert cache.info() == (3, 1, 2, 2)
+    with pytest.raises(ValueError):
+        EvaluationCache(0)
+
+def test_repeated_deals_are_answered_from_the_cache():
+    """Test that a second pass over the same deals hits the cache for every keep."""
+    import random
+    from src.cribbage.cards import Deck
+    rng = random.Random(8)
+    deals = [rng.sample(Deck().cards, 6) for _ in range(20)]
+
+    def evaluate_all():
+        return [[(o.keep, o.discard, o.expected_hand, o.expected_crib, o.distribution)
+                 for o in optimize_discard(deal, is_dealer=True)] for deal in deals]
+
+    expected = evaluate_all()
+    enable_cache()
+    try:
+        assert evaluate_all() == expected
+        hits, misses, _, size = cache_info()
+        assert hits + misses == 15 * len(deals) and size == misses
+        assert evaluate_all() == expected
+        assert cache_info() == (hits + 15 * len(deals), misses, 65536, size)
+    finally:
+        disable_cache()
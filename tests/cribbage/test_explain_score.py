@@ -0,0 +1,20 @@
+from src.cribbage.cards import Card, Suit
+from src.cribbage.scorer import Scorer
+from src.cribbage.util.explain_score import explain_score
+
+def test_explanation_matches_score():
+    """Test that the explanation lists every scoring combination and the right total."""
+    hand = [Card(3, Suit.DIAMONDS), Card(4, Suit.SPADES), Card(3, Suit.CLUBS), Card(11, Suit.HEARTS)]
+    starter = Card(5, Suit.HEARTS)
+    text = explain_score(hand, starter)
+    assert f"Total score: {Scorer.score_hand(hand, starter)} points" in text
+    assert "Run of 3 (2 for 3 points each):" in text
+    assert "3♦ and 3♣" in text
+    assert "Nobs (J♥, the Jack of ♥): 1 point" in text
+
+def test_flush_explanations():
+    """Test the flush lines for a hand and a crib."""
+    hand = [Card(rank, Suit.HEARTS) for rank in (2, 4, 6, 8)]
+    assert "4-card flush: 4 points" in explain_score(hand, Card(13, Suit.CLUBS))
+    assert "No flush" in explain_score(hand, Card(13, Suit.CLUBS), is_crib=True)
+    assert "5-card flush in crib: 5 points" in explain_score(hand, Card(13, Suit.HEARTS), is_crib=True)
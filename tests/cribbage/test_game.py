@@ -1,3 +1,4 @@
+import random
 from src.cribbage.game import Game
 from src.cribbage.player import Player
 from src.cribbage.cards import Card, Suit
@@ -106,4 +107,51 @@ def test_discard_to_crib_no_current_round():
     cards = [Card(1, Suit.HEARTS), Card(2, Suit.HEARTS)]
     
     # Try to discard cards (should fail)
-    assert not game.discard_to_crib(player, cards) 
\ No newline at end of file
+    assert not game.discard_to_crib(player, cards) 
+
+def test_game_consults_strategies():
+    """Test that the game asks each player's strategy for their decisions."""
+    from src.cribbage.strategy import RandomStrategy
+
+    class RecordingStrategy(RandomStrategy):
+        def __init__(self):
+            self.discards = 0
+            self.plays = 0
+
+        def choose_discard(self, request):
+            self.discards += 1
+            return super().choose_discard(request)
+
+        def choose_play(self, request):
+            self.plays += 1
+            return super().choose_play(request)
+
+    strategies = [RecordingStrategy(), RecordingStrategy()]
+    game = Game([Player("Alice"), Player("Bob")], random.Random(1), strategies=strategies)
+    game.start()
+    game.play_round()
+    assert [strategy.discards for strategy in strategies] == [1, 1]
+    assert all(strategy.plays >= 4 for strategy in strategies)
+    assert game.current_round.is_round_over() or game.is_game_over()
+    assert game.next_request() is None
+
+def test_invalid_choice_rejected():
+    """Test that a strategy's invalid answer raises ValueError."""
+    game = Game([Player("Alice"), Player("Bob")])
+    game.start()
+    request = game.next_request()
+    assert request.num_discards == 2
+    with pytest.raises(ValueError):
+        game.apply_choice(request, request.hand[:1])
+
+def test_advance_round_stops_when_game_is_over():
+    """Test that no new round is dealt once a player reaches 121."""
+    players = [Player("Alice"), Player("Bob")]
+    game = Game(players, random.Random(2))
+    game.start()
+    game.play_round()
+    players[1].add_points(121 - players[1].score)
+    round_before = game.current_round
+    game.advance_round()
+    assert game.current_round is round_before
+    assert game.dealer_index == 0
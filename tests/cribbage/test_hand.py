@@ -218,4 +218,77 @@ def test_all_card_states():
     hand.play_card(card2)
     hand.discard_card(card3)
     
-    assert str(hand) == "A♥ 2♥* 3♥^ 4♥" 
\ No newline at end of file
+    assert str(hand) == "A♥ 2♥* 3♥^ 4♥" 
+
+def test_card_masks():
+    """Test that held, played and discarded masks track card codes."""
+    hand = Hand()
+    cards = [Card(1, Suit.HEARTS), Card(2, Suit.CLUBS), Card(13, Suit.SPADES)]
+    for card in cards:
+        hand.add_card(card)
+    assert hand.held_mask == sum(1 << card.code for card in cards)
+    assert hand.unplayed_mask == hand.held_mask
+
+    hand.play_card(cards[0])
+    hand.discard_card(cards[2])
+    assert hand.played_mask == 1 << cards[0].code
+    assert hand.discarded_mask == 1 << cards[2].code
+    assert hand.unplayed_mask == 1 << cards[1].code
+    assert hand.has_unplayed_cards()
+
+    hand.play_card(cards[1])
+    assert not hand.has_unplayed_cards()
+
+def test_views_follow_state_changes():
+    """Test that cached card lists are rebuilt after the hand changes."""
+    hand = Hand()
+    card1 = Card(1, Suit.HEARTS)
+    card2 = Card(2, Suit.HEARTS)
+    hand.add_card(card1)
+    assert hand.get_unplayed_cards() == [card1]
+
+    hand.add_card(card2)
+    assert hand.get_unplayed_cards() == [card1, card2]
+
+    hand.play_card(card2)
+    assert hand.get_unplayed_cards() == [card1]
+    assert hand.get_played_cards() == [card2]
+
+    hand.unplay_card(card2)
+    assert hand.get_unplayed_cards() == [card1, card2]
+    assert hand.get_played_cards() == []
+
+    hand.discard_card(card1)
+    assert hand.get_scoring_cards() == [card2]
+    hand.undiscard_card(card1)
+    assert hand.get_scoring_cards() == [card1, card2]
+
+def test_played_cards_keep_play_order():
+    """Test that played and discarded cards are listed in the order they left the hand."""
+    hand = Hand()
+    two = Card(2, Suit.HEARTS)
+    king = Card(13, Suit.HEARTS)
+    five = Card(5, Suit.CLUBS)
+    ace = Card(1, Suit.SPADES)
+    for card in (two, king, five, ace):
+        hand.add_card(card)
+    hand.play_card(king)
+    hand.play_card(two)
+    hand.discard_card(ace)
+    hand.discard_card(five)
+    assert hand.get_played_cards() == [king, two]
+    assert hand.get_discarded_cards() == [ace, five]
+
+def test_views_are_copies():
+    """Test that changing a returned list doesn't change the hand."""
+    hand = Hand()
+    cards = [Card(2, Suit.HEARTS), Card(13, Suit.HEARTS), Card(5, Suit.HEARTS)]
+    for card in cards:
+        hand.add_card(card)
+    hand.play_card(cards[0])
+    hand.get_played_cards().append(cards[2])
+    hand.get_unplayed_cards().remove(cards[1])
+    hand.get_scoring_cards().clear()
+    assert hand.get_played_cards() == [cards[0]]
+    assert hand.get_unplayed_cards() == cards[1:]
+    assert hand.get_scoring_cards() == cards
@@ -0,0 +1,94 @@
+import random
+from src.cribbage.cards import Card, Suit
+from src.cribbage.ismcts import ISMCTSStrategy, _PlayInfo
+from src.cribbage.moves import GO, PLAY
+from src.cribbage.player import Player
+from src.cribbage.simulation import play_seeded_game, simulate_games
+from src.cribbage.strategy import DiscardRequest, PlayRequest, RandomStrategy
+
+def play_request(hand, history, starter, discarded=(), player_index=0, valid_plays=None):
+    """Build a play request for a 2-player game from its history."""
+    return PlayRequest(player_index, hand, hand if valid_plays is None else valid_plays, 0,
+                       [], starter, False, [0, 0], random.Random(1), (), tuple(history),
+                       tuple(discarded))
+
+def test_discards_are_from_hand():
+    """Test that the discard is the right number of cards from the hand."""
+    hand = [Card(1, Suit.HEARTS), Card(5, Suit.CLUBS), Card(5, Suit.SPADES),
+            Card(10, Suit.CLUBS), Card(11, Suit.DIAMONDS), Card(13, Suit.SPADES)]
+    strategy = ISMCTSStrategy(iterations=300)
+    request = DiscardRequest(0, hand, 2, True, [0, 0], random.Random(1))
+    discard = strategy.choose_discard(request)
+    assert len(discard) == 2 and set(discard) <= set(hand)
+    # The pair of fives are worth keeping
+    assert Card(5, Suit.CLUBS) not in discard and Card(5, Suit.SPADES) not in discard
+
+def test_opponent_cards_respect_go():
+    """Test that determinized opponent hands can't hold a card they would have played."""
+    starter = Card(2, Suit.DIAMONDS)
+    hand = [Card(3, Suit.HEARTS), Card(4, Suit.HEARTS)]
+    # The opponent (player 1) said go at a count of 26, so holds nothing below 6
+    history = [
+        (PLAY, 1, 1 << Card(13, Suit.CLUBS).code),
+        (PLAY, 0, 1 << Card(10, Suit.HEARTS).code),
+        (PLAY, 1, 1 << Card(5, Suit.CLUBS).code),
+        (PLAY, 0, 1 << Card(1, Suit.HEARTS).code),
+        (GO, 1, 0),
+    ]
+    info = _PlayInfo(play_request(hand, history, starter))
+    assert info.count == 26
+    assert info.opponent_cards == 2
+    rng = random.Random(3)
+    for _ in range(50):
+        state = info.determinize(rng)
+        opponent = state.hands[1]
+        assert bin(opponent).count("1") == 2
+        assert all(min(code % 13 + 1, 10) > 5 for code in range(52) if opponent >> code & 1)
+        assert not opponent & state.hands[0]
+
+def test_tree_is_reused_between_plays():
+    """Test that the subtree reached by the moves since the last decision is kept."""
+    strategy = ISMCTSStrategy(iterations=400)
+    starter = Card(2, Suit.DIAMONDS)
+    hand = [Card(3, Suit.HEARTS), Card(6, Suit.HEARTS), Card(9, Suit.SPADES), Card(12, Suit.CLUBS)]
+    first = strategy.choose_play(play_request(hand, [], starter))
+    history = [(PLAY, 0, 1 << first.code), (PLAY, 1, 1 << Card(5, Suit.CLUBS).code)]
+    expected = strategy._root.children[first.rank].children.get(5)
+    remaining = [card for card in hand if card != first]
+    root = strategy._reused_root(play_request(remaining, history, starter))
+    assert expected is not None and root is expected
+    assert root.visits > 0
+
+def test_beats_random_player():
+    """Test that searching wins most games against random play."""
+    results = simulate_games(6, ["Search", "Random"], seed=4,
+                             strategies=[ISMCTSStrategy(iterations=100), RandomStrategy()])
+    assert results.wins[0] >= 5
+
+def test_root_parallel_search():
+    """Test that searches spread over a process pool still choose valid moves."""
+    with ISMCTSStrategy(iterations=50, processes=2) as strategy:
+        game = play_seeded_game([Player("Search"), Player("Random")], 8, 0,
+                                [strategy, RandomStrategy()])
+        pool = strategy._pool
+        assert pool is not None
+    assert strategy._pool is None
+    assert game.is_game_over()
+
+def test_pool_is_shut_down_when_strategy_is_dropped():
+    """Test that a strategy's workers are released without an explicit close()."""
+    import gc
+    strategy = ISMCTSStrategy(iterations=10, processes=2)
+    play_seeded_game([Player("Search"), Player("Random")], 9, 0, [strategy, RandomStrategy()])
+    finalizer = strategy._pool_finalizer
+    assert finalizer.alive
+    del strategy
+    gc.collect()
+    assert not finalizer.alive
+
+def test_root_parallelism_refused_inside_workers():
+    """Test that a parallel strategy inside simulate_games' workers fails clearly."""
+    import pytest
+    with pytest.raises(ValueError, match="processes=1"):
+        simulate_games(2, ["Search", "Random"], seed=5, processes=2,
+                       strategies=[ISMCTSStrategy(iterations=10, processes=2), RandomStrategy()])
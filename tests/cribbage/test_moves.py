@@ -0,0 +1,72 @@
+from src.cribbage.cards import Card, Suit
+from src.cribbage.moves import DISCARD, GO, PLAY, legal_moves, move_cards, played_card
+from src.cribbage.player import Player
+from src.cribbage.round import Round
+
+def make_round(hands, dealer_index=0):
+    """Create a round with the given hands."""
+    players = [Player(f"Player {i}") for i in range(len(hands))]
+    round = Round(players, dealer_index)
+    for player, cards in zip(players, hands):
+        for card in cards:
+            player.receive_card(card)
+    return round, players
+
+def test_discard_moves():
+    """Test that every choice of discards is generated before discarding."""
+    six = [Card(rank, Suit.HEARTS) for rank in range(1, 7)]
+    round, (dealer, pone) = make_round([six, [Card(rank, Suit.CLUBS) for rank in range(1, 7)]])
+    moves = legal_moves(round, dealer)
+    assert len(moves) == 15
+    assert all(kind == DISCARD and index == 0 for kind, index, _ in moves)
+    assert {frozenset(move_cards(move)) for move in moves} == \
+        {frozenset((a, b)) for a in six for b in six if a != b}
+
+    round.apply(moves[0])
+    # After discarding, it isn't the dealer's turn to play
+    assert legal_moves(round, dealer) == ()
+
+def test_three_player_discard_moves():
+    """Test that each player discards one card in a 3-player game."""
+    hands = [[Card(rank, suit) for rank in range(1, 6)] for suit in (Suit.HEARTS, Suit.CLUBS, Suit.SPADES)]
+    round, players = make_round(hands)
+    moves = legal_moves(round, players[2])
+    assert [move_cards(move) for move in moves] == [[card] for card in hands[2]]
+
+def test_play_moves():
+    """Test that only cards that keep the count at 31 or less can be played."""
+    round, (dealer, pone) = make_round([
+        [Card(10, Suit.HEARTS), Card(12, Suit.HEARTS)],
+        [Card(13, Suit.CLUBS), Card(11, Suit.CLUBS), Card(2, Suit.CLUBS)],
+    ])
+    moves = legal_moves(round, pone)
+    assert {played_card(move) for move in moves} == set(round.players[1].hand.cards)
+    assert all(kind == PLAY for kind, _, _ in moves)
+
+    round.play_card(pone, Card(13, Suit.CLUBS))
+    round.play_card(dealer, Card(10, Suit.HEARTS))
+    round.play_card(pone, Card(11, Suit.CLUBS))
+    # The count is 30, so only the ace would fit
+    assert legal_moves(round, dealer) == ((GO, 0, 0),)
+    round.player_says_go(dealer)
+    assert legal_moves(round, pone) == ((GO, 1, 0),)
+
+def test_legal_moves_match_round():
+    """Test that every generated move can be applied and nothing else can be played."""
+    import random
+    players = [Player("Alice"), Player("Bob")]
+    round = Round(players, 0, random.Random(3))
+    round.start()
+    rng = random.Random(4)
+    for player in players:
+        round.apply(rng.choice(legal_moves(round, player)))
+    while not round.is_round_over():
+        player = round.get_current_player()
+        moves = legal_moves(round, player)
+        plays = {played_card(move) for move in moves if move[0] == PLAY}
+        for card in player.get_playable_cards():
+            assert (card in plays) == (round.board.play_count + card.value <= 31)
+        for move in moves:
+            round.apply(move)
+            round.undo()
+        round.apply(rng.choice(moves))
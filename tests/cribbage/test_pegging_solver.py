@@ -0,0 +1,103 @@
+import random
+import time
+from src.cribbage.cards import Card, Deck, Suit
+from src.cribbage.moves import legal_moves
+from src.cribbage.pegging_solver import GO, PeggingState, solve, solve_pegging
+from src.cribbage.player import Player
+from src.cribbage.round import Round
+
+def make_round(hands):
+    """Create a 2-player round in the play phase with the given hands, dealer first."""
+    players = [Player("Dealer"), Player("Pone")]
+    round = Round(players, dealer_index=0)
+    for player, cards in zip(players, hands):
+        for card in cards:
+            player.receive_card(card)
+    return round, players
+
+def brute_force(round):
+    """Best differential for the player to move, by trying every move with Round."""
+    if round.is_round_over():
+        return 0
+    index = round.current_player_index
+    best = None
+    for move in legal_moves(round, round.players[index]):
+        before = [player.score for player in round.players]
+        round.apply(move)
+        gains = [player.score - score for player, score in zip(round.players, before)]
+        value = gains[index] - gains[1 - index] - brute_force(round)
+        round.undo()
+        if best is None or value > best:
+            best = value
+    return best
+
+def test_matches_round_rules():
+    """Test the solver against an exhaustive search through Round on random deals."""
+    rng = random.Random(2)
+    for _ in range(30):
+        cards = rng.sample(Deck().cards, 6)
+        round, _ = make_round([cards[:3], cards[3:]])
+        state = PeggingState.from_round(round)
+        assert solve(state)[1] == brute_force(round)
+
+def test_three_hands_play_out_without_a_reset():
+    """Test that all twelve cards of a 3-player play can fall in one sequence."""
+    hands = [sum(1 << Card(rank, suit).code for suit in Suit) for rank in (1, 2, 3)]
+    state = PeggingState(tuple(hands))
+    points = [0, 0, 0]
+    while not state.is_over():
+        state, scorer, gained = state.step(state.moves()[0])
+        if scorer >= 0:
+            points[scorer] += gained
+        assert state.key == state._hash()
+    assert len(state.ranks) == 12 and state.count == 24
+    assert sum(points) > 0
+
+def test_solves_mid_sequence():
+    """Test solving from a position part way through the play."""
+    rng = random.Random(5)
+    for _ in range(10):
+        cards = rng.sample(Deck().cards, 8)
+        round, (dealer, pone) = make_round([cards[:4], cards[4:]])
+        # Play the lowest cards first to reach a position with a count
+        for _ in range(3):
+            player = round.get_current_player()
+            moves = legal_moves(round, player)
+            round.apply(moves[0])
+        card, value = solve_pegging(round)
+        assert value == brute_force(round)
+        if card is None:
+            assert not any(round.board.play_count + card.value <= 31
+                           for card in round.get_current_player().get_playable_cards())
+
+def test_best_play_achieves_value():
+    """Test that playing the returned card achieves the returned differential."""
+    rng = random.Random(7)
+    for _ in range(10):
+        cards = rng.sample(Deck().cards, 6)
+        round, players = make_round([cards[:3], cards[3:]])
+        card, value = solve_pegging(round)
+        pone = players[1]
+        round.play_card(pone, card)
+        assert value == pone.score - brute_force(round)
+
+def test_go_when_nothing_fits():
+    """Test that the solver says go when no card fits under 31."""
+    state = PeggingState((1 << Card(10, Suit.HEARTS).code, 1 << Card(2, Suit.CLUBS).code),
+                         ranks=(13, 13, 13), count=30, to_move=0, last_player=1)
+    move, value = solve(state)
+    assert move == GO
+    # The opponent can't play either, so their go point comes first, then
+    # each plays out a card, the second scoring for the last card
+    assert value == -1 + 0 - 1
+
+def test_full_hands_are_fast():
+    """Test that a full 4-vs-4 pegging sequence solves in milliseconds."""
+    rng = random.Random(9)
+    start = time.perf_counter()
+    for _ in range(20):
+        cards = rng.sample(Deck().cards, 8)
+        state = PeggingState((sum(1 << card.code for card in cards[:4]),
+                              sum(1 << card.code for card in cards[4:])), to_move=1)
+        solve(state)
+    assert (time.perf_counter() - start) / 20 < 0.1
@@ -0,0 +1,186 @@
+from src.cribbage.cards import Card, Suit
+from src.cribbage.player import Player
+from src.cribbage.round import Round
+
+def make_round(hands):
+    """Create a 2-player round with the given hands, dealer first."""
+    players = [Player("Dealer"), Player("Pone")]
+    round = Round(players, dealer_index=0)
+    for player, cards in zip(players, hands):
+        for card in cards:
+            player.receive_card(card)
+    return round, players
+
+def test_pegging_points_awarded():
+    """Test that pegging points go to the player who plays the card."""
+    round, (dealer, pone) = make_round([
+        [Card(5, Suit.HEARTS), Card(2, Suit.HEARTS)],
+        [Card(10, Suit.CLUBS), Card(5, Suit.CLUBS)],
+    ])
+    assert round.get_current_player() is pone
+    round.play_card(pone, Card(10, Suit.CLUBS))
+    round.play_card(dealer, Card(5, Suit.HEARTS))
+    assert round.last_play_points == {"fifteen": 2}
+    assert dealer.score == 2
+    round.play_card(pone, Card(5, Suit.CLUBS))
+    assert round.last_play_points == {"pair": 2}
+    assert pone.score == 2
+    round.play_card(dealer, Card(2, Suit.HEARTS))
+    assert round.last_play_points == {"last card": 1}
+    assert dealer.score == 3
+    assert round.is_round_over()
+
+def test_go_point_and_new_sequence():
+    """Test that the last player to play scores the go and the count restarts."""
+    round, (dealer, pone) = make_round([
+        [Card(10, Suit.HEARTS), Card(9, Suit.HEARTS)],
+        [Card(12, Suit.CLUBS), Card(3, Suit.CLUBS)],
+    ])
+    round.play_card(pone, Card(12, Suit.CLUBS))
+    round.play_card(dealer, Card(10, Suit.HEARTS))
+    round.play_card(pone, Card(3, Suit.CLUBS))
+    # Count is 23: the dealer's 9 doesn't fit
+    assert not round.player_says_go(dealer)
+    assert round.player_says_go(pone)
+    assert round.last_play_points == {"go": 1}
+    assert pone.score == 1
+    assert round.board.play_count == 0
+    assert round.get_current_player() is dealer
+    round.play_card(dealer, Card(9, Suit.HEARTS))
+    assert round.last_play_points == {"last card": 1}
+    assert dealer.score == 1
+
+def test_thirty_one_passes_the_lead():
+    """Test that after 31 the count restarts with the next player."""
+    round, (dealer, pone) = make_round([
+        [Card(10, Suit.HEARTS), Card(1, Suit.HEARTS)],
+        [Card(12, Suit.CLUBS), Card(11, Suit.CLUBS), Card(4, Suit.CLUBS)],
+    ])
+    round.play_card(pone, Card(12, Suit.CLUBS))
+    round.play_card(dealer, Card(10, Suit.HEARTS))
+    round.play_card(pone, Card(11, Suit.CLUBS))
+    round.play_card(dealer, Card(1, Suit.HEARTS))
+    assert round.last_play_points == {"thirty-one": 2}
+    assert dealer.score == 2
+    assert round.board.play_count == 0
+    assert round.get_current_player() is pone
+
+def play_out(round, rng):
+    """Apply random legal moves until the round is over; return the moves."""
+    from src.cribbage.moves import discard_move, go_move, play_move
+    moves = []
+    for index, player in enumerate(round.players):
+        move = discard_move(index, rng.sample(player.get_playable_cards(), 2))
+        round.apply(move)
+        moves.append(move)
+    while not round.is_round_over():
+        index = round.current_player_index
+        limit = 31 - round.board.play_count
+        valid = [card for card in round.players[index].get_playable_cards() if card.value <= limit]
+        move = play_move(index, rng.choice(valid)) if valid else go_move(index)
+        round.apply(move)
+        moves.append(move)
+    return moves
+
+def test_apply_and_undo_restore_state_exactly():
+    """Test that undoing every applied move walks back through the same states."""
+    import random
+    rng = random.Random(4)
+    for _ in range(20):
+        players = [Player("Dealer"), Player("Pone")]
+        round = Round(players, dealer_index=0, rng=rng)
+        round.start()
+        states = [round.snapshot()]
+        moves = play_out(round, rng)
+        for _ in moves:
+            round.undo()
+        assert round.snapshot() == states[0]
+        # Replay to collect the state after every move
+        for move in moves:
+            round.apply(move)
+            states.append(round.snapshot())
+        for expected in reversed(states[:-1]):
+            round.undo()
+            assert round.snapshot() == expected
+        assert players[0].get_playable_cards() == players[0].hand.get_cards()
+
+def test_illegal_move_leaves_state_unchanged():
+    """Test that an illegal move raises and can't be undone."""
+    import pytest
+    from src.cribbage.moves import discard_move, go_move, play_move
+    round, (dealer, pone) = make_round([
+        [Card(5, Suit.HEARTS), Card(2, Suit.HEARTS)],
+        [Card(10, Suit.CLUBS), Card(5, Suit.CLUBS)],
+    ])
+    state = round.snapshot()
+    with pytest.raises(ValueError):
+        round.apply(play_move(0, Card(5, Suit.HEARTS)))  # Not the dealer's turn
+    with pytest.raises(ValueError):
+        round.apply(go_move(0))
+    with pytest.raises(ValueError):
+        round.apply(discard_move(1, [Card(10, Suit.CLUBS)]))  # Must discard two
+    assert round.snapshot() == state
+    with pytest.raises(ValueError):
+        round.undo()
+
+def test_apply_rejects_moves_the_player_cannot_make():
+    """Test that unheld cards, go's with a legal play and empty plays are rejected."""
+    import pytest
+    from src.cribbage.moves import PLAY, go_move, play_move
+    round, (dealer, pone) = make_round([
+        [Card(5, Suit.HEARTS), Card(2, Suit.HEARTS)],
+        [Card(10, Suit.CLUBS), Card(5, Suit.CLUBS)],
+    ])
+    state = round.snapshot()
+    with pytest.raises(ValueError):
+        round.apply(play_move(1, Card(13, Suit.SPADES)))  # Not in the pone's hand
+    with pytest.raises(ValueError):
+        round.apply(go_move(1))  # The pone can play
+    with pytest.raises(ValueError):
+        round.apply((PLAY, 1, 0))  # No card
+    assert round.snapshot() == state
+    assert round.board.play_area == []
+    assert round.play_card(pone, Card(13, Suit.SPADES)) == (-1, False)
+
+def test_apply_rejects_plays_before_every_discard():
+    """Test that the pone can't play while the dealer still has cards to throw."""
+    import random
+    import pytest
+    from src.cribbage.moves import PLAY, legal_moves, play_move
+    players = [Player("Dealer"), Player("Pone")]
+    round = Round(players, dealer_index=0, rng=random.Random(3))
+    round.start()
+    dealer, pone = players
+    round.apply(legal_moves(round, pone)[0])
+    assert legal_moves(round, pone) == ()
+    card = pone.hand.get_unplayed_cards()[0]
+    with pytest.raises(ValueError):
+        round.apply(play_move(1, card))
+    assert len(dealer.hand.get_unplayed_cards()) == 6
+    assert round.board.play_count == 0
+
+    round.apply(legal_moves(round, dealer)[0])
+    assert all(move[0] == PLAY for move in legal_moves(round, pone))
+    round.apply(play_move(1, card))
+    assert round.board.play_count == card.value
+
+def test_restore_snapshot():
+    """Test that a snapshot can be restored after several moves."""
+    from src.cribbage.moves import play_move
+    round, (dealer, pone) = make_round([
+        [Card(5, Suit.HEARTS), Card(2, Suit.HEARTS)],
+        [Card(10, Suit.CLUBS), Card(5, Suit.CLUBS)],
+    ])
+    start = round.snapshot()
+    round.apply(play_move(1, Card(10, Suit.CLUBS)))
+    round.apply(play_move(0, Card(5, Suit.HEARTS)))
+    middle = round.snapshot()
+    assert dealer.score == 2
+    round.restore(start)
+    assert dealer.score == 0
+    assert round.board.play_area == []
+    assert round.get_current_player() is pone
+    assert pone.get_playable_cards() == [Card(10, Suit.CLUBS), Card(5, Suit.CLUBS)]
+    round.restore(middle)
+    assert dealer.score == 2
+    assert round.board.play_count == 15
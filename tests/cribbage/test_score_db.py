@@ -0,0 +1,89 @@
+from itertools import combinations
+import pytest
+from src.cribbage.cards import Card, Suit
+from src.cribbage.scorer import Scorer
+from src.cribbage import score_db
+from src.cribbage.score_db import (
+    ScoreDatabase, entry_index, hand_index,
+    ENTRY_COUNT, HAND_COUNT, STARTERS_PER_HAND,
+)
+
+# Highest card code covered by the partial databases built in these tests
+HIGH = 8
+
+def build_partial_database(path):
+    """Write a database where only hands of cards 0..HIGH are filled in."""
+    with open(path, "wb") as f:
+        f.write(score_db._HEADER.pack(score_db.MAGIC, score_db.VERSION, ENTRY_COUNT))
+        f.truncate(score_db._HEADER.size + 2 * ENTRY_COUNT)
+    with open(path, "r+b") as f:
+        for high in range(3, HIGH + 1):
+            offset, hand_scores, crib_scores = score_db._score_block(high)
+            f.seek(score_db._HEADER.size + offset)
+            f.write(hand_scores)
+            f.seek(score_db._HEADER.size + ENTRY_COUNT + offset)
+            f.write(crib_scores)
+
+def test_hand_index_is_dense():
+    """Test that hand indices enumerate all 4-card hands without gaps."""
+    indices = {hand_index(codes) for codes in combinations(range(20), 4)}
+    assert indices == set(range(len(indices)))
+    assert hand_index((48, 49, 50, 51)) == HAND_COUNT - 1
+
+def test_entry_index_covers_all_starters():
+    """Test that the 48 starters of a hand map to consecutive entries."""
+    codes = (3, 17, 30, 51)
+    entries = [entry_index(codes, s) for s in range(52) if s not in codes]
+    base = hand_index(codes) * STARTERS_PER_HAND
+    assert entries == list(range(base, base + STARTERS_PER_HAND))
+
+def test_lookup_matches_score_hand(tmp_path):
+    """Test that database lookups match score_hand in hand and crib mode."""
+    path = tmp_path / "scores.db"
+    build_partial_database(path)
+    database = ScoreDatabase(str(path))
+    try:
+        for codes in combinations(range(HIGH + 1), 4):
+            hand = [Card.from_code(code) for code in codes]
+            for starter_code in (0, 9, 10, 23, 24, 51):
+                if starter_code in codes:
+                    continue
+                starter = Card.from_code(starter_code)
+                assert database.lookup(hand, starter) == Scorer.score_hand(hand, starter)
+                assert database.lookup(hand, starter, is_crib=True) == \
+                    Scorer.score_hand(hand, starter, is_crib=True)
+    finally:
+        database.close()
+
+def test_scorer_uses_database(tmp_path):
+    """Test that score_hand answers from a loaded database."""
+    path = tmp_path / "scores.db"
+    build_partial_database(path)
+    # 4-card flush A-4 of hearts: 4 points as a hand, none as a crib
+    hand = [Card(rank, Suit.HEARTS) for rank in range(1, 5)]
+    starter = Card(9, Suit.SPADES)
+    expected = Scorer.score_hand(hand, starter), Scorer.score_hand(hand, starter, is_crib=True)
+
+    Scorer.load_database(str(path))
+    try:
+        assert (Scorer.score_hand(hand, starter),
+                Scorer.score_hand(hand, starter, is_crib=True)) == expected
+        with pytest.raises(ValueError):
+            Scorer.score_hand(hand[:3], starter)
+    finally:
+        Scorer.unload_database()
+
+def test_rejects_invalid_files(tmp_path):
+    """Test that files with a bad header or size are rejected."""
+    path = tmp_path / "bad.db"
+    path.write_bytes(b"not a database")
+    with pytest.raises(ValueError):
+        ScoreDatabase(str(path))
+
+    path.write_bytes(score_db._HEADER.pack(score_db.MAGIC, score_db.VERSION + 1, ENTRY_COUNT))
+    with pytest.raises(ValueError):
+        ScoreDatabase(str(path))
+
+    path.write_bytes(score_db._HEADER.pack(score_db.MAGIC, score_db.VERSION, ENTRY_COUNT))
+    with pytest.raises(ValueError):
+        ScoreDatabase(str(path))
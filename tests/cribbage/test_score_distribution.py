@@ -0,0 +1,21 @@
+import pytest
+from math import comb
+from src.cribbage.util.score_distribution import (IMPOSSIBLE_SCORES, format_report, mean_and_variance,
+                                                  score_distribution)
+
+def test_exact_distribution():
+    """Test the distributions against the well-known counts."""
+    hand, crib = score_distribution(processes=1)
+    total = comb(52, 4) * 48
+    assert hand.sum() == total and crib.sum() == total
+    for score in IMPOSSIBLE_SCORES:
+        assert hand[score] == 0 and crib[score] == 0
+    assert hand[0] == 1009008
+    assert hand[28] == 76 and hand[29] == 4
+    assert crib[29] == 4
+    mean, variance = mean_and_variance(hand)
+    assert mean == pytest.approx(4.7692, abs=1e-4)
+    assert variance == pytest.approx(9.7684, abs=1e-4)
+    # Cribs score less only by losing 4-card flushes
+    assert mean_and_variance(crib)[0] < mean
+    assert "Impossible scores (19: 0, 25: 0, 26: 0, 27: 0)" in format_report("Hand", hand)
@@ -200,4 +200,130 @@ def test_complex_combinations():
     hand = [Card(5, Suit.HEARTS), Card(5, Suit.CLUBS), 
             Card(6, Suit.DIAMONDS), Card(7, Suit.SPADES)]
     starter = Card(8, Suit.HEARTS)
-    assert Scorer.score_hand(hand, starter) == 12  # 2 + 2 + 3 
\ No newline at end of file
+    assert Scorer.score_hand(hand, starter) == 12  # 2 + 2 + 3 
+
+def test_rank_table_matches_enumeration():
+    """Test that the rank table agrees with the enumerating find_* methods."""
+    from src.cribbage.scorer import _RANK_TABLE
+    suits = list(Suit)
+    five_card_keys = [key for key in _RANK_TABLE if key >= 1 << 16]
+    assert len(five_card_keys) == 6175
+    for key, points in _RANK_TABLE.items():
+        ranks = []
+        while key:
+            ranks.insert(0, key & 0xF)
+            key >>= 4
+        # Give repeated ranks distinct suits
+        cards = [Card(rank, suits[ranks[:i].count(rank)]) for i, rank in enumerate(ranks)]
+        runs = Scorer.find_runs(cards)
+        expected = (len(Scorer.find_fifteens(cards)) * 2
+                    + len(Scorer.find_pairs(cards)) * 2
+                    + (len(runs) * len(runs[0]) if runs else 0))
+        assert points == expected
+
+def test_count_methods_match_find_methods():
+    """Test that the count-only methods agree with the enumerating ones."""
+    import random
+    rng = random.Random(0)
+    deck = [Card(rank, suit) for suit in Suit for rank in range(1, 14)]
+    for _ in range(2000):
+        cards = rng.sample(deck, 5)
+        assert Scorer.count_fifteens(cards) == len(Scorer.find_fifteens(cards))
+        assert Scorer.count_pairs(cards) == len(Scorer.find_pairs(cards))
+        runs = Scorer.find_runs(cards)
+        expected = (len(runs[0]), len(runs)) if runs else (0, 0)
+        assert Scorer.count_runs(cards) == expected
+
+def test_count_runs_double_run():
+    """Test that a double-double run reports its length and multiplicity."""
+    cards = [Card(3, Suit.HEARTS), Card(4, Suit.HEARTS), Card(5, Suit.HEARTS),
+             Card(4, Suit.DIAMONDS), Card(5, Suit.DIAMONDS)]
+    assert Scorer.count_runs(cards) == (3, 4)
+    assert Scorer.count_fifteens(cards) == 0
+    assert Scorer.count_pairs(cards) == 2
+
+def test_count_runs_rejects_more_than_five_cards():
+    """Test that six cards, which can hold two separate runs, are rejected."""
+    cards = [Card(rank, Suit.CLUBS) for rank in (1, 2, 3, 7, 8, 9)]
+    with pytest.raises(ValueError):
+        Scorer.count_runs(cards)
+
+def test_score_hands_batch_matches_score_hand():
+    """Test that batch scoring agrees with score_hand row by row."""
+    import numpy as np
+    rng = np.random.default_rng(0)
+    codes = np.argsort(rng.random((3000, 52)), axis=1)[:, :5]
+    # Include the best hand and a crib flush
+    codes[0] = [4, 17, 30, 49, 43]
+    codes[1] = [0, 1, 2, 3, 12]
+    for is_crib in (False, True):
+        scores = Scorer.score_hands_batch(codes, is_crib)
+        for row, score in zip(codes, scores):
+            cards = [Card.from_code(int(code)) for code in row]
+            assert score == Scorer.score_hand(cards[:4], cards[4], is_crib)
+    assert Scorer.score_hands_batch(codes[:1])[0] == 29
+
+def test_score_hands_batch_validation():
+    """Test that batch scoring rejects malformed input."""
+    import numpy as np
+    with pytest.raises(ValueError):
+        Scorer.score_hands_batch(np.zeros((2, 4), dtype=int))
+    with pytest.raises(ValueError):
+        Scorer.score_hands_batch(np.array([[0, 1, 2, 3, 52]]))
+    with pytest.raises(ValueError):
+        Scorer.score_hands_batch(np.array([[0, 1, 2, 3, 3]]))
+    assert len(Scorer.score_hands_batch(np.zeros((0, 5), dtype=int))) == 0
+
+def test_score_against_all_starters():
+    """Test that scoring against every starter matches score_hand per starter."""
+    import random
+    from src.cribbage.cards import Deck
+    rng = random.Random(7)
+    for _ in range(100):
+        dealt = rng.sample(Deck().cards, 6)
+        hand, discard = dealt[:4], dealt[4:]
+        starters = [card for card in Deck() if card not in dealt]
+        for is_crib in (False, True):
+            scores = Scorer.score_against_all_starters(hand, is_crib, excluded=discard)
+            assert scores == [Scorer.score_hand(hand, starter, is_crib) for starter in starters]
+    # A flush with every starter, and nobs with the jack's suit
+    hand = [Card(rank, Suit.HEARTS) for rank in (2, 4, 6, 11)]
+    histogram = Scorer.score_against_all_starters(hand, histogram=True)
+    assert sum(histogram.values()) == 48
+    assert len(Scorer.score_against_all_starters(hand)) == 48
+    with pytest.raises(ValueError):
+        Scorer.score_against_all_starters(hand[:3])
+
+def test_score_against_all_starters_rejects_bad_exclusions():
+    """Test that repeated excluded cards, or excluded cards from the hand, raise ValueError."""
+    hand = [Card(rank, Suit.HEARTS) for rank in (2, 4, 6, 11)]
+    other = Card(5, Suit.CLUBS)
+    with pytest.raises(ValueError):
+        Scorer.score_against_all_starters(hand, excluded=[other, other, other])
+    with pytest.raises(ValueError):
+        Scorer.score_against_all_starters(hand, excluded=[hand[0]])
+    assert len(Scorer.score_against_all_starters(hand, excluded=[other])) == 47
+
+def test_breakdown_matches_score_hand():
+    """Test that a breakdown's total and combinations agree with score_hand and the find methods."""
+    import random
+    from src.cribbage.cards import Deck
+    rng = random.Random(8)
+    for _ in range(500):
+        cards = rng.sample(Deck().cards, 5)
+        hand, starter = cards[:4], cards[4]
+        for is_crib in (False, True):
+            breakdown = Scorer.breakdown(hand, starter, is_crib)
+            assert breakdown.total == Scorer.score_hand(hand, starter, is_crib)
+            assert sum(breakdown.points.values()) == breakdown.total
+        assert len(breakdown.fifteen_combos) == breakdown.fifteens
+        assert len(breakdown.pair_combos) == breakdown.pairs
+        assert len(breakdown.run_combos) == breakdown.runs
+        assert all(len(run) == breakdown.run_length for run in breakdown.run_combos)
+
+    hand = [Card(5, Suit.HEARTS), Card(5, Suit.DIAMONDS), Card(5, Suit.CLUBS), Card(11, Suit.SPADES)]
+    breakdown = Scorer.breakdown(hand, Card(5, Suit.SPADES))
+    assert breakdown.points == {"fifteens": 16, "pairs": 12, "runs": 0, "flush": 0, "nobs": 1}
+    assert breakdown.nobs_card == Card(11, Suit.SPADES)
+    with pytest.raises(ValueError):
+        Scorer.breakdown(hand[:3], Card(5, Suit.SPADES))
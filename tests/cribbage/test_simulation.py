@@ -0,0 +1,126 @@
+import random
+from src.cribbage.game import Game
+from src.cribbage.player import Player
+from src.cribbage.simulation import SimulationResults, play_game, simulate_games
+from src.cribbage.strategy import RandomStrategy
+
+def test_simulate_games_is_quiet_and_complete(capsys):
+    """Test that quiet simulation prints nothing and accounts for every game."""
+    results = simulate_games(50, ["Alice", "Bob"], seed=1)
+    assert capsys.readouterr().out == ""
+    assert results.games == 50
+    assert sum(results.wins) == 50
+    assert sum(results.margins.values()) == 50
+    assert results.games_per_second > 0
+    for totals in results.points_by_category:
+        assert set(totals) == {"pegging", "hand", "crib"}
+
+def test_simulate_games_is_reproducible():
+    """Test that the same seed gives the same results."""
+    first = simulate_games(20, ["Alice", "Bob", "Charlie"], seed=7)
+    second = simulate_games(20, ["Alice", "Bob", "Charlie"], seed=7)
+    assert first.wins == second.wins
+    assert first.margins == second.margins
+    assert first.points_by_category == second.points_by_category
+
+def test_game_stops_at_121():
+    """Test that exactly one player reaches 121 and category points add up."""
+    rng = random.Random(3)
+    for _ in range(20):
+        players = [Player("Alice"), Player("Bob")]
+        game = Game(players, rng)
+        game.start()
+        play_game(game, [RandomStrategy(), RandomStrategy()])
+        assert sum(player.score >= 121 for player in players) == 1
+        for player in players:
+            assert sum(player.points_by_category.values()) == player.score
+
+def test_merge_results():
+    """Test that merged results add up."""
+    first = simulate_games(10, ["Alice", "Bob"], seed=1)
+    second = simulate_games(15, ["Alice", "Bob"], seed=2)
+    merged = SimulationResults(["Alice", "Bob"])
+    merged.merge(first)
+    merged.merge(second)
+    assert merged.games == 25
+    assert merged.wins == [a + b for a, b in zip(first.wins, second.wins)]
+    assert merged.points_by_category[0]["hand"] == \
+        first.points_by_category[0]["hand"] + second.points_by_category[0]["hand"]
+    assert "25 games" in str(merged)
+
+def test_parallel_results_match_serial():
+    """Test that results don't depend on worker count or chunk size."""
+    serial = simulate_games(30, ["Alice", "Bob"], seed=11)
+    parallel = simulate_games(30, ["Alice", "Bob"], seed=11, processes=2, chunk_size=7)
+    assert parallel.seed == serial.seed == 11
+    assert parallel.games == 30
+    assert parallel.wins == serial.wins
+    assert parallel.margins == serial.margins
+    assert parallel.points_by_category == serial.points_by_category
+
+def test_replay_single_game():
+    """Test that any game of a run can be replayed from the seed and its index."""
+    from src.cribbage.simulation import play_seeded_game
+    strategies = [RandomStrategy(), RandomStrategy()]
+    results = simulate_games(5, ["Alice", "Bob"], seed=5)
+    games = [play_seeded_game([Player("Alice"), Player("Bob")], 5, index, strategies)
+             for index in range(5)]
+    replayed = SimulationResults(["Alice", "Bob"])
+    for game in reversed(games):
+        replayed.record(game)
+    assert replayed.wins == results.wins
+    assert replayed.points_by_category == results.points_by_category
+
+    again = play_seeded_game([Player("Alice"), Player("Bob")], 5, 3, strategies)
+    assert [p.score for p in again.players] == [p.score for p in games[3].players]
+
+def test_traced_replay_matches(capsys):
+    """Test that the traced replay of a game ends with the same winner."""
+    from src.cribbage.simulation import play_seeded_game, simulate_game
+    game = play_seeded_game([Player("Alice"), Player("Bob")], 9, 2, [RandomStrategy(), RandomStrategy()])
+    simulate_game(["Alice", "Bob"], seed=9, game_index=2)
+    winner = game.get_winner()
+    assert capsys.readouterr().out.endswith(f"{winner.name} wins with {winner.score} points!\n")
+
+def test_batched_games_match_serial():
+    """Test that lockstep batches give the same results as playing games one by one."""
+    from src.cribbage.simulation import simulate_games_batched
+    serial = simulate_games(40, ["Alice", "Bob"], seed=6)
+    batched = simulate_games_batched(40, ["Alice", "Bob"], seed=6, batch_size=16)
+    assert batched.games == 40
+    assert batched.wins == serial.wins
+    assert batched.margins == serial.margins
+    assert batched.points_by_category == serial.points_by_category
+
+def test_batch_strategy_sees_many_games():
+    """Test that a batch strategy is asked about many games in each call."""
+    from src.cribbage.simulation import simulate_games_batched
+    from src.cribbage.strategy import BatchedStrategy
+
+    class CountingStrategy(BatchedStrategy):
+        def __init__(self):
+            super().__init__(RandomStrategy())
+            self.batch_sizes = []
+
+        def choose_plays(self, requests):
+            self.batch_sizes.append(len(requests))
+            return super().choose_plays(requests)
+
+    strategy = CountingStrategy()
+    results = simulate_games_batched(20, ["Alice", "Bob"], seed=1, batch_size=20,
+                                     strategies=[strategy, BatchedStrategy(RandomStrategy())])
+    assert results.games == 20
+    assert max(strategy.batch_sizes) > 1
+
+def test_fast_path_matches_game():
+    """Test that seeded games score identically on the fast path and on Game."""
+    from src.cribbage.simulation import compare_engines
+    assert compare_engines(40, ["Alice", "Bob"], seed=12) == 12
+    compare_engines(20, ["Alice", "Bob", "Charlie"], seed=13)
+
+def test_fast_simulation_results():
+    """Test that simulating on the fast path gives the same results."""
+    fast = simulate_games(30, ["Alice", "Bob"], seed=14, fast=True)
+    slow = simulate_games(30, ["Alice", "Bob"], seed=14)
+    assert fast.wins == slow.wins
+    assert fast.points_by_category == slow.points_by_category
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+from src.cribbage.board import Board
+from src.cribbage.cards import Card
+from src.cribbage.game import Game
+from src.cribbage.player import Player
+from src.cribbage.round import Round
+from src.cribbage.vector_env import DISCARD, GO, NUM_ACTIONS, VectorEnv, _play_points
+
+def random_actions(env, rng):
+    """A uniformly random legal action for every game."""
+    legal = env.legal_actions()
+    return np.argmax(rng.random(legal.shape) * legal, axis=1)
+
+def test_play_points_match_board():
+    """Test vectorized pegging points against Board on random sequences."""
+    rng = np.random.default_rng(0)
+    sequences = []
+    expected = []
+    for _ in range(2000):
+        board = Board()
+        cards = [Card.from_code(code) for code in rng.permutation(52)]
+        played = []
+        for card in cards:
+            if board.add_to_play_area(card) == -1 or len(played) == 8:
+                break
+            played.append(card.rank)
+            sequences.append(played + [0] * (8 - len(played)))
+            expected.append(sum(board.last_play_points.values()))
+    sequences = np.array(sequences)
+    lengths = (sequences > 0).sum(axis=1)
+    counts = np.minimum(sequences, 10).sum(axis=1)
+    assert _play_points(sequences, lengths, counts).tolist() == expected
+
+def test_games_match_object_model():
+    """Test that every deal, action and score agrees with Game, Round and Player."""
+    env = VectorEnv(60, seed=1)
+    env.reset()
+    rng = np.random.default_rng(2)
+    mirrors = [None] * env.num_games
+    pending_discards = [[] for _ in range(env.num_games)]
+
+    while not env.done.all():
+        active = np.nonzero(~env.done)[0]
+        for i in active:
+            if env.phase[i] == DISCARD and env.held[i].sum() == 12:
+                # A new deal: set up the same round in the object model
+                game = mirrors[i][0] if mirrors[i] else Game([Player("A"), Player("B")])
+                game.dealer_index = int(env.dealer[i])
+                game.current_round = Round(game.players, game.dealer_index)
+                for player, held in zip(game.players, env.held[i]):
+                    player.clear_hand()
+                    for code in np.nonzero(held)[0]:
+                        player.receive_card(Card.from_code(int(code)))
+                starter = Card.from_code(int(env.starter[i]))
+                game.current_round.board.set_starter_card(starter)
+                for player in game.players:
+                    player.hand.set_starter_card(starter)
+                mirrors[i] = (game, game.current_round)
+
+        # Legal actions agree with the object model's legal moves
+        legal = env.legal_actions()
+        for i in active:
+            game, round = mirrors[i]
+            player = game.players[env.to_move[i]]
+            if env.phase[i] != DISCARD:
+                plays = {card.code for card in player.get_playable_cards()
+                         if round.board.play_count + card.value <= 31}
+                assert set(np.nonzero(legal[i, :52])[0]) == plays
+                assert legal[i, GO] == (not plays)
+                assert round.current_player_index == env.to_move[i]
+
+        actions = random_actions(env, rng)
+        to_move = env.to_move.copy()
+        phase = env.phase.copy()
+        env.step(actions)
+
+        for i in active:
+            game, round = mirrors[i]
+            player = game.players[to_move[i]]
+            if phase[i] == DISCARD:
+                pending_discards[i].append(Card.from_code(int(actions[i])))
+                if len(pending_discards[i]) == 2:
+                    assert game.discard_to_crib(player, pending_discards[i])
+                    pending_discards[i] = []
+            elif actions[i] == GO:
+                game.player_says_go(player)
+            else:
+                assert game.play_card(player, Card.from_code(int(actions[i])))
+            if round.is_round_over() and not game.is_game_over():
+                game.score_hands()
+            assert env.scores[i].tolist() == [p.score for p in game.players]
+            assert env.done[i] == game.is_game_over()
+
+def test_illegal_action_rejected():
+    """Test that stepping with an illegal action raises ValueError."""
+    env = VectorEnv(3, seed=0)
+    env.reset()
+    actions = random_actions(env, np.random.default_rng(0))
+    actions[1] = GO
+    with pytest.raises(ValueError):
+        env.step(actions)
+
+@pytest.mark.parametrize("action", [-1, NUM_ACTIONS, 1000])
+def test_out_of_range_action_rejected(action):
+    """Test that actions outside 0-52 raise ValueError instead of wrapping or indexing past the end."""
+    env = VectorEnv(3, seed=0)
+    env.reset()
+    actions = random_actions(env, np.random.default_rng(0))
+    actions[1] = action
+    with pytest.raises(ValueError):
+        env.step(actions)
+    assert env.phase.tolist() == [DISCARD] * 3
+
+def test_reset_restarts_finished_games():
+    """Test that finished games can be reset individually."""
+    env = VectorEnv(4, seed=3)
+    env.reset()
+    rng = np.random.default_rng(4)
+    while not env.done.all():
+        env.step(random_actions(env, rng))
+    assert (env.scores.max(axis=1) >= 121).all()
+    env.reset(np.array([0, 2]))
+    assert env.done.tolist() == [False, True, False, True]
+    assert env.scores[0].tolist() == [0, 0]
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+import random
+from src.cribbage import win_probability as wp
+from src.cribbage.cards import Deck
+from src.cribbage.strategy import DiscardRequest
+from src.cribbage.win_probability import DealDistributions, build_table, measure_deals
+
+def race_distributions():
+    """Deals in which only the dealer scores, one pegging point."""
+    return DealDistributions(np.array([[0.0], [1.0]]), np.array([1.0]), np.array([1.0]))
+
+def test_deterministic_race():
+    """Test the table when each player scores exactly one point on their deal."""
+    table = build_table(race_distributions())
+    assert table.shape == (121, 121, 2)
+    for score, opponent_score in [(0, 0), (50, 49), (49, 50), (120, 120), (119, 120)]:
+        # Whoever is behind in the race loses it; a tie goes to the dealer
+        assert table[score, opponent_score, 1] == float(score >= opponent_score)
+        assert table[score, opponent_score, 0] == float(score > opponent_score)
+
+def test_measured_table_is_consistent():
+    """Test a table built from simulated deals."""
+    distributions = measure_deals(300, seed=3)
+    assert distributions.pegging.sum() == pytest.approx(1.0)
+    assert distributions.pone_hand.sum() == pytest.approx(1.0)
+    assert distributions.pegging[0, 0] == 0.0
+    table = build_table(distributions)
+    # One player's win is the other's loss
+    assert np.allclose(table[:, :, 1], 1 - table[:, :, 0].T)
+    assert 0.5 < table[0, 0, 1] < 0.65
+    # More points never hurt
+    assert (np.diff(table, axis=0) >= -1e-9).all()
+    assert table[120, 0, 0] == pytest.approx(1.0)
+
+def test_cached_table_is_loaded_lazily(tmp_path, monkeypatch):
+    """Test that win_probability reads the table from the cache on first use."""
+    path = str(tmp_path / "cribbage" / "table.npy")
+    wp.save_table(build_table(race_distributions()), path)
+    monkeypatch.setattr(wp, "DEFAULT_PATH", path)
+    monkeypatch.setattr(wp, "_default_table", None)
+    assert wp.win_probability(100, 90, False) == 1.0
+    assert wp.win_probability(90, 100, True) == 0.0
+    assert wp.win_probability(121, 130, False) == 1.0
+
+    hand = Deck().cards[:6]
+    request = DiscardRequest(1, hand, 2, False, [90, 100], random.Random(0))
+    assert wp.request_win_probability(request) == 1.0
+
+def test_missing_table_is_built_and_saved(tmp_path, monkeypatch):
+    """Test that default_table builds a table from DEFAULT_DEALS deals when none is cached."""
+    path = str(tmp_path / "cribbage" / "table.npy")
+    monkeypatch.setattr(wp, "DEFAULT_PATH", path)
+    monkeypatch.setattr(wp, "DEFAULT_DEALS", 200)
+    monkeypatch.setattr(wp, "_default_table", None)
+    table = wp.default_table()
+    assert np.array_equal(wp.load_table(path), table)
+    assert wp.default_table() is table